@@ -14,9 +14,11 @@
             "stripe_get_customer_by_email",
             "stripe_update_customer",
             "stripe_list_customers",
+            "stripe_get_customer_overview",
             "stripe_get_subscription",
             "stripe_get_subscription_status",
             "stripe_list_subscriptions",
+            "stripe_list_all_subscriptions",
             "stripe_create_subscription",
             "stripe_update_subscription",
             "stripe_cancel_subscription",
@@ -42,10 +44,13 @@
             "stripe_delete_invoice_item",
             "stripe_create_product",
             "stripe_get_product",
+            "stripe_get_products_bulk",
             "stripe_list_products",
             "stripe_update_product",
             "stripe_create_price",
+            "stripe_create_product_with_price",
             "stripe_get_price",
+            "stripe_get_prices_bulk",
             "stripe_list_prices",
             "stripe_update_price",
             "stripe_create_payment_link",
@@ -57,6 +62,7 @@
             "stripe_get_balance",
             "stripe_list_balance_transactions",
             "stripe_list_webhook_endpoints",
+            "stripe_webhook_ingest",
             "stripe_list_payment_methods",
             "stripe_get_payment_method",
             "stripe_detach_payment_method",
@@ -22,61 +22,865 @@
 
 from __future__ import annotations
 
+import asyncio
+import base64
+import binascii
+import functools
+import importlib.util
+import inspect
+import logging
+import operator
 import os
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
 from typing import TYPE_CHECKING, Any
 
+import httpx
 import stripe
 from fastmcp import FastMCP
 
 if TYPE_CHECKING:
     from aden_tools.credentials import CredentialStoreAdapter
 
+logger = logging.getLogger(__name__)
+
+
+class _HTTP2Lib:
+    """The ``httpx`` module, except that ``AsyncClient`` speaks HTTP/2."""
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(httpx, name)
+
+    @staticmethod
+    def AsyncClient(**kwargs: Any) -> httpx.AsyncClient:  # noqa: N802
+        return httpx.AsyncClient(http2=True, **kwargs)
+
+
+class _HTTPXClient(stripe.HTTPXClient):
+    """
+    ``stripe.HTTPXClient`` that can open its connection pool over HTTP/2.
+
+    The SDK builds its one ``httpx.AsyncClient`` from the library it is
+    given, applying ``stripe.verify_ssl_certs`` and the CA bundle itself, so
+    HTTP/2 only changes which client class that library hands out.
+    """
+
+    def __init__(self, http2: bool = False, **kwargs: Any) -> None:
+        # ``_lib`` is private to stripe-python (meant for its own tests), but
+        # it is the only hook into how the AsyncClient is built that keeps
+        # the SDK's TLS settings. Re-check it when bumping the stripe pin.
+        super().__init__(_lib=_HTTP2Lib() if http2 else None, **kwargs)
+
+
+def _http2_enabled() -> bool:
+    """
+    Whether ``STRIPE_HTTP2`` asks for HTTP/2 and the ``h2`` package is present.
+
+    A missing ``h2`` is logged and falls back to HTTP/1.1 rather than
+    failing every request when httpx opens its first connection.
+    """
+    if os.getenv("STRIPE_HTTP2", "").strip().lower() not in {"1", "true", "yes"}:
+        return False
+    if importlib.util.find_spec("h2") is None:
+        logger.warning(
+            "STRIPE_HTTP2 is set but the h2 package is not installed "
+            "(pip install httpx[http2]); using HTTP/1.1"
+        )
+        return False
+    return True
+
+
+_http_client: _HTTPXClient | None = None
+
+
+def _get_http_client() -> _HTTPXClient:
+    """
+    Return the process-wide HTTP client shared by every _StripeClient.
+
+    The client is created lazily on first use. Sharing it keeps one pool of
+    keep-alive connections to api.stripe.com, so calls after the first skip
+    the TCP and TLS handshake. Setting ``STRIPE_HTTP2=1`` opts into HTTP/2,
+    which multiplexes concurrent requests over a single connection and
+    needs the ``h2`` package (``pip install httpx[http2]``).
+    """
+    global _http_client
+    if _http_client is None:
+        _http_client = _HTTPXClient(http2=_http2_enabled())
+    return _http_client
+
+
+def _fields_formatter(fields: tuple[str, ...]) -> Callable[[Any], dict[str, Any]]:
+    """
+    Build a function copying ``fields`` from a Stripe object into a plain dict.
+
+    A single attrgetter fetches every field in one C-level call and
+    ``dict(zip(...))`` builds the result without per-key bytecode, which keeps
+    formatting cheap on 100-row list pages when mapped over ``result.data``.
+
+    ``metadata`` is copied into a plain dict: the SDK's StripeObject carries
+    extra state the MCP serializer would otherwise have to walk.
+    """
+    get = operator.attrgetter(*fields)
+    copy_metadata = "metadata" in fields
+
+    def to_dict(obj: Any) -> dict[str, Any]:
+        result = dict(zip(fields, get(obj), strict=True))
+        if copy_metadata and result["metadata"] is not None:
+            result["metadata"] = dict(result["metadata"])
+        return result
+
+    return to_dict
+
+
+# Attributes copied verbatim from each Stripe object into tool results.
+# Nested values (subscription items, price recurrence, link line items,
+# cards) are added by the _StripeClient._format_* methods.
+
+_CUSTOMER_FIELDS = (
+    "id",
+    "email",
+    "name",
+    "phone",
+    "description",
+    "created",
+    "currency",
+    "delinquent",
+    "metadata",
+)
+_customer_to_dict = _fields_formatter(_CUSTOMER_FIELDS)
+
+_SUBSCRIPTION_FIELDS = (
+    "id",
+    "customer",
+    "status",
+    "current_period_start",
+    "current_period_end",
+    "cancel_at_period_end",
+    "canceled_at",
+    "trial_end",
+    "created",
+    "metadata",
+)
+_subscription_to_dict = _fields_formatter(_SUBSCRIPTION_FIELDS)
+
+_PAYMENT_INTENT_FIELDS = (
+    "id",
+    "amount",
+    "amount_received",
+    "currency",
+    "status",
+    "customer",
+    "description",
+    "receipt_email",
+    "payment_method",
+    "created",
+    "metadata",
+)
+_payment_intent_to_dict = _fields_formatter(_PAYMENT_INTENT_FIELDS)
+
+_CHARGE_FIELDS = (
+    "id",
+    "amount",
+    "amount_captured",
+    "amount_refunded",
+    "currency",
+    "status",
+    "paid",
+    "refunded",
+    "customer",
+    "description",
+    "receipt_email",
+    "receipt_url",
+    "payment_intent",
+    "created",
+    "metadata",
+)
+_charge_to_dict = _fields_formatter(_CHARGE_FIELDS)
+
+_REFUND_FIELDS = (
+    "id",
+    "amount",
+    "currency",
+    "status",
+    "charge",
+    "payment_intent",
+    "reason",
+    "created",
+    "metadata",
+)
+_refund_to_dict = _fields_formatter(_REFUND_FIELDS)
+
+_INVOICE_FIELDS = (
+    "id",
+    "customer",
+    "subscription",
+    "status",
+    "amount_due",
+    "amount_paid",
+    "amount_remaining",
+    "currency",
+    "description",
+    "hosted_invoice_url",
+    "invoice_pdf",
+    "due_date",
+    "created",
+    "period_start",
+    "period_end",
+    "metadata",
+)
+_invoice_to_dict = _fields_formatter(_INVOICE_FIELDS)
+
+_INVOICE_ITEM_FIELDS = (
+    "id",
+    "customer",
+    "invoice",
+    "amount",
+    "currency",
+    "description",
+    "quantity",
+    "created",
+    "metadata",
+)
+_invoice_item_to_dict = _fields_formatter(_INVOICE_ITEM_FIELDS)
+
+_PRODUCT_FIELDS = ("id", "name", "description", "active", "created", "updated", "metadata")
+_product_to_dict = _fields_formatter(_PRODUCT_FIELDS)
+
+_COUPON_FIELDS = (
+    "id",
+    "name",
+    "percent_off",
+    "amount_off",
+    "currency",
+    "duration",
+    "duration_in_months",
+    "max_redemptions",
+    "times_redeemed",
+    "valid",
+    "created",
+    "metadata",
+)
+_coupon_to_dict = _fields_formatter(_COUPON_FIELDS)
+
+_PRICE_FIELDS = (
+    "id",
+    "product",
+    "currency",
+    "unit_amount",
+    "nickname",
+    "active",
+    "type",
+    "created",
+    "metadata",
+)
+_price_to_dict = _fields_formatter(_PRICE_FIELDS)
+
+_PAYMENT_LINK_FIELDS = ("id", "url", "active", "currency", "created", "metadata")
+_payment_link_to_dict = _fields_formatter(_PAYMENT_LINK_FIELDS)
+
+_PAYMENT_METHOD_FIELDS = ("id", "type", "customer", "created", "metadata")
+_payment_method_to_dict = _fields_formatter(_PAYMENT_METHOD_FIELDS)
+
+_CARD_FIELDS = ("brand", "last4", "exp_month", "exp_year", "country")
+_card_to_dict = _fields_formatter(_CARD_FIELDS)
+
+_WEBHOOK_ENDPOINT_FIELDS = ("id", "url", "status", "enabled_events", "created")
+_webhook_endpoint_to_dict = _fields_formatter(_WEBHOOK_ENDPOINT_FIELDS)
+
+_BALANCE_TRANSACTION_FIELDS = (
+    "id",
+    "amount",
+    "currency",
+    "net",
+    "fee",
+    "type",
+    "status",
+    "description",
+    "created",
+)
+_balance_transaction_to_dict = _fields_formatter(_BALANCE_TRANSACTION_FIELDS)
+
+
+def _encode_cursor(kind: str, obj_id: str) -> str:
+    """Encode the last object of a page as an opaque ``next_cursor``."""
+    return base64.urlsafe_b64encode(f"{kind}:{obj_id}".encode()).decode()
+
+
+def _decode_cursor(kind: str, cursor: str) -> str:
+    """
+    Turn a ``starting_after`` value back into a Stripe object ID.
+
+    Accepts either a ``next_cursor`` returned by the matching list call or a
+    raw Stripe ID, which is passed through unchanged.
+    """
+    try:
+        decoded = base64.urlsafe_b64decode(cursor.encode()).decode()
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        return cursor
+    prefix, sep, obj_id = decoded.partition(":")
+    return obj_id if sep and prefix == kind and obj_id else cursor
+
+
+def _create_params(optional: tuple[tuple[str, Any], ...]) -> dict[str, Any]:
+    """
+    Keep the ``(name, value)`` pairs of a create call that were actually given.
+
+    Empty strings count as not given: LLM callers often pass ``""`` for "no
+    value", and Stripe rejects it on create for fields that cannot be unset.
+    Updates keep ``""``, which Stripe reads as "clear this field".
+    """
+    return {k: v for k, v in optional if v is not None and v != ""}
+
+
+def _created_filter(created_after: int | None) -> dict[str, int] | None:
+    """Stripe ``created`` range for objects newer than a Unix timestamp, if given."""
+    return {"gt": created_after} if created_after is not None else None
+
+
+# Active ISO 4217 currency codes, lowercase as Stripe expects them. Checked
+# locally so a typo like "uds" is rejected without a round-trip to Stripe.
+_ISO_4217 = frozenset(
+    """
+    aed afn all amd ang aoa ars aud awg azn bam bbd bdt bgn bhd bif bmd bnd bob bov
+    brl bsd btn bwp byn bzd cad cdf che chf chw clf clp cny cop cou crc cuc cup cve
+    czk djf dkk dop dzd egp ern etb eur fjd fkp gbp gel ghs gip gmd gnf gtq gyd hkd
+    hnl htg huf idr ils inr iqd irr isk jmd jod jpy kes kgs khr kmf kpw krw kwd kyd
+    kzt lak lbp lkr lrd lsl lyd mad mdl mga mkd mmk mnt mop mru mur mvr mwk mxn mxv
+    myr mzn nad ngn nio nok npr nzd omr pab pen pgk php pkr pln pyg qar ron rsd rub
+    rwf sar sbd scr sdg sek sgd shp sle sll sos srd ssp stn svc syp szl thb tjs tmt
+    tnd top try ttd twd tzs uah ugx usd usn uyi uyu uyw uzs ved vef ves vnd vuv wst
+    xaf xcd xcg xof xpf yer zar zmw zwg zwl
+    """.split()
+)
+_CURRENCY_ERROR = {"error": "Currency must be a 3-letter ISO 4217 code (e.g., usd, inr)"}
+
+
+def _require_currency(currency: str | None) -> dict[str, str] | None:
+    """Return the shared currency error unless ``currency`` is a known ISO 4217 code."""
+    if currency and currency.lower() in _ISO_4217:
+        return None
+    return _CURRENCY_ERROR
+
+
+# ID prefix of each Stripe object kind a tool accepts by ID.
+_ID_PREFIXES = {
+    "customer": "cus_",
+    "subscription": "sub_",
+    "subscription_item": "si_",
+    "payment_intent": "pi_",
+    "charge": "ch_",
+    "refund": "re_",
+    "invoice": "in_",
+    "invoice_item": "ii_",
+    "product": "prod_",
+    "price": "price_",
+    "payment_link": "plink_",
+    "payment_method": "pm_",
+}
+
+
+# Validation failures for each kind, built once and shared by every call.
+# Callers return them as-is and must never mutate them.
+_ID_ERRORS = {
+    kind: {"error": f"Invalid {kind}_id. Must start with: {prefix}"}
+    for kind, prefix in _ID_PREFIXES.items()
+}
+
+
+def _require_id(value: str | None, kind: str) -> dict[str, str] | None:
+    """Return an error dict unless ``value`` is an ID of the given Stripe ``kind``."""
+    if value and value.startswith(_ID_PREFIXES[kind]):
+        return None
+    return _ID_ERRORS[kind]
+
+
+# Most rows an auto-paginated list call collects, so one request cannot pull
+# an entire account into memory.
+_AUTO_PAGE_MAX_RESULTS = 1000
+_AUTO_PAGE_LIMIT_ERROR = {
+    "error": f"limit must be between 1 and {_AUTO_PAGE_MAX_RESULTS} with auto_paginate"
+}
+
+
+def _require_auto_page_limit(limit: int, auto_paginate: bool) -> dict[str, str] | None:
+    """Return the shared limit error if an auto-paginated ``limit`` is out of range."""
+    if auto_paginate and not 1 <= limit <= _AUTO_PAGE_MAX_RESULTS:
+        return _AUTO_PAGE_LIMIT_ERROR
+    return None
+
+
+class _TTLCache:
+    """Thread-safe LRU cache whose entries expire ``ttl`` seconds after insertion."""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Any | None:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: float | None = None) -> None:
+        with self._lock:
+            self._data[key] = (time.monotonic() + (self._ttl if ttl is None else ttl), value)
+            self._data.move_to_end(key)
+            while len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key: Hashable) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def pop_matching(self, predicate: Callable[[Hashable], bool]) -> None:
+        """Drop every entry whose key satisfies ``predicate``."""
+        with self._lock:
+            for key in [k for k in self._data if predicate(k)]:
+                del self._data[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+class _TokenBucket:
+    """Token bucket admitting on average ``rate`` acquisitions per second.
+
+    Up to ``rate`` tokens accumulate while idle, so short bursts are admitted
+    immediately; sustained load is paced to ``rate``.
+    """
+
+    def __init__(self, rate: float):
+        self._rate = rate
+        self._tokens = rate
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _try_take(self) -> float:
+        """Take a token if one is available; otherwise return seconds to wait."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self._rate, self._tokens + (now - self._updated) * self._rate)
+            self._updated = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0.0
+            return (1 - self._tokens) / self._rate
+
+    async def acquire(self) -> None:
+        while (delay := self._try_take()) > 0:
+            await asyncio.sleep(delay)
+
 
 class _StripeClient:
-    """Internal client wrapping Stripe API calls via the official stripe library."""
+    """Internal client wrapping Stripe API calls via the official stripe library.
+
+    All methods use the SDK's ``*_async`` services so a slow Stripe round-trip
+    never blocks the MCP server's event loop.
+    """
+
+    # Prices and products change rarely, so reads are served from a
+    # process-wide cache. Entries are stored as (api_key, formatted_object)
+    # so one Stripe account never sees another account's cached objects.
+    _price_cache = _TTLCache(maxsize=1024, ttl=86400)
+    _product_cache = _TTLCache(maxsize=1024, ttl=86400)
+
+    # Other objects can change at any time, but agents often fetch the same
+    # one several times within a task. Retrieves of these kinds are cached
+    # briefly (TTL in seconds per kind), keyed by (api_key, kind, id); writes
+    # through this client and webhook events replace or drop the entry.
+    # Payment intents, charges and refunds are never cached: their status
+    # moves on asynchronously (3DS, processing, pending) and agents poll it.
+    _READ_CACHE_TTLS = {
+        "customer": 30,
+        "subscription": 30,
+        "invoice": 30,
+        "payment_method": 300,
+        "balance": 60,
+    }
+    _read_cache = _TTLCache(maxsize=2048, ttl=30)
+
+    # Pages of catalog lists (products, prices, payment links, coupons), keyed
+    # by (api_key, kind, params). Any catalog write through this client
+    # clears them.
+    _list_cache = _TTLCache(maxsize=256, ttl=300)
+
+    # With STRIPE_PREFETCH_PRICES set, the first client created for an API key
+    # loads all active prices into _price_cache so checkout flows start warm.
+    _PREFETCH_MAX_PRICES = 1000
+    _prefetched_keys: set[str] = set()
+
+    # First item ID of recently seen subscriptions, as (api_key, item_id).
+    # update_subscription needs it to change a price or quantity.
+    _sub_item_cache = _TTLCache(maxsize=4096, ttl=300)
+
+    # Stripe allows 100 requests/s per account in live mode and 25 in test
+    # mode. Every call acquires from a per-key bucket paced just under that,
+    # so bursts are smoothed client-side instead of bouncing off 429s.
+    _RATE_LIMIT_LIVE = 95
+    _RATE_LIMIT_TEST = 23
+    _RATE_LIMIT_RETRIES = 2
+    _rate_limiters: dict[str, _TokenBucket] = {}
+
+    # Cap on requests in flight per API key, across all clients in the
+    # process, so concurrent tool calls cannot exhaust the HTTP pool.
+    # Semaphores and futures belong to the event loop they are used on, so
+    # both maps below are kept per running loop and go away with it.
+    _DEFAULT_MAX_CONCURRENT = 32
+    _concurrency_limits: weakref.WeakKeyDictionary[
+        asyncio.AbstractEventLoop, dict[str, asyncio.Semaphore]
+    ] = weakref.WeakKeyDictionary()
+
+    # Retrieves currently awaiting Stripe, keyed by (api_key, kind, id), so
+    # concurrent callers asking for the same object share one request.
+    _inflight: weakref.WeakKeyDictionary[
+        asyncio.AbstractEventLoop,
+        dict[tuple[str, str, str | None], asyncio.Future[dict[str, Any]]],
+    ] = weakref.WeakKeyDictionary()
+
+    # Connection errors, 409s and 5xx responses are retried by the SDK. POSTs
+    # always carry an Idempotency-Key, so a retry never creates a duplicate.
+    _MAX_NETWORK_RETRIES = 2
+
+    # Largest page Stripe returns from a list endpoint.
+    _MAX_PAGE_SIZE = 100
+
+    # Upper bound on requests a single aggregate call fans out at once.
+    _MAX_FANOUT = 16
 
     def __init__(self, api_key: str):
-        self._client = stripe.StripeClient(api_key)
+        self._api_key = api_key
+        self._client = stripe.StripeClient(
+            api_key,
+            http_client=_get_http_client(),
+            max_network_retries=self._MAX_NETWORK_RETRIES,
+        )
+        self._prefetch: asyncio.Task[None] | None = None
+        if os.getenv("STRIPE_PREFETCH_PRICES") and api_key not in self._prefetched_keys:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                pass
+            else:
+                self._prefetched_keys.add(api_key)
+                self._prefetch = loop.create_task(self._prefetch_prices())
+
+    async def _prefetch_prices(self) -> None:
+        """Load every active price into the price cache in the background."""
+        try:
+            await self._auto_page(
+                self._stripe().prices.list_async,
+                {"active": True},
+                lambda p: self._cache_set(self._price_cache, self._format_price(p)),
+                self._PREFETCH_MAX_PRICES,
+            )
+        except stripe.StripeError as e:
+            # Let the next client for this key try again.
+            self._prefetched_keys.discard(self._api_key)
+            logger.warning("Stripe price prefetch failed: %s", e)
 
     def _stripe(self) -> stripe.StripeClient:
         return self._client
 
+    def _limiter(self) -> _TokenBucket:
+        limiter = self._rate_limiters.get(self._api_key)
+        if limiter is None:
+            test_mode = self._api_key.startswith(("sk_test_", "rk_test_"))
+            rate = self._RATE_LIMIT_TEST if test_mode else self._RATE_LIMIT_LIVE
+            limiter = self._rate_limiters.setdefault(self._api_key, _TokenBucket(rate))
+        return limiter
+
+    def _concurrency(self) -> asyncio.Semaphore:
+        limits = self._concurrency_limits.setdefault(asyncio.get_running_loop(), {})
+        sem = limits.get(self._api_key)
+        if sem is None:
+            try:
+                limit = int(os.getenv("STRIPE_MAX_CONCURRENT", ""))
+            except ValueError:
+                limit = self._DEFAULT_MAX_CONCURRENT
+            sem = limits.setdefault(self._api_key, asyncio.Semaphore(max(limit, 1)))
+        return sem
+
+    async def _call(
+        self,
+        method: Callable[..., Awaitable[Any]],
+        *args: Any,
+        idempotency_key: str | None = None,
+    ) -> Any:
+        """Invoke an SDK method once the rate and concurrency limiters admit it.
+
+        ``idempotency_key`` is sent as the request's Idempotency-Key, so a
+        caller repeating a create after a lost response gets the original
+        object back instead of a duplicate. Without one the SDK generates a
+        fresh key per call, which still makes its own network retries safe.
+
+        A 429 is retried up to ``_RATE_LIMIT_RETRIES`` times, sleeping for the
+        ``Retry-After`` interval Stripe sends (one second if absent), unless
+        Stripe marks the request as not retryable.
+        """
+        if idempotency_key:
+            args = (*args, {"idempotency_key": idempotency_key})
+        for attempt in range(self._RATE_LIMIT_RETRIES + 1):
+            await self._limiter().acquire()
+            try:
+                async with self._concurrency():
+                    return await method(*args)
+            except stripe.RateLimitError as e:
+                headers = e.headers or {}
+                if (
+                    attempt == self._RATE_LIMIT_RETRIES
+                    or headers.get("stripe-should-retry") == "false"
+                ):
+                    raise
+                try:
+                    delay = float(headers.get("retry-after", 1))
+                except ValueError:
+                    delay = 1.0
+                await asyncio.sleep(delay)
+
+    async def _retrieve(
+        self,
+        kind: str,
+        formatter: Callable[[Any], dict[str, Any]],
+        method: Callable[..., Awaitable[Any]],
+        obj_id: str | None,
+        *args: Any,
+    ) -> dict[str, Any]:
+        """Retrieve and format ``obj_id``, coalescing concurrent identical requests.
+
+        The first caller starts the request; callers arriving while it is in
+        flight await the same result (or exception) instead of issuing their own.
+        Kinds in ``_READ_CACHE_TTLS`` are then served from ``_read_cache``
+        until the entry expires. Singleton objects such as the balance have no
+        ID: pass ``obj_id=None`` and ``method`` is called without one.
+        """
+        key = (self._api_key, kind, obj_id)
+        ttl = self._READ_CACHE_TTLS.get(kind)
+        if ttl is not None and (cached := self._read_cache.get(key)) is not None:
+            return cached
+        inflight = self._inflight.setdefault(asyncio.get_running_loop(), {})
+        fetch = inflight.get(key)
+        if fetch is None:
+            call_args = args if obj_id is None else (obj_id, *args)
+            fetch = asyncio.ensure_future(self._fetch(formatter, method, *call_args))
+            inflight[key] = fetch
+            fetch.add_done_callback(lambda _: inflight.pop(key, None))
+        # Shield so one caller being cancelled does not cancel the shared fetch.
+        result = await asyncio.shield(fetch)
+        if ttl is not None:
+            self._read_cache.set(key, result, ttl)
+        return result
+
+    async def _fetch(
+        self,
+        formatter: Callable[[Any], dict[str, Any]],
+        method: Callable[..., Awaitable[Any]],
+        *args: Any,
+    ) -> dict[str, Any]:
+        return formatter(await self._call(method, *args))
+
+    def _remember(self, kind: str, obj: dict[str, Any]) -> dict[str, Any]:
+        """Replace the read-cache entry for ``obj`` with the object a write returned."""
+        self._read_cache.set((self._api_key, kind, obj["id"]), obj, self._READ_CACHE_TTLS[kind])
+        return obj
+
+    def _forget(self, kind: str, obj_id: str | None) -> None:
+        """Drop the read-cache entry for an object a write changed indirectly."""
+        if obj_id:
+            self._read_cache.pop((self._api_key, kind, obj_id))
+
+    async def _cached_page(
+        self,
+        kind: str,
+        method: Callable[..., Awaitable[Any]],
+        params: dict[str, Any],
+        format_rows: Callable[[list[Any]], list[dict[str, Any]]],
+    ) -> dict[str, Any]:
+        """Fetch one catalog list page, serving repeats from ``_list_cache``."""
+        key = (
+            self._api_key,
+            kind,
+            tuple((k, tuple(v) if isinstance(v, list) else v) for k, v in sorted(params.items())),
+        )
+        page = self._list_cache.get(key)
+        if page is None:
+            result = await self._call(method, params)
+            page = self._page(kind, result, format_rows(result.data))
+            self._list_cache.set(key, page)
+        return page
+
+    @classmethod
+    def invalidate_price(cls, price_id: str) -> None:
+        """Drop a cached price, e.g. when a ``price.updated`` webhook arrives."""
+        cls._price_cache.pop(price_id)
+        cls._list_cache.clear()
+
+    @classmethod
+    def invalidate_product(cls, product_id: str) -> None:
+        """Drop a cached product, e.g. when a ``product.updated`` webhook arrives."""
+        cls._product_cache.pop(product_id)
+        cls._list_cache.clear()
+
+    @classmethod
+    def invalidate(cls, event: stripe.Event) -> bool:
+        """Drop the cached copies of the object a webhook event reports on.
+
+        Returns True if the event type maps to one of the caches.
+        """
+        prefix = event.type.rpartition(".")[0]
+        obj_id = event.data.object.get("id")
+        cache = {
+            "price": cls._price_cache,
+            "product": cls._product_cache,
+            "customer.subscription": cls._sub_item_cache,
+        }.get(prefix)
+        if cache is not None:
+            cache.pop(obj_id)
+            if cache is not cls._sub_item_cache:
+                cls._list_cache.clear()
+        kind = "subscription" if prefix == "customer.subscription" else prefix
+        if kind in cls._READ_CACHE_TTLS:
+            # Events carry no API key, so the object is dropped for every key.
+            # Balance events have no object ID and drop every cached balance.
+            cls._read_cache.pop_matching(
+                lambda key: key[1] == kind and (obj_id is None or key[2] == obj_id)
+            )
+        return cache is not None or kind in cls._READ_CACHE_TTLS
+
+    def _cache_get(self, cache: _TTLCache, obj_id: str) -> dict[str, Any] | None:
+        entry = cache.get(obj_id)
+        if entry is None or entry[0] != self._api_key:
+            return None
+        return entry[1]
+
+    def _cache_set(self, cache: _TTLCache, obj: dict[str, Any]) -> dict[str, Any]:
+        cache.set(obj["id"], (self._api_key, obj))
+        return obj
+
+    def _paged_params(
+        self, kind: str, limit: int, starting_after: str | None, **filters: Any
+    ) -> dict[str, Any]:
+        """Build list params: clamped limit, decoded cursor, and the filters that are set.
+
+        ``None`` and ``""`` filters are both unset; Stripe rejects an empty filter.
+        """
+        params = {k: v for k, v in filters.items() if v is not None and v != ""}
+        params["limit"] = limit if limit < self._MAX_PAGE_SIZE else self._MAX_PAGE_SIZE
+        if starting_after:
+            params["starting_after"] = _decode_cursor(kind, starting_after)
+        return params
+
+    def _page(self, kind: str, result: Any, rows: list[dict[str, Any]]) -> dict[str, Any]:
+        """Shape one list page, adding an opaque ``next_cursor`` when more remain."""
+        next_cursor = _encode_cursor(kind, rows[-1]["id"]) if result.has_more and rows else None
+        return {"has_more": result.has_more, kind: rows, "next_cursor": next_cursor}
+
+    async def _auto_page(
+        self,
+        method: Callable[..., Awaitable[Any]],
+        params: dict[str, Any],
+        formatter: Callable[[Any], dict[str, Any]],
+        max_results: int,
+    ) -> tuple[list[dict[str, Any]], bool]:
+        """Fetch up to ``max_results`` rows, following ``starting_after`` page by page.
+
+        Every page goes through ``_call``, so long scans are paced by the rate
+        and concurrency limiters and a 429 mid-scan is retried rather than
+        discarding the rows already collected.
+
+        Returns the formatted rows and whether more rows remained past
+        ``max_results``.
+        """
+        params = dict(params)
+        rows: list[dict[str, Any]] = []
+        has_more = False
+        while len(rows) < max_results:
+            remaining = max_results - len(rows)
+            page = await self._call(
+                method, {**params, "limit": min(remaining, self._MAX_PAGE_SIZE)}
+            )
+            data = page.data
+            rows.extend(map(formatter, data[:remaining]))
+            has_more = page.has_more or len(data) > remaining
+            if len(rows) >= max_results or not page.has_more or not data:
+                break
+            params["starting_after"] = data[-1].id
+        return rows, has_more
+
+    async def _page_all(
+        self,
+        kind: str,
+        method: Callable[..., Awaitable[Any]],
+        formatter: Callable[[Any], dict[str, Any]],
+        limit: int,
+        starting_after: str | None,
+        **filters: Any,
+    ) -> dict[str, Any]:
+        """Collect up to ``limit`` rows across pages, shaped like one ``_page``."""
+        params = self._paged_params(kind, self._MAX_PAGE_SIZE, starting_after, **filters)
+        rows, has_more = await self._auto_page(method, params, formatter, limit)
+        next_cursor = _encode_cursor(kind, rows[-1]["id"]) if has_more and rows else None
+        return {"has_more": has_more, kind: rows, "next_cursor": next_cursor}
+
+    async def _gather(self, *calls: Awaitable[Any]) -> list[Any]:
+        """Await ``calls`` concurrently, at most ``_MAX_FANOUT`` in flight."""
+        fanout = asyncio.Semaphore(self._MAX_FANOUT)
+
+        async def bounded(call: Awaitable[Any]) -> Any:
+            async with fanout:
+                return await call
+
+        return await asyncio.gather(*(bounded(c) for c in calls))
+
     # --- Customers ---
 
-    def create_customer(
+    async def create_customer(
         self,
         email: str | None = None,
         name: str | None = None,
         phone: str | None = None,
         description: str | None = None,
         metadata: dict[str, str] | None = None,
+        idempotency_key: str | None = None,
     ) -> dict[str, Any]:
-        params: dict[str, Any] = {}
-        if email:
-            params["email"] = email
-        if name:
-            params["name"] = name
-        if phone:
-            params["phone"] = phone
-        if description:
-            params["description"] = description
-        if metadata:
-            params["metadata"] = metadata
-        customer = self._stripe().customers.create(params)
+        optional = (
+            ("email", email),
+            ("name", name),
+            ("phone", phone),
+            ("description", description),
+            ("metadata", metadata),
+        )
+        params: dict[str, Any] = _create_params(optional)
+        customer = await self._call(
+            self._stripe().customers.create_async, params, idempotency_key=idempotency_key
+        )
         return self._format_customer(customer)
 
-    def get_customer(self, customer_id: str) -> dict[str, Any]:
-        customer = self._stripe().customers.retrieve(customer_id)
-        return self._format_customer(customer)
+    async def get_customer(self, customer_id: str) -> dict[str, Any]:
+        return await self._retrieve(
+            "customer", self._format_customer, self._stripe().customers.retrieve_async, customer_id
+        )
 
-    def get_customer_by_email(self, email: str) -> dict[str, Any]:
-        result = self._stripe().customers.list({"email": email, "limit": 1})
+    async def get_customer_by_email(self, email: str) -> dict[str, Any]:
+        result = await self._call(self._stripe().customers.list_async, {"email": email, "limit": 1})
         items = result.data
         if not items:
             return {"error": f"No customer found with email: {email}"}
         return self._format_customer(items[0])
 
-    def update_customer(
+    async def update_customer(
         self,
         customer_id: str,
         email: str | None = None,
@@ -85,58 +889,90 @@ def update_customer(
         description: str | None = None,
         metadata: dict[str, str] | None = None,
     ) -> dict[str, Any]:
-        params: dict[str, Any] = {}
-        if email:
-            params["email"] = email
-        if name:
-            params["name"] = name
-        if phone:
-            params["phone"] = phone
-        if description:
-            params["description"] = description
-        if metadata:
-            params["metadata"] = metadata
-        customer = self._stripe().customers.update(customer_id, params)
-        return self._format_customer(customer)
-
-    def list_customers(
+        optional = (
+            ("email", email),
+            ("name", name),
+            ("phone", phone),
+            ("description", description),
+            ("metadata", metadata),
+        )
+        params: dict[str, Any] = {k: v for k, v in optional if v is not None}
+        customer = await self._call(self._stripe().customers.update_async, customer_id, params)
+        return self._remember("customer", self._format_customer(customer))
+
+    async def list_customers(
         self,
         limit: int = 10,
         starting_after: str | None = None,
         email: str | None = None,
+        auto_paginate: bool = False,
     ) -> dict[str, Any]:
-        params: dict[str, Any] = {"limit": min(limit, 100)}
-        if starting_after:
-            params["starting_after"] = starting_after
-        if email:
-            params["email"] = email
-        result = self._stripe().customers.list(params)
-        return {
-            "has_more": result.has_more,
-            "customers": [self._format_customer(c) for c in result.data],
-        }
+        if auto_paginate:
+            return await self._page_all(
+                "customers",
+                self._stripe().customers.list_async,
+                _customer_to_dict,
+                limit,
+                starting_after,
+                email=email,
+            )
+        params = self._paged_params("customers", limit, starting_after, email=email)
+        result = await self._call(self._stripe().customers.list_async, params)
+        return self._page("customers", result, list(map(_customer_to_dict, result.data)))
+
+    async def get_customer_overview(self, customer_id: str) -> dict[str, Any]:
+        """Fetch a customer with their subscriptions, invoices, and charges.
 
-    def _format_customer(self, c: Any) -> dict[str, Any]:
+        Subscriptions come expanded on the customer, and the invoice and charge
+        lists are requested concurrently with it, so the call costs roughly one
+        Stripe round-trip. Only a customer with more subscriptions than Stripe
+        embeds (10) needs a follow-up list request.
+        """
+        customer, invoices, charges = await self._gather(
+            self._call(
+                self._stripe().customers.retrieve_async,
+                customer_id,
+                {"expand": ["subscriptions"]},
+            ),
+            self.list_invoices(customer_id=customer_id, limit=100),
+            self.list_charges(customer_id=customer_id, limit=100),
+        )
+        embedded = customer.subscriptions
+        if embedded.has_more:
+            subs = await self.list_subscriptions(customer_id=customer_id, limit=100)
+        else:
+            subs = {
+                "subscriptions": [self._format_subscription(s) for s in embedded.data],
+                "has_more": False,
+            }
         return {
-            "id": c.id,
-            "email": c.email,
-            "name": c.name,
-            "phone": c.phone,
-            "description": c.description,
-            "created": c.created,
-            "currency": c.currency,
-            "delinquent": c.delinquent,
-            "metadata": c.metadata,
+            "customer": self._remember("customer", self._format_customer(customer)),
+            "subscriptions": subs["subscriptions"],
+            "invoices": invoices["invoices"],
+            "charges": charges["charges"],
+            "has_more": {
+                "subscriptions": subs["has_more"],
+                "invoices": invoices["has_more"],
+                "charges": charges["has_more"],
+            },
         }
 
-    # --- Subscriptions ---
+    _format_customer = staticmethod(_customer_to_dict)
 
-    def get_subscription(self, subscription_id: str) -> dict[str, Any]:
-        sub = self._stripe().subscriptions.retrieve(subscription_id)
-        return self._format_subscription(sub)
+    # --- Subscriptions ---
 
-    def get_subscription_status(self, customer_id: str) -> dict[str, Any]:
-        result = self._stripe().subscriptions.list({"customer": customer_id, "limit": 10})
+    async def get_subscription(self, subscription_id: str) -> dict[str, Any]:
+        return await self._retrieve(
+            "subscription",
+            self._format_subscription,
+            self._stripe().subscriptions.retrieve_async,
+            subscription_id,
+        )
+
+    async def get_subscription_status(self, customer_id: str) -> dict[str, Any]:
+        result = await self._call(
+            self._stripe().subscriptions.list_async, {"customer": customer_id, "limit": 10}
+        )
         subs = result.data
         if not subs:
             return {"customer_id": customer_id, "status": "no_subscription", "subscriptions": []}
@@ -146,33 +982,50 @@ def get_subscription_status(self, customer_id: str) -> dict[str, Any]:
             "subscriptions": [self._format_subscription(s) for s in subs],
         }
 
-    def list_subscriptions(
+    async def list_subscriptions(
         self,
         customer_id: str | None = None,
         status: str | None = None,
         limit: int = 10,
         starting_after: str | None = None,
+        auto_paginate: bool = False,
     ) -> dict[str, Any]:
-        params: dict[str, Any] = {"limit": min(limit, 100)}
-        if customer_id:
-            params["customer"] = customer_id
-        if status:
-            params["status"] = status
-        if starting_after:
-            params["starting_after"] = starting_after
-        result = self._stripe().subscriptions.list(params)
-        return {
-            "has_more": result.has_more,
-            "subscriptions": [self._format_subscription(s) for s in result.data],
-        }
+        if auto_paginate:
+            return await self._page_all(
+                "subscriptions",
+                self._stripe().subscriptions.list_async,
+                self._format_subscription,
+                limit,
+                starting_after,
+                customer=customer_id,
+                status=status,
+            )
+        params = self._paged_params(
+            "subscriptions", limit, starting_after, customer=customer_id, status=status
+        )
+        result = await self._call(self._stripe().subscriptions.list_async, params)
+        return self._page(
+            "subscriptions", result, [self._format_subscription(s) for s in result.data]
+        )
+
+    async def list_all_subscriptions(
+        self,
+        customer_id: str | None = None,
+        status: str | None = None,
+        max_results: int = 1000,
+    ) -> dict[str, Any]:
+        return await self.list_subscriptions(
+            customer_id, status, max_results, starting_after=None, auto_paginate=True
+        )
 
-    def create_subscription(
+    async def create_subscription(
         self,
         customer_id: str,
         price_id: str,
         quantity: int = 1,
         trial_period_days: int | None = None,
         metadata: dict[str, str] | None = None,
+        idempotency_key: str | None = None,
     ) -> dict[str, Any]:
         params: dict[str, Any] = {
             "customer": customer_id,
@@ -182,16 +1035,19 @@ def create_subscription(
             params["trial_period_days"] = trial_period_days
         if metadata:
             params["metadata"] = metadata
-        sub = self._stripe().subscriptions.create(params)
+        sub = await self._call(
+            self._stripe().subscriptions.create_async, params, idempotency_key=idempotency_key
+        )
         return self._format_subscription(sub)
 
-    def update_subscription(
+    async def update_subscription(
         self,
         subscription_id: str,
         price_id: str | None = None,
         quantity: int | None = None,
         metadata: dict[str, str] | None = None,
         cancel_at_period_end: bool | None = None,
+        subscription_item_id: str | None = None,
     ) -> dict[str, Any]:
         params: dict[str, Any] = {}
         if metadata:
@@ -199,57 +1055,61 @@ def update_subscription(
         if cancel_at_period_end is not None:
             params["cancel_at_period_end"] = cancel_at_period_end
         if price_id or quantity is not None:
-            sub = self._stripe().subscriptions.retrieve(subscription_id)
-            if not sub.items.data:
-                return {"error": "Subscription has no items to update"}
-            item_id = sub.items.data[0].id
+            item_id = subscription_item_id or self._first_item_id(subscription_id)
+            if item_id is None:
+                sub = await self._call(self._stripe().subscriptions.retrieve_async, subscription_id)
+                if not sub.items.data:
+                    return {"error": "Subscription has no items to update"}
+                item_id = sub.items.data[0].id
             item_params: dict[str, Any] = {"id": item_id}
             if price_id:
                 item_params["price"] = price_id
             if quantity is not None:
                 item_params["quantity"] = quantity
             params["items"] = [item_params]
-        sub = self._stripe().subscriptions.update(subscription_id, params)
-        return self._format_subscription(sub)
+        sub = await self._call(self._stripe().subscriptions.update_async, subscription_id, params)
+        return self._remember("subscription", self._format_subscription(sub))
 
-    def cancel_subscription(
+    async def cancel_subscription(
         self,
         subscription_id: str,
         at_period_end: bool = False,
     ) -> dict[str, Any]:
         if at_period_end:
-            sub = self._stripe().subscriptions.update(
-                subscription_id, {"cancel_at_period_end": True}
+            sub = await self._call(
+                self._stripe().subscriptions.update_async,
+                subscription_id,
+                {"cancel_at_period_end": True},
             )
         else:
-            sub = self._stripe().subscriptions.cancel(subscription_id)
-        return self._format_subscription(sub)
+            sub = await self._call(self._stripe().subscriptions.cancel_async, subscription_id)
+        return self._remember("subscription", self._format_subscription(sub))
+
+    def _first_item_id(self, subscription_id: str) -> str | None:
+        entry = self._sub_item_cache.get(subscription_id)
+        if entry is None or entry[0] != self._api_key:
+            return None
+        return entry[1]
 
     def _format_subscription(self, s: Any) -> dict[str, Any]:
-        return {
-            "id": s.id,
-            "customer": s.customer,
-            "status": s.status,
-            "current_period_start": s.current_period_start,
-            "current_period_end": s.current_period_end,
-            "cancel_at_period_end": s.cancel_at_period_end,
-            "canceled_at": s.canceled_at,
-            "trial_end": s.trial_end,
-            "created": s.created,
-            "items": [
-                {
-                    "id": item.id,
-                    "price_id": item.price.id,
-                    "quantity": item.quantity,
-                }
-                for item in s.items.data
-            ],
-            "metadata": s.metadata,
-        }
+        formatted = _subscription_to_dict(s)
+        formatted["items"] = [
+            {
+                "id": item.id,
+                "price_id": item.price.id,
+                "quantity": item.quantity,
+            }
+            for item in s.items.data
+        ]
+        if formatted["items"]:
+            # Remember the first item so a later price or quantity change can
+            # skip re-fetching the subscription.
+            self._sub_item_cache.set(s.id, (self._api_key, formatted["items"][0]["id"]))
+        return formatted
 
     # --- Payment Intents ---
 
-    def create_payment_intent(
+    async def create_payment_intent(
         self,
         amount: int,
         currency: str,
@@ -258,28 +1118,34 @@ def create_payment_intent(
         payment_method_types: list[str] | None = None,
         metadata: dict[str, str] | None = None,
         receipt_email: str | None = None,
+        idempotency_key: str | None = None,
     ) -> dict[str, Any]:
         params: dict[str, Any] = {
             "amount": amount,
             "currency": currency,
             "payment_method_types": payment_method_types or ["card"],
         }
-        if customer_id:
-            params["customer"] = customer_id
-        if description:
-            params["description"] = description
-        if metadata:
-            params["metadata"] = metadata
-        if receipt_email:
-            params["receipt_email"] = receipt_email
-        pi = self._stripe().payment_intents.create(params)
+        optional = (
+            ("customer", customer_id),
+            ("description", description),
+            ("metadata", metadata),
+            ("receipt_email", receipt_email),
+        )
+        params.update(_create_params(optional))
+        pi = await self._call(
+            self._stripe().payment_intents.create_async, params, idempotency_key=idempotency_key
+        )
         return self._format_payment_intent(pi)
 
-    def get_payment_intent(self, payment_intent_id: str) -> dict[str, Any]:
-        pi = self._stripe().payment_intents.retrieve(payment_intent_id)
-        return self._format_payment_intent(pi)
+    async def get_payment_intent(self, payment_intent_id: str) -> dict[str, Any]:
+        return await self._retrieve(
+            "payment_intent",
+            self._format_payment_intent,
+            self._stripe().payment_intents.retrieve_async,
+            payment_intent_id,
+        )
 
-    def confirm_payment_intent(
+    async def confirm_payment_intent(
         self,
         payment_intent_id: str,
         payment_method: str | None = None,
@@ -287,188 +1153,171 @@ def confirm_payment_intent(
         params: dict[str, Any] = {}
         if payment_method:
             params["payment_method"] = payment_method
-        pi = self._stripe().payment_intents.confirm(payment_intent_id, params)
+        pi = await self._call(
+            self._stripe().payment_intents.confirm_async, payment_intent_id, params
+        )
         return self._format_payment_intent(pi)
 
-    def cancel_payment_intent(self, payment_intent_id: str) -> dict[str, Any]:
-        pi = self._stripe().payment_intents.cancel(payment_intent_id)
+    async def cancel_payment_intent(self, payment_intent_id: str) -> dict[str, Any]:
+        pi = await self._call(self._stripe().payment_intents.cancel_async, payment_intent_id)
         return self._format_payment_intent(pi)
 
-    def list_payment_intents(
+    async def list_payment_intents(
         self,
         customer_id: str | None = None,
         limit: int = 10,
         starting_after: str | None = None,
     ) -> dict[str, Any]:
-        params: dict[str, Any] = {"limit": min(limit, 100)}
-        if customer_id:
-            params["customer"] = customer_id
-        if starting_after:
-            params["starting_after"] = starting_after
-        result = self._stripe().payment_intents.list(params)
-        return {
-            "has_more": result.has_more,
-            "payment_intents": [self._format_payment_intent(pi) for pi in result.data],
-        }
+        params = self._paged_params("payment_intents", limit, starting_after, customer=customer_id)
+        result = await self._call(self._stripe().payment_intents.list_async, params)
+        return self._page(
+            "payment_intents", result, list(map(_payment_intent_to_dict, result.data))
+        )
 
-    def _format_payment_intent(self, pi: Any) -> dict[str, Any]:
-        return {
-            "id": pi.id,
-            "amount": pi.amount,
-            "amount_received": pi.amount_received,
-            "currency": pi.currency,
-            "status": pi.status,
-            "customer": pi.customer,
-            "description": pi.description,
-            "receipt_email": pi.receipt_email,
-            "payment_method": pi.payment_method,
-            "created": pi.created,
-            "metadata": pi.metadata,
-        }
+    _format_payment_intent = staticmethod(_payment_intent_to_dict)
 
     # --- Charges ---
 
-    def list_charges(
+    async def list_charges(
         self,
         customer_id: str | None = None,
         payment_intent_id: str | None = None,
         limit: int = 10,
         starting_after: str | None = None,
+        created_after: int | None = None,
+        auto_paginate: bool = False,
     ) -> dict[str, Any]:
-        params: dict[str, Any] = {"limit": min(limit, 100)}
-        if customer_id:
-            params["customer"] = customer_id
-        if payment_intent_id:
-            params["payment_intent"] = payment_intent_id
-        if starting_after:
-            params["starting_after"] = starting_after
-        result = self._stripe().charges.list(params)
-        return {
-            "has_more": result.has_more,
-            "charges": [self._format_charge(c) for c in result.data],
+        filters = {
+            "customer": customer_id,
+            "payment_intent": payment_intent_id,
+            "created": _created_filter(created_after),
         }
+        if auto_paginate:
+            return await self._page_all(
+                "charges",
+                self._stripe().charges.list_async,
+                _charge_to_dict,
+                limit,
+                starting_after,
+                **filters,
+            )
+        params = self._paged_params("charges", limit, starting_after, **filters)
+        result = await self._call(self._stripe().charges.list_async, params)
+        return self._page("charges", result, list(map(_charge_to_dict, result.data)))
 
-    def get_charge(self, charge_id: str) -> dict[str, Any]:
-        charge = self._stripe().charges.retrieve(charge_id)
-        return self._format_charge(charge)
+    async def get_charge(self, charge_id: str) -> dict[str, Any]:
+        return await self._retrieve(
+            "charge", self._format_charge, self._stripe().charges.retrieve_async, charge_id
+        )
 
-    def capture_charge(self, charge_id: str, amount: int | None = None) -> dict[str, Any]:
+    async def capture_charge(
+        self,
+        charge_id: str,
+        amount: int | None = None,
+        idempotency_key: str | None = None,
+    ) -> dict[str, Any]:
         params: dict[str, Any] = {}
         if amount is not None:
             params["amount"] = amount
-        charge = self._stripe().charges.capture(charge_id, params)
+        charge = await self._call(
+            self._stripe().charges.capture_async,
+            charge_id,
+            params,
+            idempotency_key=idempotency_key,
+        )
         return self._format_charge(charge)
 
-    def _format_charge(self, c: Any) -> dict[str, Any]:
-        return {
-            "id": c.id,
-            "amount": c.amount,
-            "amount_captured": c.amount_captured,
-            "amount_refunded": c.amount_refunded,
-            "currency": c.currency,
-            "status": c.status,
-            "paid": c.paid,
-            "refunded": c.refunded,
-            "customer": c.customer,
-            "description": c.description,
-            "receipt_email": c.receipt_email,
-            "receipt_url": c.receipt_url,
-            "payment_intent": c.payment_intent,
-            "created": c.created,
-            "metadata": c.metadata,
-        }
+    _format_charge = staticmethod(_charge_to_dict)
 
     # --- Refunds ---
 
-    def create_refund(
+    async def create_refund(
         self,
         charge_id: str | None = None,
         payment_intent_id: str | None = None,
         amount: int | None = None,
         reason: str | None = None,
         metadata: dict[str, str] | None = None,
+        idempotency_key: str | None = None,
     ) -> dict[str, Any]:
-        params: dict[str, Any] = {}
-        if charge_id:
-            params["charge"] = charge_id
-        if payment_intent_id:
-            params["payment_intent"] = payment_intent_id
-        if amount is not None:
-            params["amount"] = amount
-        if reason:
-            params["reason"] = reason
-        if metadata:
-            params["metadata"] = metadata
-        refund = self._stripe().refunds.create(params)
+        optional = (
+            ("charge", charge_id),
+            ("payment_intent", payment_intent_id),
+            ("amount", amount),
+            ("reason", reason),
+            ("metadata", metadata),
+        )
+        params: dict[str, Any] = _create_params(optional)
+        refund = await self._call(
+            self._stripe().refunds.create_async, params, idempotency_key=idempotency_key
+        )
         return self._format_refund(refund)
 
-    def get_refund(self, refund_id: str) -> dict[str, Any]:
-        refund = self._stripe().refunds.retrieve(refund_id)
-        return self._format_refund(refund)
+    async def get_refund(self, refund_id: str) -> dict[str, Any]:
+        return await self._retrieve(
+            "refund", self._format_refund, self._stripe().refunds.retrieve_async, refund_id
+        )
 
-    def list_refunds(
+    async def list_refunds(
         self,
         charge_id: str | None = None,
         payment_intent_id: str | None = None,
         limit: int = 10,
         starting_after: str | None = None,
+        *,
+        charge_amount_refunded: int | None = None,
     ) -> dict[str, Any]:
-        params: dict[str, Any] = {"limit": min(limit, 100)}
-        if charge_id:
-            params["charge"] = charge_id
-        if payment_intent_id:
-            params["payment_intent"] = payment_intent_id
-        if starting_after:
-            params["starting_after"] = starting_after
-        result = self._stripe().refunds.list(params)
-        return {
-            "has_more": result.has_more,
-            "refunds": [self._format_refund(r) for r in result.data],
-        }
-
-    def _format_refund(self, r: Any) -> dict[str, Any]:
-        return {
-            "id": r.id,
-            "amount": r.amount,
-            "currency": r.currency,
-            "status": r.status,
-            "charge": r.charge,
-            "payment_intent": r.payment_intent,
-            "reason": r.reason,
-            "created": r.created,
-            "metadata": r.metadata,
-        }
+        # For callers in this module that have just fetched the charge: with
+        # nothing refunded there is no successful or pending refund to list.
+        # Failed and canceled refunds also leave amount_refunded at 0, so
+        # they are skipped too; leave the hint unset to see those.
+        if charge_amount_refunded == 0 and charge_id:
+            return {"has_more": False, "refunds": [], "next_cursor": None}
+        params = self._paged_params(
+            "refunds", limit, starting_after, charge=charge_id, payment_intent=payment_intent_id
+        )
+        result = await self._call(self._stripe().refunds.list_async, params)
+        return self._page("refunds", result, list(map(_refund_to_dict, result.data)))
+
+    _format_refund = staticmethod(_refund_to_dict)
 
     # --- Invoices ---
 
-    def list_invoices(
+    async def list_invoices(
         self,
         customer_id: str | None = None,
         status: str | None = None,
         subscription_id: str | None = None,
         limit: int = 10,
         starting_after: str | None = None,
+        auto_paginate: bool = False,
+        created_after: int | None = None,
     ) -> dict[str, Any]:
-        params: dict[str, Any] = {"limit": min(limit, 100)}
-        if customer_id:
-            params["customer"] = customer_id
-        if status:
-            params["status"] = status
-        if subscription_id:
-            params["subscription"] = subscription_id
-        if starting_after:
-            params["starting_after"] = starting_after
-        result = self._stripe().invoices.list(params)
-        return {
-            "has_more": result.has_more,
-            "invoices": [self._format_invoice(inv) for inv in result.data],
+        filters = {
+            "customer": customer_id,
+            "status": status,
+            "subscription": subscription_id,
+            "created": _created_filter(created_after),
         }
+        if auto_paginate:
+            return await self._page_all(
+                "invoices",
+                self._stripe().invoices.list_async,
+                _invoice_to_dict,
+                limit,
+                starting_after,
+                **filters,
+            )
+        params = self._paged_params("invoices", limit, starting_after, **filters)
+        result = await self._call(self._stripe().invoices.list_async, params)
+        return self._page("invoices", result, list(map(_invoice_to_dict, result.data)))
 
-    def get_invoice(self, invoice_id: str) -> dict[str, Any]:
-        inv = self._stripe().invoices.retrieve(invoice_id)
-        return self._format_invoice(inv)
+    async def get_invoice(self, invoice_id: str) -> dict[str, Any]:
+        return await self._retrieve(
+            "invoice", self._format_invoice, self._stripe().invoices.retrieve_async, invoice_id
+        )
 
-    def create_invoice(
+    async def create_invoice(
         self,
         customer_id: str,
         description: str | None = None,
@@ -476,56 +1325,47 @@ def create_invoice(
         collection_method: str = "charge_automatically",
         days_until_due: int | None = None,
         metadata: dict[str, str] | None = None,
+        idempotency_key: str | None = None,
     ) -> dict[str, Any]:
         params: dict[str, Any] = {
             "customer": customer_id,
             "auto_advance": auto_advance,
             "collection_method": collection_method,
         }
-        if description:
-            params["description"] = description
-        if days_until_due is not None:
-            params["days_until_due"] = days_until_due
-        if metadata:
-            params["metadata"] = metadata
-        inv = self._stripe().invoices.create(params)
+        optional = (
+            ("description", description),
+            ("days_until_due", days_until_due),
+            ("metadata", metadata),
+        )
+        params.update(_create_params(optional))
+        inv = await self._call(
+            self._stripe().invoices.create_async, params, idempotency_key=idempotency_key
+        )
         return self._format_invoice(inv)
 
-    def finalize_invoice(self, invoice_id: str) -> dict[str, Any]:
-        inv = self._stripe().invoices.finalize_invoice(invoice_id)
-        return self._format_invoice(inv)
+    async def finalize_invoice(self, invoice_id: str) -> dict[str, Any]:
+        inv = await self._call(self._stripe().invoices.finalize_invoice_async, invoice_id)
+        return self._invoice_changed(inv)
 
-    def pay_invoice(self, invoice_id: str) -> dict[str, Any]:
-        inv = self._stripe().invoices.pay(invoice_id)
-        return self._format_invoice(inv)
+    async def pay_invoice(self, invoice_id: str) -> dict[str, Any]:
+        inv = await self._call(self._stripe().invoices.pay_async, invoice_id)
+        return self._invoice_changed(inv)
 
-    def void_invoice(self, invoice_id: str) -> dict[str, Any]:
-        inv = self._stripe().invoices.void_invoice(invoice_id)
-        return self._format_invoice(inv)
+    async def void_invoice(self, invoice_id: str) -> dict[str, Any]:
+        inv = await self._call(self._stripe().invoices.void_invoice_async, invoice_id)
+        return self._invoice_changed(inv)
 
-    def _format_invoice(self, inv: Any) -> dict[str, Any]:
-        return {
-            "id": inv.id,
-            "customer": inv.customer,
-            "subscription": inv.subscription,
-            "status": inv.status,
-            "amount_due": inv.amount_due,
-            "amount_paid": inv.amount_paid,
-            "amount_remaining": inv.amount_remaining,
-            "currency": inv.currency,
-            "description": inv.description,
-            "hosted_invoice_url": inv.hosted_invoice_url,
-            "invoice_pdf": inv.invoice_pdf,
-            "due_date": inv.due_date,
-            "created": inv.created,
-            "period_start": inv.period_start,
-            "period_end": inv.period_end,
-            "metadata": inv.metadata,
-        }
+    def _invoice_changed(self, inv: Any) -> dict[str, Any]:
+        formatted = self._remember("invoice", self._format_invoice(inv))
+        # Finalizing, paying or voiding an invoice can move its subscription's status.
+        self._forget("subscription", formatted["subscription"])
+        return formatted
+
+    _format_invoice = staticmethod(_invoice_to_dict)
 
     # --- Invoice Items ---
 
-    def create_invoice_item(
+    async def create_invoice_item(
         self,
         customer_id: str,
         amount: int,
@@ -533,97 +1373,128 @@ def create_invoice_item(
         description: str | None = None,
         invoice_id: str | None = None,
         metadata: dict[str, str] | None = None,
+        idempotency_key: str | None = None,
     ) -> dict[str, Any]:
         params: dict[str, Any] = {
             "customer": customer_id,
             "amount": amount,
             "currency": currency,
         }
-        if description:
-            params["description"] = description
-        if invoice_id:
-            params["invoice"] = invoice_id
-        if metadata:
-            params["metadata"] = metadata
-        item = self._stripe().invoice_items.create(params)
+        optional = (
+            ("description", description),
+            ("invoice", invoice_id),
+            ("metadata", metadata),
+        )
+        params.update(_create_params(optional))
+        item = await self._call(
+            self._stripe().invoice_items.create_async, params, idempotency_key=idempotency_key
+        )
+        # The invoice the item was added to now has new totals.
+        self._forget("invoice", item.invoice)
         return self._format_invoice_item(item)
 
-    def list_invoice_items(
+    async def list_invoice_items(
         self,
         customer_id: str | None = None,
         invoice_id: str | None = None,
         limit: int = 10,
         starting_after: str | None = None,
+        auto_paginate: bool = False,
     ) -> dict[str, Any]:
-        params: dict[str, Any] = {"limit": min(limit, 100)}
-        if customer_id:
-            params["customer"] = customer_id
-        if invoice_id:
-            params["invoice"] = invoice_id
-        if starting_after:
-            params["starting_after"] = starting_after
-        result = self._stripe().invoice_items.list(params)
-        return {
-            "has_more": result.has_more,
-            "invoice_items": [self._format_invoice_item(i) for i in result.data],
-        }
-
-    def delete_invoice_item(self, invoice_item_id: str) -> dict[str, Any]:
-        deleted = self._stripe().invoice_items.delete(invoice_item_id)
+        filters = {"customer": customer_id, "invoice": invoice_id}
+        if auto_paginate:
+            return await self._page_all(
+                "invoice_items",
+                self._stripe().invoice_items.list_async,
+                _invoice_item_to_dict,
+                limit,
+                starting_after,
+                **filters,
+            )
+        params = self._paged_params("invoice_items", limit, starting_after, **filters)
+        result = await self._call(self._stripe().invoice_items.list_async, params)
+        return self._page("invoice_items", result, list(map(_invoice_item_to_dict, result.data)))
+
+    async def delete_invoice_item(self, invoice_item_id: str) -> dict[str, Any]:
+        deleted = await self._call(self._stripe().invoice_items.delete_async, invoice_item_id)
+        # The deleted object does not say which invoice held the item, so drop
+        # every invoice cached for this key rather than serve stale totals.
+        self._read_cache.pop_matching(lambda key: key[:2] == (self._api_key, "invoice"))
         return {"id": deleted.id, "deleted": deleted.deleted}
 
-    def _format_invoice_item(self, item: Any) -> dict[str, Any]:
-        return {
-            "id": item.id,
-            "customer": item.customer,
-            "invoice": item.invoice,
-            "amount": item.amount,
-            "currency": item.currency,
-            "description": item.description,
-            "quantity": item.quantity,
-            "created": item.created,
-            "metadata": item.metadata,
-        }
+    _format_invoice_item = staticmethod(_invoice_item_to_dict)
 
     # --- Products ---
 
-    def create_product(
+    async def create_product(
         self,
         name: str,
         description: str | None = None,
         active: bool = True,
         metadata: dict[str, str] | None = None,
+        idempotency_key: str | None = None,
     ) -> dict[str, Any]:
         params: dict[str, Any] = {"name": name, "active": active}
-        if description:
-            params["description"] = description
-        if metadata:
-            params["metadata"] = metadata
-        product = self._stripe().products.create(params)
-        return self._format_product(product)
-
-    def get_product(self, product_id: str) -> dict[str, Any]:
-        product = self._stripe().products.retrieve(product_id)
-        return self._format_product(product)
+        optional = (
+            ("description", description),
+            ("metadata", metadata),
+        )
+        params.update(_create_params(optional))
+        product = await self._call(
+            self._stripe().products.create_async, params, idempotency_key=idempotency_key
+        )
+        self._list_cache.clear()
+        return self._cache_set(self._product_cache, self._format_product(product))
+
+    async def get_product(self, product_id: str) -> dict[str, Any]:
+        cached = self._cache_get(self._product_cache, product_id)
+        if cached is not None:
+            return cached
+        return await self._retrieve(
+            "product",
+            lambda p: self._cache_set(self._product_cache, self._format_product(p)),
+            self._stripe().products.retrieve_async,
+            product_id,
+        )
+
+    async def get_products(self, product_ids: list[str]) -> dict[str, Any]:
+        """Fetch several products: cached ones locally, the rest in one list request."""
+        wanted = list(dict.fromkeys(product_ids))
+        found = {pid: p for pid in wanted if (p := self._cache_get(self._product_cache, pid))}
+        missing = [pid for pid in wanted if pid not in found]
+        if missing:
+            result = await self._call(
+                self._stripe().products.list_async,
+                {"ids": missing, "limit": self._MAX_PAGE_SIZE},
+            )
+            for p in result.data:
+                found[p.id] = self._cache_set(self._product_cache, self._format_product(p))
+        return {
+            "products": [found[pid] for pid in wanted if pid in found],
+            "not_found": [pid for pid in wanted if pid not in found],
+        }
 
-    def list_products(
+    async def list_products(
         self,
         active: bool | None = None,
         limit: int = 10,
         starting_after: str | None = None,
+        auto_paginate: bool = False,
     ) -> dict[str, Any]:
-        params: dict[str, Any] = {"limit": min(limit, 100)}
-        if active is not None:
-            params["active"] = active
-        if starting_after:
-            params["starting_after"] = starting_after
-        result = self._stripe().products.list(params)
-        return {
-            "has_more": result.has_more,
-            "products": [self._format_product(p) for p in result.data],
-        }
+        def format_product(p: Any) -> dict[str, Any]:
+            return self._cache_set(self._product_cache, self._format_product(p))
 
-    def update_product(
+        method = self._stripe().products.list_async
+        if auto_paginate:
+            return await self._page_all(
+                "products", method, format_product, limit, starting_after, active=active
+            )
+        params = self._paged_params("products", limit, starting_after, active=active)
+        return await self._cached_page(
+            "products", method, params, lambda data: list(map(format_product, data))
+        )
+
+    async def update_product(
         self,
         product_id: str,
         name: str | None = None,
@@ -631,32 +1502,22 @@ def update_product(
         active: bool | None = None,
         metadata: dict[str, str] | None = None,
     ) -> dict[str, Any]:
-        params: dict[str, Any] = {}
-        if name:
-            params["name"] = name
-        if description:
-            params["description"] = description
-        if active is not None:
-            params["active"] = active
-        if metadata:
-            params["metadata"] = metadata
-        product = self._stripe().products.update(product_id, params)
-        return self._format_product(product)
-
-    def _format_product(self, p: Any) -> dict[str, Any]:
-        return {
-            "id": p.id,
-            "name": p.name,
-            "description": p.description,
-            "active": p.active,
-            "created": p.created,
-            "updated": p.updated,
-            "metadata": p.metadata,
-        }
+        optional = (
+            ("name", name),
+            ("description", description),
+            ("active", active),
+            ("metadata", metadata),
+        )
+        params: dict[str, Any] = {k: v for k, v in optional if v is not None}
+        product = await self._call(self._stripe().products.update_async, product_id, params)
+        self._list_cache.clear()
+        return self._cache_set(self._product_cache, self._format_product(product))
+
+    _format_product = staticmethod(_product_to_dict)
 
     # --- Prices ---
 
-    def create_price(
+    async def create_price(
         self,
         unit_amount: int,
         currency: str,
@@ -665,63 +1526,135 @@ def create_price(
         recurring_interval_count: int | None = None,
         nickname: str | None = None,
         metadata: dict[str, str] | None = None,
+        idempotency_key: str | None = None,
     ) -> dict[str, Any]:
         params: dict[str, Any] = {
             "unit_amount": unit_amount,
             "currency": currency,
             "product": product_id,
         }
+        optional = (
+            ("nickname", nickname),
+            ("metadata", metadata),
+        )
+        params.update(_create_params(optional))
         if recurring_interval:
             params["recurring"] = {"interval": recurring_interval}
             if recurring_interval_count is not None:
                 params["recurring"]["interval_count"] = recurring_interval_count
-        if nickname:
-            params["nickname"] = nickname
-        if metadata:
-            params["metadata"] = metadata
-        price = self._stripe().prices.create(params)
-        return self._format_price(price)
+        price = await self._call(
+            self._stripe().prices.create_async, params, idempotency_key=idempotency_key
+        )
+        self._list_cache.clear()
+        return self._cache_set(self._price_cache, self._format_price(price))
 
-    def get_price(self, price_id: str) -> dict[str, Any]:
-        price = self._stripe().prices.retrieve(price_id)
-        return self._format_price(price)
+    async def create_product_with_price(
+        self,
+        name: str,
+        unit_amount: int,
+        currency: str,
+        description: str | None = None,
+        recurring_interval: str | None = None,
+        recurring_interval_count: int | None = None,
+        metadata: dict[str, str] | None = None,
+        idempotency_key: str | None = None,
+    ) -> dict[str, Any]:
+        """Create a product and its default price in a single request."""
+        price_data: dict[str, Any] = {"unit_amount": unit_amount, "currency": currency}
+        if recurring_interval:
+            price_data["recurring"] = {"interval": recurring_interval}
+            if recurring_interval_count is not None:
+                price_data["recurring"]["interval_count"] = recurring_interval_count
+        params: dict[str, Any] = {
+            "name": name,
+            "default_price_data": price_data,
+            "expand": ["default_price"],
+        }
+        optional = (
+            ("description", description),
+            ("metadata", metadata),
+        )
+        params.update(_create_params(optional))
+        product = await self._call(
+            self._stripe().products.create_async, params, idempotency_key=idempotency_key
+        )
+        self._list_cache.clear()
+        return {
+            "product": self._cache_set(self._product_cache, self._format_product(product)),
+            "price": self._cache_set(self._price_cache, self._format_price(product.default_price)),
+        }
 
-    def list_prices(
+    async def get_price(self, price_id: str) -> dict[str, Any]:
+        cached = self._cache_get(self._price_cache, price_id)
+        if cached is not None:
+            return cached
+        return await self._retrieve(
+            "price",
+            lambda p: self._cache_set(self._price_cache, self._format_price(p)),
+            self._stripe().prices.retrieve_async,
+            price_id,
+        )
+
+    async def get_prices(self, price_ids: list[str]) -> dict[str, Any]:
+        """Fetch several prices concurrently, serving cached ones locally.
+
+        The prices list endpoint has no ``ids`` filter, so uncached prices are
+        retrieved individually, at most ``_MAX_FANOUT`` at a time.
+        """
+        wanted = list(dict.fromkeys(price_ids))
+
+        async def lookup(price_id: str) -> dict[str, Any] | None:
+            try:
+                return await self.get_price(price_id)
+            except stripe.InvalidRequestError as e:
+                if e.code == "resource_missing":
+                    return None
+                raise
+
+        prices = await self._gather(*(lookup(pid) for pid in wanted))
+        return {
+            "prices": [p for p in prices if p is not None],
+            "not_found": [pid for pid, p in zip(wanted, prices, strict=True) if p is None],
+        }
+
+    async def list_prices(
         self,
         product_id: str | None = None,
         active: bool | None = None,
         limit: int = 10,
         starting_after: str | None = None,
+        auto_paginate: bool = False,
     ) -> dict[str, Any]:
-        params: dict[str, Any] = {"limit": min(limit, 100)}
-        if product_id:
-            params["product"] = product_id
-        if active is not None:
-            params["active"] = active
-        if starting_after:
-            params["starting_after"] = starting_after
-        result = self._stripe().prices.list(params)
-        return {
-            "has_more": result.has_more,
-            "prices": [self._format_price(p) for p in result.data],
-        }
+        def format_price(p: Any) -> dict[str, Any]:
+            return self._cache_set(self._price_cache, self._format_price(p))
+
+        method = self._stripe().prices.list_async
+        filters = {"product": product_id, "active": active}
+        if auto_paginate:
+            return await self._page_all(
+                "prices", method, format_price, limit, starting_after, **filters
+            )
+        params = self._paged_params("prices", limit, starting_after, **filters)
+        return await self._cached_page(
+            "prices", method, params, lambda data: list(map(format_price, data))
+        )
 
-    def update_price(
+    async def update_price(
         self,
         price_id: str,
         active: bool | None = None,
         nickname: str | None = None,
         metadata: dict[str, str] | None = None,
     ) -> dict[str, Any]:
-        params: dict[str, Any] = {}
-        if active is not None:
-            params["active"] = active
-        if nickname:
-            params["nickname"] = nickname
-        if metadata:
-            params["metadata"] = metadata
-        price = self._stripe().prices.update(price_id, params)
-        return self._format_price(price)
+        optional = (
+            ("active", active),
+            ("nickname", nickname),
+            ("metadata", metadata),
+        )
+        params: dict[str, Any] = {k: v for k, v in optional if v is not None}
+        price = await self._call(self._stripe().prices.update_async, price_id, params)
+        self._list_cache.clear()
+        return self._cache_set(self._price_cache, self._format_price(price))
 
     def _format_price(self, p: Any) -> dict[str, Any]:
         recurring = None
@@ -730,76 +1663,73 @@ def _format_price(self, p: Any) -> dict[str, Any]:
                 "interval": p.recurring.interval,
                 "interval_count": p.recurring.interval_count,
             }
-        return {
-            "id": p.id,
-            "product": p.product,
-            "currency": p.currency,
-            "unit_amount": p.unit_amount,
-            "nickname": p.nickname,
-            "active": p.active,
-            "type": p.type,
-            "recurring": recurring,
-            "created": p.created,
-            "metadata": p.metadata,
-        }
+        formatted = _price_to_dict(p)
+        formatted["recurring"] = recurring
+        return formatted
 
     # --- Payment Links ---
 
-    def create_payment_link(
+    async def create_payment_link(
         self,
         price_id: str,
         quantity: int = 1,
         metadata: dict[str, str] | None = None,
+        idempotency_key: str | None = None,
     ) -> dict[str, Any]:
         params: dict[str, Any] = {
             "line_items": [{"price": price_id, "quantity": quantity}],
         }
         if metadata:
             params["metadata"] = metadata
-        link = self._stripe().payment_links.create(params)
+        # line_items is only returned when expanded
+        params["expand"] = ["line_items"]
+        link = await self._call(
+            self._stripe().payment_links.create_async, params, idempotency_key=idempotency_key
+        )
+        self._list_cache.clear()
         return self._format_payment_link(link)
 
-    def get_payment_link(self, payment_link_id: str) -> dict[str, Any]:
-        link = self._stripe().payment_links.retrieve(payment_link_id)
-        return self._format_payment_link(link)
+    async def get_payment_link(self, payment_link_id: str) -> dict[str, Any]:
+        return await self._retrieve(
+            "payment_link",
+            self._format_payment_link,
+            self._stripe().payment_links.retrieve_async,
+            payment_link_id,
+            {"expand": ["line_items"]},
+        )
 
-    def list_payment_links(
+    async def list_payment_links(
         self,
         active: bool | None = None,
         limit: int = 10,
         starting_after: str | None = None,
+        auto_paginate: bool = False,
     ) -> dict[str, Any]:
-        params: dict[str, Any] = {"limit": min(limit, 100)}
-        if active is not None:
-            params["active"] = active
-        if starting_after:
-            params["starting_after"] = starting_after
-        result = self._stripe().payment_links.list(params)
-        return {
-            "has_more": result.has_more,
-            "payment_links": [self._format_payment_link(link) for link in result.data],
-        }
+        method = self._stripe().payment_links.list_async
+        filters = {"expand": ["data.line_items"], "active": active}
+        if auto_paginate:
+            return await self._page_all(
+                "payment_links", method, self._format_payment_link, limit, starting_after, **filters
+            )
+        params = self._paged_params("payment_links", limit, starting_after, **filters)
+        return await self._cached_page(
+            "payment_links", method, params, lambda data: list(map(self._format_payment_link, data))
+        )
 
     def _format_payment_link(self, link: Any) -> dict[str, Any]:
-        return {
-            "id": link.id,
-            "url": link.url,
-            "active": link.active,
-            "currency": link.currency,
-            "line_items": [
-                {
-                    "price": item.price.id if item.price else None,
-                    "quantity": item.quantity,
-                }
-                for item in (link.line_items.data if link.line_items else [])
-            ],
-            "created": link.created,
-            "metadata": link.metadata,
-        }
+        formatted = _payment_link_to_dict(link)
+        formatted["line_items"] = [
+            {
+                "price": item.price.id if item.price else None,
+                "quantity": item.quantity,
+            }
+            for item in (link.line_items.data if link.line_items else [])
+        ]
+        return formatted
 
     # --- Coupons ---
 
-    def create_coupon(
+    async def create_coupon(
         self,
         percent_off: float | None = None,
         amount_off: int | None = None,
@@ -809,171 +1739,146 @@ def create_coupon(
         name: str | None = None,
         max_redemptions: int | None = None,
         metadata: dict[str, str] | None = None,
+        idempotency_key: str | None = None,
     ) -> dict[str, Any]:
         params: dict[str, Any] = {"duration": duration}
-        if percent_off is not None:
-            params["percent_off"] = percent_off
-        if amount_off is not None:
-            params["amount_off"] = amount_off
-        if currency:
-            params["currency"] = currency
-        if duration_in_months is not None:
-            params["duration_in_months"] = duration_in_months
-        if name:
-            params["name"] = name
-        if max_redemptions is not None:
-            params["max_redemptions"] = max_redemptions
-        if metadata:
-            params["metadata"] = metadata
-        coupon = self._stripe().coupons.create(params)
+        optional = (
+            ("percent_off", percent_off),
+            ("amount_off", amount_off),
+            ("currency", currency),
+            ("duration_in_months", duration_in_months),
+            ("name", name),
+            ("max_redemptions", max_redemptions),
+            ("metadata", metadata),
+        )
+        params.update(_create_params(optional))
+        coupon = await self._call(
+            self._stripe().coupons.create_async, params, idempotency_key=idempotency_key
+        )
+        self._list_cache.clear()
         return self._format_coupon(coupon)
 
-    def list_coupons(
+    async def list_coupons(
         self,
         limit: int = 10,
         starting_after: str | None = None,
+        auto_paginate: bool = False,
     ) -> dict[str, Any]:
-        params: dict[str, Any] = {"limit": min(limit, 100)}
-        if starting_after:
-            params["starting_after"] = starting_after
-        result = self._stripe().coupons.list(params)
-        return {
-            "has_more": result.has_more,
-            "coupons": [self._format_coupon(c) for c in result.data],
-        }
-
-    def delete_coupon(self, coupon_id: str) -> dict[str, Any]:
-        deleted = self._stripe().coupons.delete(coupon_id)
+        method = self._stripe().coupons.list_async
+        if auto_paginate:
+            return await self._page_all("coupons", method, _coupon_to_dict, limit, starting_after)
+        params = self._paged_params("coupons", limit, starting_after)
+        return await self._cached_page(
+            "coupons", method, params, lambda data: list(map(_coupon_to_dict, data))
+        )
+
+    async def delete_coupon(self, coupon_id: str) -> dict[str, Any]:
+        deleted = await self._call(self._stripe().coupons.delete_async, coupon_id)
+        self._list_cache.clear()
         return {"id": deleted.id, "deleted": deleted.deleted}
 
-    def _format_coupon(self, c: Any) -> dict[str, Any]:
-        return {
-            "id": c.id,
-            "name": c.name,
-            "percent_off": c.percent_off,
-            "amount_off": c.amount_off,
-            "currency": c.currency,
-            "duration": c.duration,
-            "duration_in_months": c.duration_in_months,
-            "max_redemptions": c.max_redemptions,
-            "times_redeemed": c.times_redeemed,
-            "valid": c.valid,
-            "created": c.created,
-            "metadata": c.metadata,
-        }
+    _format_coupon = staticmethod(_coupon_to_dict)
 
     # --- Balance ---
 
-    def get_balance(self) -> dict[str, Any]:
-        bal = self._stripe().balance.retrieve()
+    async def get_balance(self) -> dict[str, Any]:
+        return await self._retrieve(
+            "balance", self._format_balance, self._stripe().balance.retrieve_async, None
+        )
+
+    @staticmethod
+    def _format_balance(bal: Any) -> dict[str, Any]:
         return {
             "available": [{"amount": b.amount, "currency": b.currency} for b in bal.available],
             "pending": [{"amount": b.amount, "currency": b.currency} for b in bal.pending],
         }
 
-    def list_balance_transactions(
+    async def list_balance_transactions(
         self,
         type_filter: str | None = None,
         limit: int = 10,
         starting_after: str | None = None,
+        created_after: int | None = None,
+        auto_paginate: bool = False,
     ) -> dict[str, Any]:
-        params: dict[str, Any] = {"limit": min(limit, 100)}
-        if type_filter:
-            params["type"] = type_filter
-        if starting_after:
-            params["starting_after"] = starting_after
-        result = self._stripe().balance_transactions.list(params)
-        return {
-            "has_more": result.has_more,
-            "transactions": [
-                {
-                    "id": t.id,
-                    "amount": t.amount,
-                    "currency": t.currency,
-                    "net": t.net,
-                    "fee": t.fee,
-                    "type": t.type,
-                    "status": t.status,
-                    "description": t.description,
-                    "created": t.created,
-                }
-                for t in result.data
-            ],
-        }
+        filters = {"type": type_filter, "created": _created_filter(created_after)}
+        if auto_paginate:
+            return await self._page_all(
+                "transactions",
+                self._stripe().balance_transactions.list_async,
+                _balance_transaction_to_dict,
+                limit,
+                starting_after,
+                **filters,
+            )
+        params = self._paged_params("transactions", limit, starting_after, **filters)
+        result = await self._call(self._stripe().balance_transactions.list_async, params)
+        return self._page(
+            "transactions", result, list(map(_balance_transaction_to_dict, result.data))
+        )
 
     # --- Webhook Endpoints ---
 
-    def list_webhook_endpoints(
+    async def list_webhook_endpoints(
         self,
         limit: int = 10,
         starting_after: str | None = None,
+        auto_paginate: bool = False,
     ) -> dict[str, Any]:
-        params: dict[str, Any] = {"limit": min(limit, 100)}
-        if starting_after:
-            params["starting_after"] = starting_after
-        result = self._stripe().webhook_endpoints.list(params)
-        return {
-            "has_more": result.has_more,
-            "webhook_endpoints": [
-                {
-                    "id": we.id,
-                    "url": we.url,
-                    "status": we.status,
-                    "enabled_events": we.enabled_events,
-                    "created": we.created,
-                }
-                for we in result.data
-            ],
-        }
+        method = self._stripe().webhook_endpoints.list_async
+        if auto_paginate:
+            return await self._page_all(
+                "webhook_endpoints", method, _webhook_endpoint_to_dict, limit, starting_after
+            )
+        params = self._paged_params("webhook_endpoints", limit, starting_after)
+        result = await self._call(method, params)
+        return self._page(
+            "webhook_endpoints", result, list(map(_webhook_endpoint_to_dict, result.data))
+        )
 
     # --- Payment Methods ---
 
-    def list_payment_methods(
+    async def list_payment_methods(
         self,
         customer_id: str,
         type_filter: str = "card",
         limit: int = 10,
         starting_after: str | None = None,
+        auto_paginate: bool = False,
     ) -> dict[str, Any]:
-        params: dict[str, Any] = {
-            "customer": customer_id,
-            "type": type_filter,
-            "limit": min(limit, 100),
-        }
-        if starting_after:
-            params["starting_after"] = starting_after
-        result = self._stripe().payment_methods.list(params)
-        return {
-            "has_more": result.has_more,
-            "payment_methods": [self._format_payment_method(pm) for pm in result.data],
-        }
-
-    def get_payment_method(self, payment_method_id: str) -> dict[str, Any]:
-        pm = self._stripe().payment_methods.retrieve(payment_method_id)
-        return self._format_payment_method(pm)
-
-    def detach_payment_method(self, payment_method_id: str) -> dict[str, Any]:
-        pm = self._stripe().payment_methods.detach(payment_method_id)
-        return self._format_payment_method(pm)
+        method = self._stripe().payment_methods.list_async
+        filters = {"customer": customer_id, "type": type_filter}
+        if auto_paginate:
+            return await self._page_all(
+                "payment_methods",
+                method,
+                self._format_payment_method,
+                limit,
+                starting_after,
+                **filters,
+            )
+        params = self._paged_params("payment_methods", limit, starting_after, **filters)
+        result = await self._call(method, params)
+        return self._page(
+            "payment_methods", result, [self._format_payment_method(pm) for pm in result.data]
+        )
+
+    async def get_payment_method(self, payment_method_id: str) -> dict[str, Any]:
+        return await self._retrieve(
+            "payment_method",
+            self._format_payment_method,
+            self._stripe().payment_methods.retrieve_async,
+            payment_method_id,
+        )
+
+    async def detach_payment_method(self, payment_method_id: str) -> dict[str, Any]:
+        pm = await self._call(self._stripe().payment_methods.detach_async, payment_method_id)
+        return self._remember("payment_method", self._format_payment_method(pm))
 
     def _format_payment_method(self, pm: Any) -> dict[str, Any]:
-        card = None
-        if pm.card:
-            card = {
-                "brand": pm.card.brand,
-                "last4": pm.card.last4,
-                "exp_month": pm.card.exp_month,
-                "exp_year": pm.card.exp_year,
-                "country": pm.card.country,
-            }
-        return {
-            "id": pm.id,
-            "type": pm.type,
-            "customer": pm.customer,
-            "card": card,
-            "created": pm.created,
-            "metadata": pm.metadata,
-        }
+        formatted = _payment_method_to_dict(pm)
+        formatted["card"] = _card_to_dict(pm.card) if pm.card else None
+        return formatted
 
 
 def register_tools(
@@ -1001,25 +1906,67 @@ def _get_api_key() -> str | dict[str, str]:
             ),
         }
 
+    # One client per API key, reused across tool calls. The key itself is
+    # looked up on every call so a rotated credential takes effect at once.
+    clients: dict[str, _StripeClient] = {}
+
     def _get_client() -> _StripeClient | dict[str, str]:
         """Get a Stripe client, or return an error dict if no credentials."""
         key = _get_api_key()
         if isinstance(key, dict):
             return key
-        return _StripeClient(key)
+        client = clients.get(key)
+        if client is None:
+            client = clients[key] = _StripeClient(key)
+        return client
 
     def _stripe_error(e: stripe.StripeError) -> dict[str, Any]:
-        return {"error": str(e)}
+        """Error dict for a failed Stripe call, with Stripe's code and HTTP status if set."""
+        error: dict[str, Any] = {"error": str(e)}
+        if e.code:
+            error["code"] = e.code
+        if e.http_status:
+            error["http_status"] = e.http_status
+        return error
+
+    def _with_client(
+        fn: Callable[..., Awaitable[dict[str, Any]]],
+    ) -> Callable[..., Awaitable[dict[str, Any]]]:
+        """Pass the Stripe client to ``fn`` and turn a StripeError into an error dict.
+
+        The wrapper's signature drops ``fn``'s leading ``client`` parameter, so
+        FastMCP only exposes the tool's own arguments.
+        """
+
+        @functools.wraps(fn)
+        async def wrapper(*args: Any, **kwargs: Any) -> dict[str, Any]:
+            client = _get_client()
+            if isinstance(client, dict):
+                return client
+            try:
+                return await fn(client, *args, **kwargs)
+            except stripe.StripeError as e:
+                return _stripe_error(e)
+
+        sig = inspect.signature(fn)
+        wrapper.__signature__ = sig.replace(  # type: ignore[attr-defined]
+            parameters=list(sig.parameters.values())[1:]
+        )
+        wrapper.__annotations__ = {k: v for k, v in fn.__annotations__.items() if k != "client"}
+        return wrapper
 
     # --- Customer Tools ---
 
     @mcp.tool()
-    def stripe_create_customer(
+    @_with_client
+    async def stripe_create_customer(
+        client: _StripeClient,
         email: str | None = None,
         name: str | None = None,
         phone: str | None = None,
         description: str | None = None,
         metadata: dict[str, str] | None = None,
+        idempotency_key: str | None = None,
     ) -> dict:
         """
         Create a new Stripe customer.
@@ -1030,6 +1977,8 @@ def stripe_create_customer(
             phone: Customer phone number
             description: Arbitrary description for the customer
             metadata: Key-value metadata to attach
+            idempotency_key: Reuse the same key when retrying this call so Stripe
+                performs the operation at most once
 
         Returns:
             Dict with customer details or error
@@ -1037,16 +1986,13 @@ def stripe_create_customer(
         Example:
             stripe_create_customer(email="alice@example.com", name="Alice Smith")
         """
-        client = _get_client()
-        if isinstance(client, dict):
-            return client
-        try:
-            return client.create_customer(email, name, phone, description, metadata)
-        except stripe.StripeError as e:
-            return _stripe_error(e)
+        return await client.create_customer(
+            email, name, phone, description, metadata, idempotency_key=idempotency_key
+        )
 
     @mcp.tool()
-    def stripe_get_customer(customer_id: str) -> dict:
+    @_with_client
+    async def stripe_get_customer(client: _StripeClient, customer_id: str) -> dict:
         """
         Retrieve a Stripe customer by ID.
 
@@ -1059,18 +2005,13 @@ def stripe_get_customer(customer_id: str) -> dict:
         Example:
             stripe_get_customer("cus_AbcDefGhijkLmn")
         """
-        client = _get_client()
-        if isinstance(client, dict):
-            return client
-        if not customer_id or not customer_id.startswith("cus_"):
-            return {"error": "Invalid customer_id. Must start with: cus_"}
-        try:
-            return client.get_customer(customer_id)
-        except stripe.StripeError as e:
-            return _stripe_error(e)
+        if err := _require_id(customer_id, "customer"):
+            return err
+        return await client.get_customer(customer_id)
 
     @mcp.tool()
-    def stripe_get_customer_by_email(email: str) -> dict:
+    @_with_client
+    async def stripe_get_customer_by_email(client: _StripeClient, email: str) -> dict:
         """
         Look up a Stripe customer by email address.
 
@@ -1083,18 +2024,14 @@ def stripe_get_customer_by_email(email: str) -> dict:
         Example:
             stripe_get_customer_by_email("alice@example.com")
         """
-        client = _get_client()
-        if isinstance(client, dict):
-            return client
         if not email or "@" not in email:
             return {"error": "Invalid email address"}
-        try:
-            return client.get_customer_by_email(email)
-        except stripe.StripeError as e:
-            return _stripe_error(e)
+        return await client.get_customer_by_email(email)
 
     @mcp.tool()
-    def stripe_update_customer(
+    @_with_client
+    async def stripe_update_customer(
+        client: _StripeClient,
         customer_id: str,
         email: str | None = None,
         name: str | None = None,
@@ -1119,29 +2056,27 @@ def stripe_update_customer(
         Example:
             stripe_update_customer("cus_AbcDefGhijkLmn", email="new@example.com")
         """
-        client = _get_client()
-        if isinstance(client, dict):
-            return client
-        if not customer_id or not customer_id.startswith("cus_"):
-            return {"error": "Invalid customer_id. Must start with: cus_"}
-        try:
-            return client.update_customer(customer_id, email, name, phone, description, metadata)
-        except stripe.StripeError as e:
-            return _stripe_error(e)
+        if err := _require_id(customer_id, "customer"):
+            return err
+        return await client.update_customer(customer_id, email, name, phone, description, metadata)
 
     @mcp.tool()
-    def stripe_list_customers(
+    @_with_client
+    async def stripe_list_customers(
+        client: _StripeClient,
         limit: int = 10,
         starting_after: str | None = None,
         email: str | None = None,
+        auto_paginate: bool = False,
     ) -> dict:
         """
         List Stripe customers with optional filters.
 
         Args:
-            limit: Number of customers to fetch (1-100, default 10)
-            starting_after: Cursor for pagination (last customer ID from previous page)
+            limit: Number of customers to fetch (1-100, default 10; 1-1000 with auto_paginate)
+            starting_after: Cursor for pagination (next_cursor or last customer ID)
             email: Filter by email address
+            auto_paginate: Follow pages on the server until limit customers are collected
 
         Returns:
             Dict with customer list or error
@@ -1149,18 +2084,39 @@ def stripe_list_customers(
         Example:
             stripe_list_customers(limit=20)
         """
-        client = _get_client()
-        if isinstance(client, dict):
-            return client
-        try:
-            return client.list_customers(limit, starting_after, email)
-        except stripe.StripeError as e:
-            return _stripe_error(e)
+        if err := _require_auto_page_limit(limit, auto_paginate):
+            return err
+        return await client.list_customers(limit, starting_after, email, auto_paginate)
+
+    @mcp.tool()
+    @_with_client
+    async def stripe_get_customer_overview(client: _StripeClient, customer_id: str) -> dict:
+        """
+        Retrieve a customer together with their subscriptions, invoices, and charges.
+
+        Prefer this over calling stripe_get_customer, stripe_list_subscriptions,
+        stripe_list_invoices, and stripe_list_charges one after another: the
+        lookups run concurrently in a single call. Each list holds up to the
+        100 most recent objects; "has_more" reports which lists were truncated.
+
+        Args:
+            customer_id: Stripe customer ID (e.g., "cus_AbcDefGhijkLmn")
+
+        Returns:
+            Dict with customer, subscriptions, invoices, charges, and has_more, or error
+
+        Example:
+            stripe_get_customer_overview("cus_AbcDefGhijkLmn")
+        """
+        if err := _require_id(customer_id, "customer"):
+            return err
+        return await client.get_customer_overview(customer_id)
 
     # --- Subscription Tools ---
 
     @mcp.tool()
-    def stripe_get_subscription(subscription_id: str) -> dict:
+    @_with_client
+    async def stripe_get_subscription(client: _StripeClient, subscription_id: str) -> dict:
         """
         Retrieve a Stripe subscription by ID.
 
@@ -1173,18 +2129,13 @@ def stripe_get_subscription(subscription_id: str) -> dict:
         Example:
             stripe_get_subscription("sub_AbcDefGhijkLmn")
         """
-        client = _get_client()
-        if isinstance(client, dict):
-            return client
-        if not subscription_id or not subscription_id.startswith("sub_"):
-            return {"error": "Invalid subscription_id. Must start with: sub_"}
-        try:
-            return client.get_subscription(subscription_id)
-        except stripe.StripeError as e:
-            return _stripe_error(e)
+        if err := _require_id(subscription_id, "subscription"):
+            return err
+        return await client.get_subscription(subscription_id)
 
     @mcp.tool()
-    def stripe_get_subscription_status(customer_id: str) -> dict:
+    @_with_client
+    async def stripe_get_subscription_status(client: _StripeClient, customer_id: str) -> dict:
         """
         Check the subscription status for a customer.
 
@@ -1197,22 +2148,19 @@ def stripe_get_subscription_status(customer_id: str) -> dict:
         Example:
             stripe_get_subscription_status("cus_AbcDefGhijkLmn")
         """
-        client = _get_client()
-        if isinstance(client, dict):
-            return client
-        if not customer_id or not customer_id.startswith("cus_"):
-            return {"error": "Invalid customer_id. Must start with: cus_"}
-        try:
-            return client.get_subscription_status(customer_id)
-        except stripe.StripeError as e:
-            return _stripe_error(e)
+        if err := _require_id(customer_id, "customer"):
+            return err
+        return await client.get_subscription_status(customer_id)
 
     @mcp.tool()
-    def stripe_list_subscriptions(
+    @_with_client
+    async def stripe_list_subscriptions(
+        client: _StripeClient,
         customer_id: str | None = None,
         status: str | None = None,
         limit: int = 10,
         starting_after: str | None = None,
+        auto_paginate: bool = False,
     ) -> dict:
         """
         List Stripe subscriptions with optional filters.
@@ -1220,8 +2168,9 @@ def stripe_list_subscriptions(
         Args:
             customer_id: Filter by customer ID
             status: Filter by status (active, past_due, canceled, etc.)
-            limit: Number of subscriptions to fetch (1-100, default 10)
-            starting_after: Cursor for pagination
+            limit: Number of subscriptions to fetch (1-100, default 10; 1-1000 with auto_paginate)
+            starting_after: Cursor for pagination (next_cursor from the previous page)
+            auto_paginate: Follow pages on the server until limit subscriptions are collected
 
         Returns:
             Dict with subscription list or error
@@ -1229,21 +2178,53 @@ def stripe_list_subscriptions(
         Example:
             stripe_list_subscriptions(status="active", limit=20)
         """
-        client = _get_client()
-        if isinstance(client, dict):
-            return client
-        try:
-            return client.list_subscriptions(customer_id, status, limit, starting_after)
-        except stripe.StripeError as e:
-            return _stripe_error(e)
+        if err := _require_auto_page_limit(limit, auto_paginate):
+            return err
+        return await client.list_subscriptions(
+            customer_id, status, limit, starting_after, auto_paginate
+        )
+
+    @mcp.tool()
+    @_with_client
+    async def stripe_list_all_subscriptions(
+        client: _StripeClient,
+        customer_id: str | None = None,
+        status: str | None = None,
+        max_results: int = 1000,
+    ) -> dict:
+        """
+        List every Stripe subscription matching the filters in one call.
+
+        Same as stripe_list_subscriptions with auto_paginate=True and
+        limit=max_results: pages are followed on the server, so there is no
+        need to loop with starting_after.
+
+        Args:
+            customer_id: Filter by customer ID
+            status: Filter by status (active, past_due, canceled, etc.)
+            max_results: Stop after this many subscriptions (1-1000, default 1000)
+
+        Returns:
+            Dict with subscription list, has_more (True if max_results was hit), and
+            next_cursor, or error
+
+        Example:
+            stripe_list_all_subscriptions(customer_id="cus_AbcDefGhijkLmn")
+        """
+        if not 1 <= max_results <= _AUTO_PAGE_MAX_RESULTS:
+            return {"error": f"max_results must be between 1 and {_AUTO_PAGE_MAX_RESULTS}"}
+        return await client.list_all_subscriptions(customer_id, status, max_results)
 
     @mcp.tool()
-    def stripe_create_subscription(
+    @_with_client
+    async def stripe_create_subscription(
+        client: _StripeClient,
         customer_id: str,
         price_id: str,
         quantity: int = 1,
         trial_period_days: int | None = None,
         metadata: dict[str, str] | None = None,
+        idempotency_key: str | None = None,
     ) -> dict:
         """
         Create a new subscription for a customer.
@@ -1254,6 +2235,8 @@ def stripe_create_subscription(
             quantity: Quantity of the price to subscribe to (default 1)
             trial_period_days: Number of trial days before billing begins
             metadata: Key-value metadata to attach
+            idempotency_key: Reuse the same key when retrying this call so Stripe
+                performs the operation at most once
 
         Returns:
             Dict with subscription details or error
@@ -1261,29 +2244,31 @@ def stripe_create_subscription(
         Example:
             stripe_create_subscription("cus_AbcDefGhijkLmn", "price_AbcDefGhijkLmn")
         """
-        client = _get_client()
-        if isinstance(client, dict):
-            return client
-        if not customer_id or not customer_id.startswith("cus_"):
-            return {"error": "Invalid customer_id. Must start with: cus_"}
-        if not price_id or not price_id.startswith("price_"):
-            return {"error": "Invalid price_id. Must start with: price_"}
+        if err := _require_id(customer_id, "customer"):
+            return err
+        if err := _require_id(price_id, "price"):
+            return err
         if quantity < 1:
             return {"error": "Quantity must be at least 1"}
-        try:
-            return client.create_subscription(
-                customer_id, price_id, quantity, trial_period_days, metadata
-            )
-        except stripe.StripeError as e:
-            return _stripe_error(e)
+        return await client.create_subscription(
+            customer_id,
+            price_id,
+            quantity,
+            trial_period_days,
+            metadata,
+            idempotency_key=idempotency_key,
+        )
 
     @mcp.tool()
-    def stripe_update_subscription(
+    @_with_client
+    async def stripe_update_subscription(
+        client: _StripeClient,
         subscription_id: str,
         price_id: str | None = None,
         quantity: int | None = None,
         metadata: dict[str, str] | None = None,
         cancel_at_period_end: bool | None = None,
+        subscription_item_id: str | None = None,
     ) -> dict:
         """
         Update an existing subscription.
@@ -1294,6 +2279,8 @@ def stripe_update_subscription(
             quantity: Updated quantity
             metadata: Updated key-value metadata
             cancel_at_period_end: If True, cancel at end of current billing period
+            subscription_item_id: Item to change (e.g., "si_AbcDefGhijkLmn"), as listed
+                in the subscription's "items". Defaults to the first item.
 
         Returns:
             Dict with updated subscription details or error
@@ -1301,20 +2288,25 @@ def stripe_update_subscription(
         Example:
             stripe_update_subscription("sub_AbcDefGhijkLmn", cancel_at_period_end=True)
         """
-        client = _get_client()
-        if isinstance(client, dict):
-            return client
-        if not subscription_id or not subscription_id.startswith("sub_"):
-            return {"error": "Invalid subscription_id. Must start with: sub_"}
-        try:
-            return client.update_subscription(
-                subscription_id, price_id, quantity, metadata, cancel_at_period_end
-            )
-        except stripe.StripeError as e:
-            return _stripe_error(e)
+        if err := _require_id(subscription_id, "subscription"):
+            return err
+        if subscription_item_id is not None and (
+            err := _require_id(subscription_item_id, "subscription_item")
+        ):
+            return err
+        return await client.update_subscription(
+            subscription_id,
+            price_id,
+            quantity,
+            metadata,
+            cancel_at_period_end,
+            subscription_item_id,
+        )
 
     @mcp.tool()
-    def stripe_cancel_subscription(
+    @_with_client
+    async def stripe_cancel_subscription(
+        client: _StripeClient,
         subscription_id: str,
         at_period_end: bool = False,
     ) -> dict:
@@ -1331,20 +2323,16 @@ def stripe_cancel_subscription(
         Example:
             stripe_cancel_subscription("sub_AbcDefGhijkLmn", at_period_end=True)
         """
-        client = _get_client()
-        if isinstance(client, dict):
-            return client
-        if not subscription_id or not subscription_id.startswith("sub_"):
-            return {"error": "Invalid subscription_id. Must start with: sub_"}
-        try:
-            return client.cancel_subscription(subscription_id, at_period_end)
-        except stripe.StripeError as e:
-            return _stripe_error(e)
+        if err := _require_id(subscription_id, "subscription"):
+            return err
+        return await client.cancel_subscription(subscription_id, at_period_end)
 
     # --- Payment Intent Tools ---
 
     @mcp.tool()
-    def stripe_create_payment_intent(
+    @_with_client
+    async def stripe_create_payment_intent(
+        client: _StripeClient,
         amount: int,
         currency: str,
         customer_id: str | None = None,
@@ -1352,6 +2340,7 @@ def stripe_create_payment_intent(
         payment_method_types: list[str] | None = None,
         metadata: dict[str, str] | None = None,
         receipt_email: str | None = None,
+        idempotency_key: str | None = None,
     ) -> dict:
         """
         Create a PaymentIntent to collect a payment.
@@ -1364,6 +2353,8 @@ def stripe_create_payment_intent(
             payment_method_types: List of payment method types (default ["card"])
             metadata: Key-value metadata to attach
             receipt_email: Email to send receipt to
+            idempotency_key: Reuse the same key when retrying this call so Stripe
+                performs the operation at most once
 
         Returns:
             Dict with payment intent details including client_secret or error
@@ -1371,28 +2362,24 @@ def stripe_create_payment_intent(
         Example:
             stripe_create_payment_intent(amount=2000, currency="usd", description="Order #123")
         """
-        client = _get_client()
-        if isinstance(client, dict):
-            return client
         if amount <= 0:
             return {"error": "Amount must be positive"}
-        if not currency or len(currency) != 3:
-            return {"error": "Currency must be a 3-letter ISO code (e.g., usd, inr)"}
-        try:
-            return client.create_payment_intent(
-                amount,
-                currency,
-                customer_id,
-                description,
-                payment_method_types,
-                metadata,
-                receipt_email,
-            )
-        except stripe.StripeError as e:
-            return _stripe_error(e)
+        if err := _require_currency(currency):
+            return err
+        return await client.create_payment_intent(
+            amount,
+            currency.lower(),
+            customer_id,
+            description,
+            payment_method_types,
+            metadata,
+            receipt_email,
+            idempotency_key=idempotency_key,
+        )
 
     @mcp.tool()
-    def stripe_get_payment_intent(payment_intent_id: str) -> dict:
+    @_with_client
+    async def stripe_get_payment_intent(client: _StripeClient, payment_intent_id: str) -> dict:
         """
         Retrieve a PaymentIntent by ID.
 
@@ -1405,18 +2392,14 @@ def stripe_get_payment_intent(payment_intent_id: str) -> dict:
         Example:
             stripe_get_payment_intent("pi_AbcDefGhijkLmn")
         """
-        client = _get_client()
-        if isinstance(client, dict):
-            return client
-        if not payment_intent_id or not payment_intent_id.startswith("pi_"):
-            return {"error": "Invalid payment_intent_id. Must start with: pi_"}
-        try:
-            return client.get_payment_intent(payment_intent_id)
-        except stripe.StripeError as e:
-            return _stripe_error(e)
+        if err := _require_id(payment_intent_id, "payment_intent"):
+            return err
+        return await client.get_payment_intent(payment_intent_id)
 
     @mcp.tool()
-    def stripe_confirm_payment_intent(
+    @_with_client
+    async def stripe_confirm_payment_intent(
+        client: _StripeClient,
         payment_intent_id: str,
         payment_method: str | None = None,
     ) -> dict:
@@ -1433,18 +2416,13 @@ def stripe_confirm_payment_intent(
         Example:
             stripe_confirm_payment_intent("pi_AbcDefGhijkLmn", payment_method="pm_card_visa")
         """
-        client = _get_client()
-        if isinstance(client, dict):
-            return client
-        if not payment_intent_id or not payment_intent_id.startswith("pi_"):
-            return {"error": "Invalid payment_intent_id. Must start with: pi_"}
-        try:
-            return client.confirm_payment_intent(payment_intent_id, payment_method)
-        except stripe.StripeError as e:
-            return _stripe_error(e)
+        if err := _require_id(payment_intent_id, "payment_intent"):
+            return err
+        return await client.confirm_payment_intent(payment_intent_id, payment_method)
 
     @mcp.tool()
-    def stripe_cancel_payment_intent(payment_intent_id: str) -> dict:
+    @_with_client
+    async def stripe_cancel_payment_intent(client: _StripeClient, payment_intent_id: str) -> dict:
         """
         Cancel a PaymentIntent.
 
@@ -1457,18 +2435,14 @@ def stripe_cancel_payment_intent(payment_intent_id: str) -> dict:
         Example:
             stripe_cancel_payment_intent("pi_AbcDefGhijkLmn")
         """
-        client = _get_client()
-        if isinstance(client, dict):
-            return client
-        if not payment_intent_id or not payment_intent_id.startswith("pi_"):
-            return {"error": "Invalid payment_intent_id. Must start with: pi_"}
-        try:
-            return client.cancel_payment_intent(payment_intent_id)
-        except stripe.StripeError as e:
-            return _stripe_error(e)
+        if err := _require_id(payment_intent_id, "payment_intent"):
+            return err
+        return await client.cancel_payment_intent(payment_intent_id)
 
     @mcp.tool()
-    def stripe_list_payment_intents(
+    @_with_client
+    async def stripe_list_payment_intents(
+        client: _StripeClient,
         customer_id: str | None = None,
         limit: int = 10,
         starting_after: str | None = None,
@@ -1479,7 +2453,7 @@ def stripe_list_payment_intents(
         Args:
             customer_id: Filter by customer ID
             limit: Number of payment intents to fetch (1-100, default 10)
-            starting_after: Cursor for pagination
+            starting_after: Cursor for pagination (next_cursor from the previous page)
 
         Returns:
             Dict with payment intent list or error
@@ -1487,22 +2461,20 @@ def stripe_list_payment_intents(
         Example:
             stripe_list_payment_intents(limit=20)
         """
-        client = _get_client()
-        if isinstance(client, dict):
-            return client
-        try:
-            return client.list_payment_intents(customer_id, limit, starting_after)
-        except stripe.StripeError as e:
-            return _stripe_error(e)
+        return await client.list_payment_intents(customer_id, limit, starting_after)
 
     # --- Charge Tools ---
 
     @mcp.tool()
-    def stripe_list_charges(
+    @_with_client
+    async def stripe_list_charges(
+        client: _StripeClient,
         customer_id: str | None = None,
         payment_intent_id: str | None = None,
         limit: int = 10,
         starting_after: str | None = None,
+        created_after: int | None = None,
+        auto_paginate: bool = False,
     ) -> dict:
         """
         List Stripe charges with optional filters.
@@ -1510,25 +2482,26 @@ def stripe_list_charges(
         Args:
             customer_id: Filter by customer ID
             payment_intent_id: Filter by payment intent ID
-            limit: Number of charges to fetch (1-100, default 10)
-            starting_after: Cursor for pagination
+            limit: Number of charges to fetch (1-100, default 10; 1-1000 with auto_paginate)
+            starting_after: Cursor for pagination (next_cursor from the previous page)
+            created_after: Only charges created after this Unix timestamp
+            auto_paginate: Follow pages on the server until limit charges are collected
 
         Returns:
             Dict with charge list or error
 
         Example:
-            stripe_list_charges(limit=20)
+            stripe_list_charges(created_after=1700000000, limit=500, auto_paginate=True)
         """
-        client = _get_client()
-        if isinstance(client, dict):
-            return client
-        try:
-            return client.list_charges(customer_id, payment_intent_id, limit, starting_after)
-        except stripe.StripeError as e:
-            return _stripe_error(e)
+        if err := _require_auto_page_limit(limit, auto_paginate):
+            return err
+        return await client.list_charges(
+            customer_id, payment_intent_id, limit, starting_after, created_after, auto_paginate
+        )
 
     @mcp.tool()
-    def stripe_get_charge(charge_id: str) -> dict:
+    @_with_client
+    async def stripe_get_charge(client: _StripeClient, charge_id: str) -> dict:
         """
         Retrieve a charge by ID.
 
@@ -1541,20 +2514,17 @@ def stripe_get_charge(charge_id: str) -> dict:
         Example:
             stripe_get_charge("ch_AbcDefGhijkLmn")
         """
-        client = _get_client()
-        if isinstance(client, dict):
-            return client
-        if not charge_id or not charge_id.startswith("ch_"):
-            return {"error": "Invalid charge_id. Must start with: ch_"}
-        try:
-            return client.get_charge(charge_id)
-        except stripe.StripeError as e:
-            return _stripe_error(e)
+        if err := _require_id(charge_id, "charge"):
+            return err
+        return await client.get_charge(charge_id)
 
     @mcp.tool()
-    def stripe_capture_charge(
+    @_with_client
+    async def stripe_capture_charge(
+        client: _StripeClient,
         charge_id: str,
         amount: int | None = None,
+        idempotency_key: str | None = None,
     ) -> dict:
         """
         Capture an uncaptured charge.
@@ -1562,6 +2532,8 @@ def stripe_capture_charge(
         Args:
             charge_id: Stripe charge ID (e.g., "ch_AbcDefGhijkLmn")
             amount: Amount to capture in smallest currency unit (omit to capture full amount)
+            idempotency_key: Reuse the same key when retrying this call so Stripe
+                performs the operation at most once
 
         Returns:
             Dict with captured charge details or error
@@ -1569,27 +2541,24 @@ def stripe_capture_charge(
         Example:
             stripe_capture_charge("ch_AbcDefGhijkLmn")
         """
-        client = _get_client()
-        if isinstance(client, dict):
-            return client
-        if not charge_id or not charge_id.startswith("ch_"):
-            return {"error": "Invalid charge_id. Must start with: ch_"}
+        if err := _require_id(charge_id, "charge"):
+            return err
         if amount is not None and amount <= 0:
             return {"error": "Amount must be positive"}
-        try:
-            return client.capture_charge(charge_id, amount)
-        except stripe.StripeError as e:
-            return _stripe_error(e)
+        return await client.capture_charge(charge_id, amount, idempotency_key=idempotency_key)
 
     # --- Refund Tools ---
 
     @mcp.tool()
-    def stripe_create_refund(
+    @_with_client
+    async def stripe_create_refund(
+        client: _StripeClient,
         charge_id: str | None = None,
         payment_intent_id: str | None = None,
         amount: int | None = None,
         reason: str | None = None,
         metadata: dict[str, str] | None = None,
+        idempotency_key: str | None = None,
     ) -> dict:
         """
         Create a full or partial refund.
@@ -1600,6 +2569,8 @@ def stripe_create_refund(
             amount: Amount to refund in smallest currency unit (omit for full refund)
             reason: Reason for refund (duplicate, fraudulent, customer_request)
             metadata: Key-value metadata to attach
+            idempotency_key: Reuse the same key when retrying this call so Stripe
+                performs the operation at most once
 
         Returns:
             Dict with refund details or error
@@ -1608,20 +2579,17 @@ def stripe_create_refund(
             stripe_create_refund(charge_id="ch_AbcDefGhijkLmn", amount=1000)
             stripe_create_refund(payment_intent_id="pi_AbcDefGhijkLmn", reason="customer_request")
         """
-        client = _get_client()
-        if isinstance(client, dict):
-            return client
         if not charge_id and not payment_intent_id:
             return {"error": "Either charge_id or payment_intent_id is required"}
         if amount is not None and amount <= 0:
             return {"error": "Refund amount must be positive"}
-        try:
-            return client.create_refund(charge_id, payment_intent_id, amount, reason, metadata)
-        except stripe.StripeError as e:
-            return _stripe_error(e)
+        return await client.create_refund(
+            charge_id, payment_intent_id, amount, reason, metadata, idempotency_key=idempotency_key
+        )
 
     @mcp.tool()
-    def stripe_get_refund(refund_id: str) -> dict:
+    @_with_client
+    async def stripe_get_refund(client: _StripeClient, refund_id: str) -> dict:
         """
         Retrieve a refund by ID.
 
@@ -1634,18 +2602,14 @@ def stripe_get_refund(refund_id: str) -> dict:
         Example:
             stripe_get_refund("re_AbcDefGhijkLmn")
         """
-        client = _get_client()
-        if isinstance(client, dict):
-            return client
-        if not refund_id or not refund_id.startswith("re_"):
-            return {"error": "Invalid refund_id. Must start with: re_"}
-        try:
-            return client.get_refund(refund_id)
-        except stripe.StripeError as e:
-            return _stripe_error(e)
+        if err := _require_id(refund_id, "refund"):
+            return err
+        return await client.get_refund(refund_id)
 
     @mcp.tool()
-    def stripe_list_refunds(
+    @_with_client
+    async def stripe_list_refunds(
+        client: _StripeClient,
         charge_id: str | None = None,
         payment_intent_id: str | None = None,
         limit: int = 10,
@@ -1658,7 +2622,7 @@ def stripe_list_refunds(
             charge_id: Filter by charge ID
             payment_intent_id: Filter by payment intent ID
             limit: Number of refunds to fetch (1-100, default 10)
-            starting_after: Cursor for pagination
+            starting_after: Cursor for pagination (next_cursor from the previous page)
 
         Returns:
             Dict with refund list or error
@@ -1666,23 +2630,21 @@ def stripe_list_refunds(
         Example:
             stripe_list_refunds(charge_id="ch_AbcDefGhijkLmn")
         """
-        client = _get_client()
-        if isinstance(client, dict):
-            return client
-        try:
-            return client.list_refunds(charge_id, payment_intent_id, limit, starting_after)
-        except stripe.StripeError as e:
-            return _stripe_error(e)
+        return await client.list_refunds(charge_id, payment_intent_id, limit, starting_after)
 
     # --- Invoice Tools ---
 
     @mcp.tool()
-    def stripe_list_invoices(
+    @_with_client
+    async def stripe_list_invoices(
+        client: _StripeClient,
         customer_id: str | None = None,
         status: str | None = None,
         subscription_id: str | None = None,
         limit: int = 10,
         starting_after: str | None = None,
+        auto_paginate: bool = False,
+        created_after: int | None = None,
     ) -> dict:
         """
         List Stripe invoices with optional filters.
@@ -1691,8 +2653,10 @@ def stripe_list_invoices(
             customer_id: Filter by customer ID
             status: Filter by status (draft, open, paid, uncollectible, void)
             subscription_id: Filter by subscription ID
-            limit: Number of invoices to fetch (1-100, default 10)
-            starting_after: Cursor for pagination
+            limit: Number of invoices to fetch (1-100, default 10; 1-1000 with auto_paginate)
+            starting_after: Cursor for pagination (next_cursor from the previous page)
+            auto_paginate: Follow pages on the server until limit invoices are collected
+            created_after: Only invoices created after this Unix timestamp
 
         Returns:
             Dict with invoice list or error
@@ -1700,16 +2664,21 @@ def stripe_list_invoices(
         Example:
             stripe_list_invoices(status="open", limit=20)
         """
-        client = _get_client()
-        if isinstance(client, dict):
-            return client
-        try:
-            return client.list_invoices(customer_id, status, subscription_id, limit, starting_after)
-        except stripe.StripeError as e:
-            return _stripe_error(e)
+        if err := _require_auto_page_limit(limit, auto_paginate):
+            return err
+        return await client.list_invoices(
+            customer_id,
+            status,
+            subscription_id,
+            limit,
+            starting_after,
+            auto_paginate,
+            created_after,
+        )
 
     @mcp.tool()
-    def stripe_get_invoice(invoice_id: str) -> dict:
+    @_with_client
+    async def stripe_get_invoice(client: _StripeClient, invoice_id: str) -> dict:
         """
         Retrieve an invoice by ID.
 
@@ -1722,24 +2691,21 @@ def stripe_get_invoice(invoice_id: str) -> dict:
         Example:
             stripe_get_invoice("in_AbcDefGhijkLmn")
         """
-        client = _get_client()
-        if isinstance(client, dict):
-            return client
-        if not invoice_id or not invoice_id.startswith("in_"):
-            return {"error": "Invalid invoice_id. Must start with: in_"}
-        try:
-            return client.get_invoice(invoice_id)
-        except stripe.StripeError as e:
-            return _stripe_error(e)
+        if err := _require_id(invoice_id, "invoice"):
+            return err
+        return await client.get_invoice(invoice_id)
 
     @mcp.tool()
-    def stripe_create_invoice(
+    @_with_client
+    async def stripe_create_invoice(
+        client: _StripeClient,
         customer_id: str,
         description: str | None = None,
         auto_advance: bool = True,
         collection_method: str = "charge_automatically",
         days_until_due: int | None = None,
         metadata: dict[str, str] | None = None,
+        idempotency_key: str | None = None,
     ) -> dict:
         """
         Create a new invoice for a customer.
@@ -1752,6 +2718,8 @@ def stripe_create_invoice(
               (default "charge_automatically")
             days_until_due: Days until invoice is due (required for send_invoice)
             metadata: Key-value metadata to attach
+            idempotency_key: Reuse the same key when retrying this call so Stripe
+                performs the operation at most once
 
         Returns:
             Dict with invoice details or error
@@ -1760,25 +2728,21 @@ def stripe_create_invoice(
             stripe_create_invoice("cus_AbcDefGhijkLmn", collection_method="send_invoice",
             days_until_due=30)
         """
-        client = _get_client()
-        if isinstance(client, dict):
-            return client
-        if not customer_id or not customer_id.startswith("cus_"):
-            return {"error": "Invalid customer_id. Must start with: cus_"}
-        try:
-            return client.create_invoice(
-                customer_id,
-                description,
-                auto_advance,
-                collection_method,
-                days_until_due,
-                metadata,
-            )
-        except stripe.StripeError as e:
-            return _stripe_error(e)
+        if err := _require_id(customer_id, "customer"):
+            return err
+        return await client.create_invoice(
+            customer_id,
+            description,
+            auto_advance,
+            collection_method,
+            days_until_due,
+            metadata,
+            idempotency_key=idempotency_key,
+        )
 
     @mcp.tool()
-    def stripe_finalize_invoice(invoice_id: str) -> dict:
+    @_with_client
+    async def stripe_finalize_invoice(client: _StripeClient, invoice_id: str) -> dict:
         """
         Finalize a draft invoice, moving it to open status.
 
@@ -1791,18 +2755,13 @@ def stripe_finalize_invoice(invoice_id: str) -> dict:
         Example:
             stripe_finalize_invoice("in_AbcDefGhijkLmn")
         """
-        client = _get_client()
-        if isinstance(client, dict):
-            return client
-        if not invoice_id or not invoice_id.startswith("in_"):
-            return {"error": "Invalid invoice_id. Must start with: in_"}
-        try:
-            return client.finalize_invoice(invoice_id)
-        except stripe.StripeError as e:
-            return _stripe_error(e)
+        if err := _require_id(invoice_id, "invoice"):
+            return err
+        return await client.finalize_invoice(invoice_id)
 
     @mcp.tool()
-    def stripe_pay_invoice(invoice_id: str) -> dict:
+    @_with_client
+    async def stripe_pay_invoice(client: _StripeClient, invoice_id: str) -> dict:
         """
         Attempt to pay an open invoice immediately.
 
@@ -1815,18 +2774,13 @@ def stripe_pay_invoice(invoice_id: str) -> dict:
         Example:
             stripe_pay_invoice("in_AbcDefGhijkLmn")
         """
-        client = _get_client()
-        if isinstance(client, dict):
-            return client
-        if not invoice_id or not invoice_id.startswith("in_"):
-            return {"error": "Invalid invoice_id. Must start with: in_"}
-        try:
-            return client.pay_invoice(invoice_id)
-        except stripe.StripeError as e:
-            return _stripe_error(e)
+        if err := _require_id(invoice_id, "invoice"):
+            return err
+        return await client.pay_invoice(invoice_id)
 
     @mcp.tool()
-    def stripe_void_invoice(invoice_id: str) -> dict:
+    @_with_client
+    async def stripe_void_invoice(client: _StripeClient, invoice_id: str) -> dict:
         """
         Void an open invoice, marking it uncollectible.
 
@@ -1839,26 +2793,23 @@ def stripe_void_invoice(invoice_id: str) -> dict:
         Example:
             stripe_void_invoice("in_AbcDefGhijkLmn")
         """
-        client = _get_client()
-        if isinstance(client, dict):
-            return client
-        if not invoice_id or not invoice_id.startswith("in_"):
-            return {"error": "Invalid invoice_id. Must start with: in_"}
-        try:
-            return client.void_invoice(invoice_id)
-        except stripe.StripeError as e:
-            return _stripe_error(e)
+        if err := _require_id(invoice_id, "invoice"):
+            return err
+        return await client.void_invoice(invoice_id)
 
     # --- Invoice Item Tools ---
 
     @mcp.tool()
-    def stripe_create_invoice_item(
+    @_with_client
+    async def stripe_create_invoice_item(
+        client: _StripeClient,
         customer_id: str,
         amount: int,
         currency: str,
         description: str | None = None,
         invoice_id: str | None = None,
         metadata: dict[str, str] | None = None,
+        idempotency_key: str | None = None,
     ) -> dict:
         """
         Add a line item to an existing or upcoming invoice.
@@ -1870,6 +2821,8 @@ def stripe_create_invoice_item(
             description: Description of the line item
             invoice_id: Specific invoice to add item to (omit for upcoming invoice)
             metadata: Key-value metadata to attach
+            idempotency_key: Reuse the same key when retrying this call so Stripe
+                performs the operation at most once
 
         Returns:
             Dict with invoice item details or error
@@ -1878,28 +2831,31 @@ def stripe_create_invoice_item(
             stripe_create_invoice_item("cus_AbcDefGhijkLmn", amount=1500, currency="usd",
               description="Setup fee")
         """
-        client = _get_client()
-        if isinstance(client, dict):
-            return client
-        if not customer_id or not customer_id.startswith("cus_"):
-            return {"error": "Invalid customer_id. Must start with: cus_"}
+        if err := _require_id(customer_id, "customer"):
+            return err
         if amount == 0:
             return {"error": "Amount must be non-zero"}
-        if not currency or len(currency) != 3:
-            return {"error": "Currency must be a 3-letter ISO code (e.g., usd)"}
-        try:
-            return client.create_invoice_item(
-                customer_id, amount, currency, description, invoice_id, metadata
-            )
-        except stripe.StripeError as e:
-            return _stripe_error(e)
+        if err := _require_currency(currency):
+            return err
+        return await client.create_invoice_item(
+            customer_id,
+            amount,
+            currency.lower(),
+            description,
+            invoice_id,
+            metadata,
+            idempotency_key=idempotency_key,
+        )
 
     @mcp.tool()
-    def stripe_list_invoice_items(
+    @_with_client
+    async def stripe_list_invoice_items(
+        client: _StripeClient,
         customer_id: str | None = None,
         invoice_id: str | None = None,
         limit: int = 10,
         starting_after: str | None = None,
+        auto_paginate: bool = False,
     ) -> dict:
         """
         List invoice items with optional filters.
@@ -1907,8 +2863,9 @@ def stripe_list_invoice_items(
         Args:
             customer_id: Filter by customer ID
             invoice_id: Filter by invoice ID
-            limit: Number of items to fetch (1-100, default 10)
-            starting_after: Cursor for pagination
+            limit: Number of items to fetch (1-100, default 10; 1-1000 with auto_paginate)
+            starting_after: Cursor for pagination (next_cursor from the previous page)
+            auto_paginate: Follow pages on the server until limit items are collected
 
         Returns:
             Dict with invoice item list or error
@@ -1916,16 +2873,15 @@ def stripe_list_invoice_items(
         Example:
             stripe_list_invoice_items(customer_id="cus_AbcDefGhijkLmn")
         """
-        client = _get_client()
-        if isinstance(client, dict):
-            return client
-        try:
-            return client.list_invoice_items(customer_id, invoice_id, limit, starting_after)
-        except stripe.StripeError as e:
-            return _stripe_error(e)
+        if err := _require_auto_page_limit(limit, auto_paginate):
+            return err
+        return await client.list_invoice_items(
+            customer_id, invoice_id, limit, starting_after, auto_paginate
+        )
 
     @mcp.tool()
-    def stripe_delete_invoice_item(invoice_item_id: str) -> dict:
+    @_with_client
+    async def stripe_delete_invoice_item(client: _StripeClient, invoice_item_id: str) -> dict:
         """
         Delete a pending invoice item.
 
@@ -1938,24 +2894,21 @@ def stripe_delete_invoice_item(invoice_item_id: str) -> dict:
         Example:
             stripe_delete_invoice_item("ii_AbcDefGhijkLmn")
         """
-        client = _get_client()
-        if isinstance(client, dict):
-            return client
-        if not invoice_item_id or not invoice_item_id.startswith("ii_"):
-            return {"error": "Invalid invoice_item_id. Must start with: ii_"}
-        try:
-            return client.delete_invoice_item(invoice_item_id)
-        except stripe.StripeError as e:
-            return _stripe_error(e)
+        if err := _require_id(invoice_item_id, "invoice_item"):
+            return err
+        return await client.delete_invoice_item(invoice_item_id)
 
     # --- Product Tools ---
 
     @mcp.tool()
-    def stripe_create_product(
+    @_with_client
+    async def stripe_create_product(
+        client: _StripeClient,
         name: str,
         description: str | None = None,
         active: bool = True,
         metadata: dict[str, str] | None = None,
+        idempotency_key: str | None = None,
     ) -> dict:
         """
         Create a new Stripe product.
@@ -1965,6 +2918,8 @@ def stripe_create_product(
             description: Product description
             active: Whether the product is available (default True)
             metadata: Key-value metadata to attach
+            idempotency_key: Reuse the same key when retrying this call so Stripe
+                performs the operation at most once
 
         Returns:
             Dict with product details or error
@@ -1972,18 +2927,15 @@ def stripe_create_product(
         Example:
             stripe_create_product(name="Premium Plan", description="Full access subscription")
         """
-        client = _get_client()
-        if isinstance(client, dict):
-            return client
         if not name:
             return {"error": "Product name is required"}
-        try:
-            return client.create_product(name, description, active, metadata)
-        except stripe.StripeError as e:
-            return _stripe_error(e)
+        return await client.create_product(
+            name, description, active, metadata, idempotency_key=idempotency_key
+        )
 
     @mcp.tool()
-    def stripe_get_product(product_id: str) -> dict:
+    @_with_client
+    async def stripe_get_product(client: _StripeClient, product_id: str) -> dict:
         """
         Retrieve a product by ID.
 
@@ -1996,29 +2948,49 @@ def stripe_get_product(product_id: str) -> dict:
         Example:
             stripe_get_product("prod_AbcDefGhijkLmn")
         """
-        client = _get_client()
-        if isinstance(client, dict):
-            return client
-        if not product_id or not product_id.startswith("prod_"):
-            return {"error": "Invalid product_id. Must start with: prod_"}
-        try:
-            return client.get_product(product_id)
-        except stripe.StripeError as e:
-            return _stripe_error(e)
+        if err := _require_id(product_id, "product"):
+            return err
+        return await client.get_product(product_id)
 
     @mcp.tool()
-    def stripe_list_products(
+    @_with_client
+    async def stripe_get_products_bulk(client: _StripeClient, product_ids: list[str]) -> dict:
+        """
+        Retrieve up to 100 products by ID in a single Stripe request.
+
+        Args:
+            product_ids: Stripe product IDs (e.g., ["prod_AbcDefGhijkLmn", "prod_XyzDefGhijkLmn"])
+
+        Returns:
+            Dict with the products found and a not_found list of unknown IDs, or error
+
+        Example:
+            stripe_get_products_bulk(["prod_AbcDefGhijkLmn", "prod_XyzDefGhijkLmn"])
+        """
+        if not product_ids or len(product_ids) > 100:
+            return {"error": "product_ids must contain between 1 and 100 IDs"}
+        for product_id in product_ids:
+            if err := _require_id(product_id, "product"):
+                return err
+        return await client.get_products(product_ids)
+
+    @mcp.tool()
+    @_with_client
+    async def stripe_list_products(
+        client: _StripeClient,
         active: bool | None = None,
         limit: int = 10,
         starting_after: str | None = None,
+        auto_paginate: bool = False,
     ) -> dict:
         """
         List Stripe products with optional filters.
 
         Args:
             active: Filter by active status
-            limit: Number of products to fetch (1-100, default 10)
-            starting_after: Cursor for pagination
+            limit: Number of products to fetch (1-100, default 10; 1-1000 with auto_paginate)
+            starting_after: Cursor for pagination (next_cursor from the previous page)
+            auto_paginate: Follow pages on the server until limit products are collected
 
         Returns:
             Dict with product list or error
@@ -2026,16 +2998,14 @@ def stripe_list_products(
         Example:
             stripe_list_products(active=True, limit=20)
         """
-        client = _get_client()
-        if isinstance(client, dict):
-            return client
-        try:
-            return client.list_products(active, limit, starting_after)
-        except stripe.StripeError as e:
-            return _stripe_error(e)
+        if err := _require_auto_page_limit(limit, auto_paginate):
+            return err
+        return await client.list_products(active, limit, starting_after, auto_paginate)
 
     @mcp.tool()
-    def stripe_update_product(
+    @_with_client
+    async def stripe_update_product(
+        client: _StripeClient,
         product_id: str,
         name: str | None = None,
         description: str | None = None,
@@ -2058,20 +3028,16 @@ def stripe_update_product(
         Example:
             stripe_update_product("prod_AbcDefGhijkLmn", name="Premium Plan v2")
         """
-        client = _get_client()
-        if isinstance(client, dict):
-            return client
-        if not product_id or not product_id.startswith("prod_"):
-            return {"error": "Invalid product_id. Must start with: prod_"}
-        try:
-            return client.update_product(product_id, name, description, active, metadata)
-        except stripe.StripeError as e:
-            return _stripe_error(e)
+        if err := _require_id(product_id, "product"):
+            return err
+        return await client.update_product(product_id, name, description, active, metadata)
 
     # --- Price Tools ---
 
     @mcp.tool()
-    def stripe_create_price(
+    @_with_client
+    async def stripe_create_price(
+        client: _StripeClient,
         unit_amount: int,
         currency: str,
         product_id: str,
@@ -2079,6 +3045,7 @@ def stripe_create_price(
         recurring_interval_count: int | None = None,
         nickname: str | None = None,
         metadata: dict[str, str] | None = None,
+        idempotency_key: str | None = None,
     ) -> dict:
         """
         Create a price for a product.
@@ -2091,6 +3058,8 @@ def stripe_create_price(
             recurring_interval_count: Number of intervals between billing cycles
             nickname: Friendly label for the price
             metadata: Key-value metadata to attach
+            idempotency_key: Reuse the same key when retrying this call so Stripe
+                performs the operation at most once
 
         Returns:
             Dict with price details or error
@@ -2099,30 +3068,77 @@ def stripe_create_price(
             stripe_create_price(unit_amount=999, currency="usd", product_id="prod_AbcDefGhijkLmn",
               recurring_interval="month")
         """
-        client = _get_client()
-        if isinstance(client, dict):
-            return client
         if unit_amount <= 0:
             return {"error": "unit_amount must be positive"}
-        if not currency or len(currency) != 3:
-            return {"error": "Currency must be a 3-letter ISO code (e.g., usd)"}
-        if not product_id or not product_id.startswith("prod_"):
-            return {"error": "Invalid product_id. Must start with: prod_"}
-        try:
-            return client.create_price(
-                unit_amount,
-                currency,
-                product_id,
-                recurring_interval,
-                recurring_interval_count,
-                nickname,
-                metadata,
-            )
-        except stripe.StripeError as e:
-            return _stripe_error(e)
+        if err := _require_currency(currency):
+            return err
+        if err := _require_id(product_id, "product"):
+            return err
+        return await client.create_price(
+            unit_amount,
+            currency.lower(),
+            product_id,
+            recurring_interval,
+            recurring_interval_count,
+            nickname,
+            metadata,
+            idempotency_key=idempotency_key,
+        )
 
     @mcp.tool()
-    def stripe_get_price(price_id: str) -> dict:
+    @_with_client
+    async def stripe_create_product_with_price(
+        client: _StripeClient,
+        name: str,
+        unit_amount: int,
+        currency: str,
+        description: str | None = None,
+        recurring_interval: str | None = None,
+        recurring_interval_count: int | None = None,
+        metadata: dict[str, str] | None = None,
+        idempotency_key: str | None = None,
+    ) -> dict:
+        """
+        Create a product together with its default price in one Stripe request.
+
+        Args:
+            name: Product name
+            unit_amount: Amount in smallest currency unit (e.g., cents for USD)
+            currency: ISO 4217 currency code (e.g., "usd")
+            description: Product description
+            recurring_interval: Billing interval for subscriptions (day, week, month, year)
+            recurring_interval_count: Number of intervals between billing cycles
+            metadata: Key-value metadata to attach to the product
+            idempotency_key: Reuse the same key when retrying this call so Stripe
+                performs the operation at most once
+
+        Returns:
+            Dict with the created product and price, or error
+
+        Example:
+            stripe_create_product_with_price(name="Premium Plan", unit_amount=999, currency="usd",
+              recurring_interval="month")
+        """
+        if not name:
+            return {"error": "Product name is required"}
+        if unit_amount <= 0:
+            return {"error": "unit_amount must be positive"}
+        if err := _require_currency(currency):
+            return err
+        return await client.create_product_with_price(
+            name,
+            unit_amount,
+            currency.lower(),
+            description,
+            recurring_interval,
+            recurring_interval_count,
+            metadata,
+            idempotency_key=idempotency_key,
+        )
+
+    @mcp.tool()
+    @_with_client
+    async def stripe_get_price(client: _StripeClient, price_id: str) -> dict:
         """
         Retrieve a price by ID.
 
@@ -2135,22 +3151,43 @@ def stripe_get_price(price_id: str) -> dict:
         Example:
             stripe_get_price("price_AbcDefGhijkLmn")
         """
-        client = _get_client()
-        if isinstance(client, dict):
-            return client
-        if not price_id or not price_id.startswith("price_"):
-            return {"error": "Invalid price_id. Must start with: price_"}
-        try:
-            return client.get_price(price_id)
-        except stripe.StripeError as e:
-            return _stripe_error(e)
+        if err := _require_id(price_id, "price"):
+            return err
+        return await client.get_price(price_id)
+
+    @mcp.tool()
+    @_with_client
+    async def stripe_get_prices_bulk(client: _StripeClient, price_ids: list[str]) -> dict:
+        """
+        Retrieve up to 100 prices by ID in one call.
+
+        Cached prices are returned without a request; the rest are fetched concurrently.
+
+        Args:
+            price_ids: Stripe price IDs (e.g., ["price_AbcDefGhijkLmn", "price_XyzDefGhijkLmn"])
+
+        Returns:
+            Dict with the prices found and a not_found list of unknown IDs, or error
+
+        Example:
+            stripe_get_prices_bulk(["price_AbcDefGhijkLmn", "price_XyzDefGhijkLmn"])
+        """
+        if not price_ids or len(price_ids) > 100:
+            return {"error": "price_ids must contain between 1 and 100 IDs"}
+        for price_id in price_ids:
+            if err := _require_id(price_id, "price"):
+                return err
+        return await client.get_prices(price_ids)
 
     @mcp.tool()
-    def stripe_list_prices(
+    @_with_client
+    async def stripe_list_prices(
+        client: _StripeClient,
         product_id: str | None = None,
         active: bool | None = None,
         limit: int = 10,
         starting_after: str | None = None,
+        auto_paginate: bool = False,
     ) -> dict:
         """
         List Stripe prices with optional filters.
@@ -2158,8 +3195,9 @@ def stripe_list_prices(
         Args:
             product_id: Filter by product ID
             active: Filter by active status
-            limit: Number of prices to fetch (1-100, default 10)
-            starting_after: Cursor for pagination
+            limit: Number of prices to fetch (1-100, default 10; 1-1000 with auto_paginate)
+            starting_after: Cursor for pagination (next_cursor from the previous page)
+            auto_paginate: Follow pages on the server until limit prices are collected
 
         Returns:
             Dict with price list or error
@@ -2167,16 +3205,14 @@ def stripe_list_prices(
         Example:
             stripe_list_prices(product_id="prod_AbcDefGhijkLmn")
         """
-        client = _get_client()
-        if isinstance(client, dict):
-            return client
-        try:
-            return client.list_prices(product_id, active, limit, starting_after)
-        except stripe.StripeError as e:
-            return _stripe_error(e)
+        if err := _require_auto_page_limit(limit, auto_paginate):
+            return err
+        return await client.list_prices(product_id, active, limit, starting_after, auto_paginate)
 
     @mcp.tool()
-    def stripe_update_price(
+    @_with_client
+    async def stripe_update_price(
+        client: _StripeClient,
         price_id: str,
         active: bool | None = None,
         nickname: str | None = None,
@@ -2197,23 +3233,20 @@ def stripe_update_price(
         Example:
             stripe_update_price("price_AbcDefGhijkLmn", active=False)
         """
-        client = _get_client()
-        if isinstance(client, dict):
-            return client
-        if not price_id or not price_id.startswith("price_"):
-            return {"error": "Invalid price_id. Must start with: price_"}
-        try:
-            return client.update_price(price_id, active, nickname, metadata)
-        except stripe.StripeError as e:
-            return _stripe_error(e)
+        if err := _require_id(price_id, "price"):
+            return err
+        return await client.update_price(price_id, active, nickname, metadata)
 
     # --- Payment Link Tools ---
 
     @mcp.tool()
-    def stripe_create_payment_link(
+    @_with_client
+    async def stripe_create_payment_link(
+        client: _StripeClient,
         price_id: str,
         quantity: int = 1,
         metadata: dict[str, str] | None = None,
+        idempotency_key: str | None = None,
     ) -> dict:
         """
         Create a shareable payment link for a price.
@@ -2222,6 +3255,8 @@ def stripe_create_payment_link(
             price_id: Stripe price ID (e.g., "price_AbcDefGhijkLmn")
             quantity: Quantity of the price to include (default 1)
             metadata: Key-value metadata to attach
+            idempotency_key: Reuse the same key when retrying this call so Stripe
+                performs the operation at most once
 
         Returns:
             Dict with payment link details including URL or error
@@ -2229,20 +3264,17 @@ def stripe_create_payment_link(
         Example:
             stripe_create_payment_link("price_AbcDefGhijkLmn", quantity=1)
         """
-        client = _get_client()
-        if isinstance(client, dict):
-            return client
-        if not price_id or not price_id.startswith("price_"):
-            return {"error": "Invalid price_id. Must start with: price_"}
+        if err := _require_id(price_id, "price"):
+            return err
         if quantity < 1:
             return {"error": "Quantity must be at least 1"}
-        try:
-            return client.create_payment_link(price_id, quantity, metadata)
-        except stripe.StripeError as e:
-            return _stripe_error(e)
+        return await client.create_payment_link(
+            price_id, quantity, metadata, idempotency_key=idempotency_key
+        )
 
     @mcp.tool()
-    def stripe_get_payment_link(payment_link_id: str) -> dict:
+    @_with_client
+    async def stripe_get_payment_link(client: _StripeClient, payment_link_id: str) -> dict:
         """
         Retrieve a payment link by ID.
 
@@ -2255,29 +3287,27 @@ def stripe_get_payment_link(payment_link_id: str) -> dict:
         Example:
             stripe_get_payment_link("plink_AbcDefGhijkLmn")
         """
-        client = _get_client()
-        if isinstance(client, dict):
-            return client
-        if not payment_link_id or not payment_link_id.startswith("plink_"):
-            return {"error": "Invalid payment_link_id. Must start with: plink_"}
-        try:
-            return client.get_payment_link(payment_link_id)
-        except stripe.StripeError as e:
-            return _stripe_error(e)
+        if err := _require_id(payment_link_id, "payment_link"):
+            return err
+        return await client.get_payment_link(payment_link_id)
 
     @mcp.tool()
-    def stripe_list_payment_links(
+    @_with_client
+    async def stripe_list_payment_links(
+        client: _StripeClient,
         active: bool | None = None,
         limit: int = 10,
         starting_after: str | None = None,
+        auto_paginate: bool = False,
     ) -> dict:
         """
         List payment links with optional filters.
 
         Args:
             active: Filter by active status
-            limit: Number of payment links to fetch (1-100, default 10)
-            starting_after: Cursor for pagination
+            limit: Number of payment links to fetch (1-100, default 10; 1-1000 with auto_paginate)
+            starting_after: Cursor for pagination (next_cursor from the previous page)
+            auto_paginate: Follow pages on the server until limit payment links are collected
 
         Returns:
             Dict with payment link list or error
@@ -2285,18 +3315,16 @@ def stripe_list_payment_links(
         Example:
             stripe_list_payment_links(active=True)
         """
-        client = _get_client()
-        if isinstance(client, dict):
-            return client
-        try:
-            return client.list_payment_links(active, limit, starting_after)
-        except stripe.StripeError as e:
-            return _stripe_error(e)
+        if err := _require_auto_page_limit(limit, auto_paginate):
+            return err
+        return await client.list_payment_links(active, limit, starting_after, auto_paginate)
 
     # --- Coupon Tools ---
 
     @mcp.tool()
-    def stripe_create_coupon(
+    @_with_client
+    async def stripe_create_coupon(
+        client: _StripeClient,
         percent_off: float | None = None,
         amount_off: int | None = None,
         currency: str | None = None,
@@ -2305,6 +3333,7 @@ def stripe_create_coupon(
         name: str | None = None,
         max_redemptions: int | None = None,
         metadata: dict[str, str] | None = None,
+        idempotency_key: str | None = None,
     ) -> dict:
         """
         Create a discount coupon.
@@ -2318,6 +3347,8 @@ def stripe_create_coupon(
             name: Friendly name for the coupon
             max_redemptions: Maximum number of times the coupon can be redeemed
             metadata: Key-value metadata to attach
+            idempotency_key: Reuse the same key when retrying this call so Stripe
+                performs the operation at most once
 
         Returns:
             Dict with coupon details or error
@@ -2325,44 +3356,45 @@ def stripe_create_coupon(
         Example:
             stripe_create_coupon(percent_off=20.0, duration="once", name="WELCOME20")
         """
-        client = _get_client()
-        if isinstance(client, dict):
-            return client
         if percent_off is None and amount_off is None:
             return {"error": "Either percent_off or amount_off is required"}
         if percent_off is not None and amount_off is not None:
             return {"error": "Only one of percent_off or amount_off can be specified"}
         if amount_off is not None and not currency:
             return {"error": "currency is required when using amount_off"}
+        if currency is not None and (err := _require_currency(currency)):
+            return err
         if duration not in ("once", "repeating", "forever"):
             return {"error": "duration must be one of: once, repeating, forever"}
         if duration == "repeating" and duration_in_months is None:
             return {"error": "duration_in_months is required when duration is repeating"}
-        try:
-            return client.create_coupon(
-                percent_off,
-                amount_off,
-                currency,
-                duration,
-                duration_in_months,
-                name,
-                max_redemptions,
-                metadata,
-            )
-        except stripe.StripeError as e:
-            return _stripe_error(e)
+        return await client.create_coupon(
+            percent_off,
+            amount_off,
+            currency.lower() if currency else None,
+            duration,
+            duration_in_months,
+            name,
+            max_redemptions,
+            metadata,
+            idempotency_key=idempotency_key,
+        )
 
     @mcp.tool()
-    def stripe_list_coupons(
+    @_with_client
+    async def stripe_list_coupons(
+        client: _StripeClient,
         limit: int = 10,
         starting_after: str | None = None,
+        auto_paginate: bool = False,
     ) -> dict:
         """
         List all coupons.
 
         Args:
-            limit: Number of coupons to fetch (1-100, default 10)
-            starting_after: Cursor for pagination
+            limit: Number of coupons to fetch (1-100, default 10; 1-1000 with auto_paginate)
+            starting_after: Cursor for pagination (next_cursor from the previous page)
+            auto_paginate: Follow pages on the server until limit coupons are collected
 
         Returns:
             Dict with coupon list or error
@@ -2370,16 +3402,13 @@ def stripe_list_coupons(
         Example:
             stripe_list_coupons(limit=20)
         """
-        client = _get_client()
-        if isinstance(client, dict):
-            return client
-        try:
-            return client.list_coupons(limit, starting_after)
-        except stripe.StripeError as e:
-            return _stripe_error(e)
+        if err := _require_auto_page_limit(limit, auto_paginate):
+            return err
+        return await client.list_coupons(limit, starting_after, auto_paginate)
 
     @mcp.tool()
-    def stripe_delete_coupon(coupon_id: str) -> dict:
+    @_with_client
+    async def stripe_delete_coupon(client: _StripeClient, coupon_id: str) -> dict:
         """
         Delete a coupon.
 
@@ -2392,20 +3421,15 @@ def stripe_delete_coupon(coupon_id: str) -> dict:
         Example:
             stripe_delete_coupon("WELCOME20")
         """
-        client = _get_client()
-        if isinstance(client, dict):
-            return client
         if not coupon_id:
             return {"error": "coupon_id is required"}
-        try:
-            return client.delete_coupon(coupon_id)
-        except stripe.StripeError as e:
-            return _stripe_error(e)
+        return await client.delete_coupon(coupon_id)
 
     # --- Balance Tools ---
 
     @mcp.tool()
-    def stripe_get_balance() -> dict:
+    @_with_client
+    async def stripe_get_balance(client: _StripeClient) -> dict:
         """
         Retrieve the current account balance.
 
@@ -2415,27 +3439,27 @@ def stripe_get_balance() -> dict:
         Example:
             stripe_get_balance()
         """
-        client = _get_client()
-        if isinstance(client, dict):
-            return client
-        try:
-            return client.get_balance()
-        except stripe.StripeError as e:
-            return _stripe_error(e)
+        return await client.get_balance()
 
     @mcp.tool()
-    def stripe_list_balance_transactions(
+    @_with_client
+    async def stripe_list_balance_transactions(
+        client: _StripeClient,
         type_filter: str | None = None,
         limit: int = 10,
         starting_after: str | None = None,
+        created_after: int | None = None,
+        auto_paginate: bool = False,
     ) -> dict:
         """
         List balance transactions (payouts, charges, refunds, etc.).
 
         Args:
             type_filter: Filter by type (charge, refund, payout, payment, etc.)
-            limit: Number of transactions to fetch (1-100, default 10)
-            starting_after: Cursor for pagination
+            limit: Number of transactions to fetch (1-100, default 10; 1-1000 with auto_paginate)
+            starting_after: Cursor for pagination (next_cursor from the previous page)
+            created_after: Only transactions created after this Unix timestamp
+            auto_paginate: Follow pages on the server until limit transactions are collected
 
         Returns:
             Dict with transaction list or error
@@ -2443,27 +3467,29 @@ def stripe_list_balance_transactions(
         Example:
             stripe_list_balance_transactions(type_filter="charge", limit=20)
         """
-        client = _get_client()
-        if isinstance(client, dict):
-            return client
-        try:
-            return client.list_balance_transactions(type_filter, limit, starting_after)
-        except stripe.StripeError as e:
-            return _stripe_error(e)
+        if err := _require_auto_page_limit(limit, auto_paginate):
+            return err
+        return await client.list_balance_transactions(
+            type_filter, limit, starting_after, created_after, auto_paginate
+        )
 
     # --- Webhook Endpoint Tools ---
 
     @mcp.tool()
-    def stripe_list_webhook_endpoints(
+    @_with_client
+    async def stripe_list_webhook_endpoints(
+        client: _StripeClient,
         limit: int = 10,
         starting_after: str | None = None,
+        auto_paginate: bool = False,
     ) -> dict:
         """
         List all configured webhook endpoints.
 
         Args:
-            limit: Number of endpoints to fetch (1-100, default 10)
-            starting_after: Cursor for pagination
+            limit: Number of endpoints to fetch (1-100, default 10; 1-1000 with auto_paginate)
+            starting_after: Cursor for pagination (next_cursor from the previous page)
+            auto_paginate: Follow pages on the server until limit endpoints are collected
 
         Returns:
             Dict with webhook endpoint list or error
@@ -2471,22 +3497,54 @@ def stripe_list_webhook_endpoints(
         Example:
             stripe_list_webhook_endpoints()
         """
-        client = _get_client()
-        if isinstance(client, dict):
-            return client
+        if err := _require_auto_page_limit(limit, auto_paginate):
+            return err
+        return await client.list_webhook_endpoints(limit, starting_after, auto_paginate)
+
+    @mcp.tool()
+    async def stripe_webhook_ingest(payload: str, signature: str) -> dict:
+        """
+        Verify a Stripe webhook delivery and drop any cached copy of the object it reports on.
+
+        Args:
+            payload: Raw request body exactly as Stripe sent it
+            signature: Value of the Stripe-Signature header
+
+        Returns:
+            Dict with the event ID, type, and whether a cache entry was invalidated, or error
+
+        Example:
+            stripe_webhook_ingest(payload=body, signature=headers["Stripe-Signature"])
+        """
+        secret = os.getenv("STRIPE_WEBHOOK_SECRET")
+        if not secret:
+            return {
+                "error": "Stripe webhook secret not configured",
+                "help": "Set STRIPE_WEBHOOK_SECRET to the endpoint's signing secret (whsec_...)",
+            }
         try:
-            return client.list_webhook_endpoints(limit, starting_after)
+            event = stripe.Webhook.construct_event(payload, signature, secret)
+        except ValueError:
+            return {"error": "Invalid webhook payload"}
         except stripe.StripeError as e:
             return _stripe_error(e)
+        return {
+            "id": event.id,
+            "type": event.type,
+            "invalidated": _StripeClient.invalidate(event),
+        }
 
     # --- Payment Method Tools ---
 
     @mcp.tool()
-    def stripe_list_payment_methods(
+    @_with_client
+    async def stripe_list_payment_methods(
+        client: _StripeClient,
         customer_id: str,
         type_filter: str = "card",
         limit: int = 10,
         starting_after: str | None = None,
+        auto_paginate: bool = False,
     ) -> dict:
         """
         List payment methods attached to a customer.
@@ -2494,8 +3552,9 @@ def stripe_list_payment_methods(
         Args:
             customer_id: Stripe customer ID (e.g., "cus_AbcDefGhijkLmn")
             type_filter: Payment method type to list (default "card")
-            limit: Number of payment methods to fetch (1-100, default 10)
-            starting_after: Cursor for pagination
+            limit: Number of payment methods to fetch (1-100, default 10; 1-1000 with auto_paginate)
+            starting_after: Cursor for pagination (next_cursor from the previous page)
+            auto_paginate: Follow pages on the server until limit payment methods are collected
 
         Returns:
             Dict with payment method list or error
@@ -2503,18 +3562,17 @@ def stripe_list_payment_methods(
         Example:
             stripe_list_payment_methods("cus_AbcDefGhijkLmn")
         """
-        client = _get_client()
-        if isinstance(client, dict):
-            return client
-        if not customer_id or not customer_id.startswith("cus_"):
-            return {"error": "Invalid customer_id. Must start with: cus_"}
-        try:
-            return client.list_payment_methods(customer_id, type_filter, limit, starting_after)
-        except stripe.StripeError as e:
-            return _stripe_error(e)
+        if err := _require_id(customer_id, "customer"):
+            return err
+        if err := _require_auto_page_limit(limit, auto_paginate):
+            return err
+        return await client.list_payment_methods(
+            customer_id, type_filter, limit, starting_after, auto_paginate
+        )
 
     @mcp.tool()
-    def stripe_get_payment_method(payment_method_id: str) -> dict:
+    @_with_client
+    async def stripe_get_payment_method(client: _StripeClient, payment_method_id: str) -> dict:
         """
         Retrieve a payment method by ID.
 
@@ -2527,18 +3585,13 @@ def stripe_get_payment_method(payment_method_id: str) -> dict:
         Example:
             stripe_get_payment_method("pm_AbcDefGhijkLmn")
         """
-        client = _get_client()
-        if isinstance(client, dict):
-            return client
-        if not payment_method_id or not payment_method_id.startswith("pm_"):
-            return {"error": "Invalid payment_method_id. Must start with: pm_"}
-        try:
-            return client.get_payment_method(payment_method_id)
-        except stripe.StripeError as e:
-            return _stripe_error(e)
+        if err := _require_id(payment_method_id, "payment_method"):
+            return err
+        return await client.get_payment_method(payment_method_id)
 
     @mcp.tool()
-    def stripe_detach_payment_method(payment_method_id: str) -> dict:
+    @_with_client
+    async def stripe_detach_payment_method(client: _StripeClient, payment_method_id: str) -> dict:
         """
         Detach a payment method from its customer.
 
@@ -2551,12 +3604,6 @@ def stripe_detach_payment_method(payment_method_id: str) -> dict:
         Example:
             stripe_detach_payment_method("pm_AbcDefGhijkLmn")
         """
-        client = _get_client()
-        if isinstance(client, dict):
-            return client
-        if not payment_method_id or not payment_method_id.startswith("pm_"):
-            return {"error": "Invalid payment_method_id. Must start with: pm_"}
-        try:
-            return client.detach_payment_method(payment_method_id)
-        except stripe.StripeError as e:
-            return _stripe_error(e)
+        if err := _require_id(payment_method_id, "payment_method"):
+            return err
+        return await client.detach_payment_method(payment_method_id)
@@ -95,7 +95,7 @@ class TestMissingCredentialsError:
         _CRED_TOOL_ENTRIES,
         ids=_CRED_TOOL_IDS,
     )
-    def test_missing_credentials_returns_error_and_help(
+    async def test_missing_credentials_returns_error_and_help(
         self, spec_name: str, tool_name: str, monkeypatch: pytest.MonkeyPatch
     ):
         """Calling a tool without credentials returns {error, help}."""
@@ -113,6 +113,8 @@ def test_missing_credentials_returns_error_and_help(
         args = get_minimal_args(fn)
 
         result = fn(**args)
+        if inspect.isawaitable(result):
+            result = await result
 
         assert isinstance(result, dict), (
             f"Tool '{tool_name}' should return a dict, got {type(result)}"
@@ -138,7 +140,7 @@ class TestMissingRequiredParams:
         _CRED_TOOL_ENTRIES,
         ids=_CRED_TOOL_IDS,
     )
-    def test_missing_required_params_returns_error(
+    async def test_missing_required_params_returns_error(
         self, spec_name: str, tool_name: str, monkeypatch: pytest.MonkeyPatch
     ):
         """Calling a tool with no args raises TypeError or returns error dict."""
@@ -161,6 +163,8 @@ def test_missing_required_params_returns_error(
         # Calling with no args should fail
         try:
             result = fn()
+            if inspect.isawaitable(result):
+                result = await result
             # If it returns (doesn't raise), it should be an error dict
             if isinstance(result, dict):
                 assert "error" in result, (
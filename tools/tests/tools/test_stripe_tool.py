@@ -7,19 +7,27 @@
   balance, webhook endpoint, and payment method operations)
 - Error handling (StripeError, invalid credentials, missing credentials)
 - Credential retrieval (CredentialStoreAdapter vs env var)
-- All 52 MCP tool functions
+- All 57 MCP tool functions
 - Input validation
 """
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock, patch
+import asyncio
+import hashlib
+import hmac
+import json
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 import stripe
+from fastmcp import FastMCP
 
 from aden_tools.tools.stripe_tool.stripe_tool import (
+    _get_http_client,
     _StripeClient,
+    _TokenBucket,
     register_tools,
 )
 
@@ -28,6 +36,20 @@
 # ---------------------------------------------------------------------------
 
 
+@pytest.fixture(autouse=True)
+def _clear_stripe_caches():
+    """Isolate tests from the process-wide Stripe read caches."""
+    _StripeClient._price_cache.clear()
+    _StripeClient._product_cache.clear()
+    _StripeClient._sub_item_cache.clear()
+    _StripeClient._read_cache.clear()
+    _StripeClient._list_cache.clear()
+    _StripeClient._prefetched_keys.clear()
+    _StripeClient._rate_limiters.clear()
+    _StripeClient._inflight.clear()
+    _StripeClient._concurrency_limits.clear()
+
+
 def _make_stripe_list(items: list, has_more: bool = False):
     """Return a mock object that looks like a stripe ListObject."""
     obj = MagicMock()
@@ -308,20 +330,20 @@ def setup_method(self):
         self.client = _StripeClient("sk_test_key123")
 
     def _mock_stripe(self):
-        return MagicMock()
+        return AsyncMock()
 
-    def test_create_customer(self):
+    async def test_create_customer(self):
         sc = self._mock_stripe()
-        sc.customers.create.return_value = _customer()
+        sc.customers.create_async.return_value = _customer()
         with patch.object(self.client, "_client", sc):
-            result = self.client.create_customer(
+            result = await self.client.create_customer(
                 email="test@example.com",
                 name="Test User",
                 phone="+10000000000",
                 description="desc",
                 metadata={"key": "val"},
             )
-        sc.customers.create.assert_called_once_with(
+        sc.customers.create_async.assert_called_once_with(
             {
                 "email": "test@example.com",
                 "name": "Test User",
@@ -333,168 +355,428 @@ def test_create_customer(self):
         assert result["id"] == "cus_test123"
         assert result["email"] == "test@example.com"
 
-    def test_create_customer_minimal(self):
+    async def test_create_customer_minimal(self):
         sc = self._mock_stripe()
-        sc.customers.create.return_value = _customer(email=None, name=None)
+        sc.customers.create_async.return_value = _customer(email=None, name=None)
         with patch.object(self.client, "_client", sc):
-            self.client.create_customer()
-        call_args = sc.customers.create.call_args[0][0]
+            await self.client.create_customer()
+        call_args = sc.customers.create_async.call_args[0][0]
         assert "email" not in call_args
         assert "name" not in call_args
 
-    def test_get_customer(self):
+    async def test_create_customer_idempotency_key(self):
         sc = self._mock_stripe()
-        sc.customers.retrieve.return_value = _customer()
+        sc.customers.create_async.return_value = _customer()
         with patch.object(self.client, "_client", sc):
-            result = self.client.get_customer("cus_test123")
-        sc.customers.retrieve.assert_called_once_with("cus_test123")
+            await self.client.create_customer(email="test@example.com", idempotency_key="key-1")
+        sc.customers.create_async.assert_called_once_with(
+            {"email": "test@example.com"}, {"idempotency_key": "key-1"}
+        )
+
+    async def test_get_customer(self):
+        sc = self._mock_stripe()
+        sc.customers.retrieve_async.return_value = _customer()
+        with patch.object(self.client, "_client", sc):
+            result = await self.client.get_customer("cus_test123")
+        sc.customers.retrieve_async.assert_called_once_with("cus_test123")
         assert result["id"] == "cus_test123"
 
-    def test_get_customer_by_email_found(self):
+    async def test_get_customer_served_from_read_cache(self):
+        sc = self._mock_stripe()
+        sc.customers.retrieve_async.return_value = _customer()
+        with patch.object(self.client, "_client", sc):
+            await self.client.get_customer("cus_test123")
+            result = await self.client.get_customer("cus_test123")
+        sc.customers.retrieve_async.assert_called_once_with("cus_test123")
+        assert result["id"] == "cus_test123"
+
+    async def test_read_cache_scoped_to_api_key(self):
+        other = _StripeClient("sk_test_other")
+        sc = self._mock_stripe()
+        sc.customers.retrieve_async.return_value = _customer()
+        with patch.object(self.client, "_client", sc), patch.object(other, "_client", sc):
+            await self.client.get_customer("cus_test123")
+            await other.get_customer("cus_test123")
+        assert sc.customers.retrieve_async.call_count == 2
+
+    async def test_update_customer_refreshes_read_cache(self):
+        sc = self._mock_stripe()
+        sc.customers.retrieve_async.return_value = _customer()
+        sc.customers.update_async.return_value = _customer(name="Renamed")
+        with patch.object(self.client, "_client", sc):
+            await self.client.get_customer("cus_test123")
+            await self.client.update_customer("cus_test123", name="Renamed")
+            result = await self.client.get_customer("cus_test123")
+        sc.customers.retrieve_async.assert_called_once()
+        assert result["name"] == "Renamed"
+
+    def test_format_customer_copies_metadata_to_plain_dict(self):
+        customer = stripe.Customer.construct_from(
+            {
+                "id": "cus_test123",
+                "email": None,
+                "name": None,
+                "phone": None,
+                "description": None,
+                "created": 1700000000,
+                "currency": None,
+                "delinquent": False,
+                "metadata": {"plan": "pro"},
+            },
+            "sk_test_key123",
+        )
+        result = self.client._format_customer(customer)
+        assert type(result["metadata"]) is dict
+        assert result["metadata"] == {"plan": "pro"}
+
+    async def test_concurrent_get_customer_shares_one_request(self):
+        async def slow_retrieve(*args):
+            await asyncio.sleep(0.01)
+            return _customer()
+
+        sc = self._mock_stripe()
+        sc.customers.retrieve_async.side_effect = slow_retrieve
+        other = _StripeClient("sk_test_key123")
+        with patch.object(self.client, "_client", sc), patch.object(other, "_client", sc):
+            results = await asyncio.gather(
+                self.client.get_customer("cus_test123"),
+                other.get_customer("cus_test123"),
+                self.client.get_customer("cus_test123"),
+            )
+        sc.customers.retrieve_async.assert_called_once_with("cus_test123")
+        assert all(r["id"] == "cus_test123" for r in results)
+        assert _StripeClient._inflight[asyncio.get_running_loop()] == {}
+
+    async def test_concurrent_get_customer_shares_error(self):
+        async def failing_retrieve(*args):
+            await asyncio.sleep(0.01)
+            raise stripe.InvalidRequestError("No such customer", param="id")
+
+        sc = self._mock_stripe()
+        sc.customers.retrieve_async.side_effect = failing_retrieve
+        with patch.object(self.client, "_client", sc):
+            results = await asyncio.gather(
+                self.client.get_customer("cus_test123"),
+                self.client.get_customer("cus_test123"),
+                return_exceptions=True,
+            )
+        sc.customers.retrieve_async.assert_called_once()
+        assert all(isinstance(r, stripe.InvalidRequestError) for r in results)
+
+    async def test_get_customer_overview(self):
+        sc = self._mock_stripe()
+        sc.customers.retrieve_async.return_value = _customer(
+            subscriptions=_make_stripe_list([_subscription()])
+        )
+        sc.invoices.list_async.return_value = _make_stripe_list([_invoice()], has_more=True)
+        sc.charges.list_async.return_value = _make_stripe_list([])
+        with patch.object(self.client, "_client", sc):
+            result = await self.client.get_customer_overview("cus_test123")
+        sc.customers.retrieve_async.assert_called_once_with(
+            "cus_test123", {"expand": ["subscriptions"]}
+        )
+        sc.subscriptions.list_async.assert_not_called()
+        for svc in (sc.invoices, sc.charges):
+            svc.list_async.assert_called_once_with({"customer": "cus_test123", "limit": 100})
+        assert result["customer"]["id"] == "cus_test123"
+        assert result["subscriptions"][0]["id"] == "sub_test123"
+        assert len(result["invoices"]) == 1
+        assert result["charges"] == []
+        assert result["has_more"] == {
+            "subscriptions": False,
+            "invoices": True,
+            "charges": False,
+        }
+
+    async def test_get_customer_overview_lists_subscriptions_past_embedded_page(self):
+        sc = self._mock_stripe()
+        sc.customers.retrieve_async.return_value = _customer(
+            subscriptions=_make_stripe_list([_subscription()], has_more=True)
+        )
+        sc.subscriptions.list_async.return_value = _make_stripe_list(
+            [_subscription(), _subscription(id="sub_456")]
+        )
+        sc.invoices.list_async.return_value = _make_stripe_list([])
+        sc.charges.list_async.return_value = _make_stripe_list([])
+        with patch.object(self.client, "_client", sc):
+            result = await self.client.get_customer_overview("cus_test123")
+        sc.subscriptions.list_async.assert_called_once_with(
+            {"customer": "cus_test123", "limit": 100}
+        )
+        assert len(result["subscriptions"]) == 2
+
+    async def test_get_customer_overview_runs_concurrently(self):
+        in_flight = 0
+        peak = 0
+
+        async def slow(*args, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return _make_stripe_list([])
+
+        async def slow_customer(*args, **kwargs):
+            await slow()
+            return _customer(subscriptions=_make_stripe_list([]))
+
         sc = self._mock_stripe()
-        sc.customers.list.return_value = _make_stripe_list([_customer()])
+        sc.customers.retrieve_async.side_effect = slow_customer
+        sc.invoices.list_async.side_effect = slow
+        sc.charges.list_async.side_effect = slow
         with patch.object(self.client, "_client", sc):
-            result = self.client.get_customer_by_email("test@example.com")
-        sc.customers.list.assert_called_once_with({"email": "test@example.com", "limit": 1})
+            await self.client.get_customer_overview("cus_test123")
+        assert peak == 3
+
+    async def test_get_customer_by_email_found(self):
+        sc = self._mock_stripe()
+        sc.customers.list_async.return_value = _make_stripe_list([_customer()])
+        with patch.object(self.client, "_client", sc):
+            result = await self.client.get_customer_by_email("test@example.com")
+        sc.customers.list_async.assert_called_once_with({"email": "test@example.com", "limit": 1})
         assert result["id"] == "cus_test123"
 
-    def test_get_customer_by_email_not_found(self):
+    async def test_get_customer_by_email_not_found(self):
         sc = self._mock_stripe()
-        sc.customers.list.return_value = _make_stripe_list([])
+        sc.customers.list_async.return_value = _make_stripe_list([])
         with patch.object(self.client, "_client", sc):
-            result = self.client.get_customer_by_email("nobody@example.com")
+            result = await self.client.get_customer_by_email("nobody@example.com")
         assert "error" in result
         assert "nobody@example.com" in result["error"]
 
-    def test_update_customer(self):
+    async def test_update_customer(self):
         sc = self._mock_stripe()
-        sc.customers.update.return_value = _customer(name="Updated Name")
+        sc.customers.update_async.return_value = _customer(name="Updated Name")
         with patch.object(self.client, "_client", sc):
-            result = self.client.update_customer("cus_test123", name="Updated Name")
-        sc.customers.update.assert_called_once_with("cus_test123", {"name": "Updated Name"})
+            result = await self.client.update_customer("cus_test123", name="Updated Name")
+        sc.customers.update_async.assert_called_once_with("cus_test123", {"name": "Updated Name"})
         assert result["name"] == "Updated Name"
 
-    def test_list_customers(self):
+    async def test_update_customer_sends_empty_values(self):
         sc = self._mock_stripe()
-        sc.customers.list.return_value = _make_stripe_list([_customer(), _customer(id="cus_456")])
+        sc.customers.update_async.return_value = _customer(description=None, metadata={})
         with patch.object(self.client, "_client", sc):
-            result = self.client.list_customers(limit=10)
+            await self.client.update_customer("cus_test123", description="", metadata={})
+        sc.customers.update_async.assert_called_once_with(
+            "cus_test123", {"description": "", "metadata": {}}
+        )
+
+    async def test_list_customers(self):
+        sc = self._mock_stripe()
+        sc.customers.list_async.return_value = _make_stripe_list(
+            [_customer(), _customer(id="cus_456")]
+        )
+        with patch.object(self.client, "_client", sc):
+            result = await self.client.list_customers(limit=10)
         assert len(result["customers"]) == 2
         assert result["has_more"] is False
 
-    def test_list_customers_limit_capped(self):
+    async def test_list_customers_limit_capped(self):
         sc = self._mock_stripe()
-        sc.customers.list.return_value = _make_stripe_list([])
+        sc.customers.list_async.return_value = _make_stripe_list([])
         with patch.object(self.client, "_client", sc):
-            self.client.list_customers(limit=500)
-        call_params = sc.customers.list.call_args[0][0]
+            await self.client.list_customers(limit=500)
+        call_params = sc.customers.list_async.call_args[0][0]
         assert call_params["limit"] == 100
 
+    async def test_list_customers_ignores_empty_filter(self):
+        sc = self._mock_stripe()
+        sc.customers.list_async.return_value = _make_stripe_list([])
+        with patch.object(self.client, "_client", sc):
+            await self.client.list_customers(email="")
+        assert sc.customers.list_async.call_args[0][0] == {"limit": 10}
+
+    async def test_list_customers_auto_paginate(self):
+        sc = self._mock_stripe()
+        customers = [_customer(id=f"cus_{i}") for i in range(5)]
+        sc.customers.list_async.return_value = _make_stripe_list(customers, has_more=True)
+        with patch.object(self.client, "_client", sc):
+            result = await self.client.list_customers(
+                limit=3, email="test@example.com", auto_paginate=True
+            )
+        assert sc.customers.list_async.call_args[0][0] == {
+            "email": "test@example.com",
+            "limit": 3,
+        }
+        assert [c["id"] for c in result["customers"]] == ["cus_0", "cus_1", "cus_2"]
+        assert result["has_more"] is True
+        assert result["next_cursor"] is not None
+
+    async def test_list_customers_auto_paginate_follows_pages(self):
+        sc = self._mock_stripe()
+        sc.customers.list_async.side_effect = [
+            _make_stripe_list([_customer(id=f"cus_{i}") for i in range(100)], has_more=True),
+            _make_stripe_list([_customer(id="cus_100")]),
+        ]
+        with patch.object(self.client, "_client", sc):
+            result = await self.client.list_customers(limit=150, auto_paginate=True)
+        first, second = (c[0][0] for c in sc.customers.list_async.call_args_list)
+        assert first == {"limit": 100}
+        assert second == {"limit": 50, "starting_after": "cus_99"}
+        assert len(result["customers"]) == 101
+        assert result["has_more"] is False
+
 
 class TestStripeClientSubscriptions:
     def setup_method(self):
         self.client = _StripeClient("sk_test_key123")
 
     def _mock_stripe(self):
-        return MagicMock()
+        return AsyncMock()
 
-    def test_get_subscription(self):
+    async def test_get_subscription(self):
         sc = self._mock_stripe()
-        sc.subscriptions.retrieve.return_value = _subscription()
+        sc.subscriptions.retrieve_async.return_value = _subscription()
         with patch.object(self.client, "_client", sc):
-            result = self.client.get_subscription("sub_test123")
-        sc.subscriptions.retrieve.assert_called_once_with("sub_test123")
+            result = await self.client.get_subscription("sub_test123")
+        sc.subscriptions.retrieve_async.assert_called_once_with("sub_test123")
         assert result["id"] == "sub_test123"
         assert result["status"] == "active"
 
-    def test_get_subscription_status_active(self):
+    async def test_get_subscription_status_active(self):
         sc = self._mock_stripe()
-        sc.subscriptions.list.return_value = _make_stripe_list([_subscription()])
+        sc.subscriptions.list_async.return_value = _make_stripe_list([_subscription()])
         with patch.object(self.client, "_client", sc):
-            result = self.client.get_subscription_status("cus_test123")
+            result = await self.client.get_subscription_status("cus_test123")
         assert result["status"] == "active"
         assert result["customer_id"] == "cus_test123"
         assert len(result["subscriptions"]) == 1
 
-    def test_get_subscription_status_no_subscription(self):
+    async def test_get_subscription_status_no_subscription(self):
         sc = self._mock_stripe()
-        sc.subscriptions.list.return_value = _make_stripe_list([])
+        sc.subscriptions.list_async.return_value = _make_stripe_list([])
         with patch.object(self.client, "_client", sc):
-            result = self.client.get_subscription_status("cus_test123")
+            result = await self.client.get_subscription_status("cus_test123")
         assert result["status"] == "no_subscription"
         assert result["subscriptions"] == []
 
-    def test_list_subscriptions(self):
+    async def test_list_subscriptions(self):
         sc = self._mock_stripe()
-        sc.subscriptions.list.return_value = _make_stripe_list([_subscription()])
+        sc.subscriptions.list_async.return_value = _make_stripe_list([_subscription()])
         with patch.object(self.client, "_client", sc):
-            result = self.client.list_subscriptions(customer_id="cus_test123", status="active")
-        call_params = sc.subscriptions.list.call_args[0][0]
+            result = await self.client.list_subscriptions(
+                customer_id="cus_test123", status="active"
+            )
+        call_params = sc.subscriptions.list_async.call_args[0][0]
         assert call_params["customer"] == "cus_test123"
         assert call_params["status"] == "active"
         assert len(result["subscriptions"]) == 1
 
-    def test_create_subscription(self):
+    async def test_list_all_subscriptions(self):
         sc = self._mock_stripe()
-        sc.subscriptions.create.return_value = _subscription()
+        subs = [_subscription(id=f"sub_{i}") for i in range(150)]
+        sc.subscriptions.list_async.return_value = _make_stripe_list(subs)
         with patch.object(self.client, "_client", sc):
-            result = self.client.create_subscription(
+            result = await self.client.list_all_subscriptions(customer_id="cus_test123")
+        sc.subscriptions.list_async.assert_called_once_with(
+            {"limit": 100, "customer": "cus_test123"}
+        )
+        assert len(result["subscriptions"]) == 150
+        assert result["has_more"] is False
+
+    async def test_list_all_subscriptions_max_results(self):
+        sc = self._mock_stripe()
+        subs = [_subscription(id=f"sub_{i}") for i in range(5)]
+        sc.subscriptions.list_async.return_value = _make_stripe_list(subs)
+        with patch.object(self.client, "_client", sc):
+            result = await self.client.list_all_subscriptions(max_results=3)
+        assert [s["id"] for s in result["subscriptions"]] == ["sub_0", "sub_1", "sub_2"]
+        assert result["has_more"] is True
+        assert result["next_cursor"] is not None
+
+    async def test_create_subscription(self):
+        sc = self._mock_stripe()
+        sc.subscriptions.create_async.return_value = _subscription()
+        with patch.object(self.client, "_client", sc):
+            result = await self.client.create_subscription(
                 "cus_test123",
                 "price_test123",
                 quantity=1,
                 trial_period_days=14,
             )
-        call_params = sc.subscriptions.create.call_args[0][0]
+        call_params = sc.subscriptions.create_async.call_args[0][0]
         assert call_params["customer"] == "cus_test123"
         assert call_params["items"][0]["price"] == "price_test123"
         assert call_params["trial_period_days"] == 14
         assert result["id"] == "sub_test123"
 
-    def test_update_subscription_metadata(self):
+    async def test_update_subscription_metadata(self):
         sc = self._mock_stripe()
-        sc.subscriptions.update.return_value = _subscription()
+        sc.subscriptions.update_async.return_value = _subscription()
         with patch.object(self.client, "_client", sc):
-            self.client.update_subscription(
+            await self.client.update_subscription(
                 "sub_test123", metadata={"note": "updated"}, cancel_at_period_end=True
             )
-        call_params = sc.subscriptions.update.call_args[0][1]
+        call_params = sc.subscriptions.update_async.call_args[0][1]
         assert call_params["cancel_at_period_end"] is True
         assert call_params["metadata"] == {"note": "updated"}
 
-    def test_update_subscription_quantity_only(self):
+    async def test_update_subscription_quantity_only(self):
         sc = self._mock_stripe()
-        sc.subscriptions.retrieve.return_value = _subscription()
-        sc.subscriptions.update.return_value = _subscription()
+        sc.subscriptions.retrieve_async.return_value = _subscription()
+        sc.subscriptions.update_async.return_value = _subscription()
         with patch.object(self.client, "_client", sc):
-            self.client.update_subscription("sub_test123", quantity=3)
-        call_params = sc.subscriptions.update.call_args[0][1]
+            await self.client.update_subscription("sub_test123", quantity=3)
+        call_params = sc.subscriptions.update_async.call_args[0][1]
         assert call_params["items"][0]["quantity"] == 3
         assert "price" not in call_params["items"][0]
 
-    def test_update_subscription_no_items_returns_error(self):
+    async def test_update_subscription_with_item_id_skips_retrieve(self):
+        sc = self._mock_stripe()
+        sc.subscriptions.update_async.return_value = _subscription()
+        with patch.object(self.client, "_client", sc):
+            await self.client.update_subscription(
+                "sub_test123", price_id="price_new", subscription_item_id="si_other"
+            )
+        sc.subscriptions.retrieve_async.assert_not_called()
+        call_params = sc.subscriptions.update_async.call_args[0][1]
+        assert call_params["items"] == [{"id": "si_other", "price": "price_new"}]
+
+    async def test_update_subscription_uses_cached_item_id(self):
+        sc = self._mock_stripe()
+        sc.subscriptions.list_async.return_value = _make_stripe_list([_subscription()])
+        sc.subscriptions.update_async.return_value = _subscription()
+        with patch.object(self.client, "_client", sc):
+            await self.client.list_subscriptions(customer_id="cus_test123")
+            await self.client.update_subscription("sub_test123", quantity=2)
+        sc.subscriptions.retrieve_async.assert_not_called()
+        call_params = sc.subscriptions.update_async.call_args[0][1]
+        assert call_params["items"] == [{"id": "si_test123", "quantity": 2}]
+
+    async def test_update_subscription_item_cache_scoped_to_api_key(self):
+        sc = self._mock_stripe()
+        sc.subscriptions.list_async.return_value = _make_stripe_list([_subscription()])
+        other = _StripeClient("sk_test_other")
+        with patch.object(other, "_client", sc):
+            await other.list_subscriptions()
+        assert self.client._first_item_id("sub_test123") is None
+        assert other._first_item_id("sub_test123") == "si_test123"
+
+    async def test_update_subscription_no_items_returns_error(self):
         sc = self._mock_stripe()
         empty_sub = _subscription()
         empty_sub.items.data = []
-        sc.subscriptions.retrieve.return_value = empty_sub
+        sc.subscriptions.retrieve_async.return_value = empty_sub
         with patch.object(self.client, "_client", sc):
-            result = self.client.update_subscription("sub_test123", price_id="price_new")
+            result = await self.client.update_subscription("sub_test123", price_id="price_new")
         assert "error" in result
         assert "no items" in result["error"]
 
-    def test_cancel_subscription_immediately(self):
+    async def test_cancel_subscription_immediately(self):
         sc = self._mock_stripe()
-        sc.subscriptions.cancel.return_value = _subscription(status="canceled")
+        sc.subscriptions.cancel_async.return_value = _subscription(status="canceled")
         with patch.object(self.client, "_client", sc):
-            result = self.client.cancel_subscription("sub_test123", at_period_end=False)
-        sc.subscriptions.cancel.assert_called_once_with("sub_test123")
+            result = await self.client.cancel_subscription("sub_test123", at_period_end=False)
+        sc.subscriptions.cancel_async.assert_called_once_with("sub_test123")
         assert result["status"] == "canceled"
 
-    def test_cancel_subscription_at_period_end(self):
+    async def test_cancel_subscription_at_period_end(self):
         sc = self._mock_stripe()
-        sc.subscriptions.update.return_value = _subscription(cancel_at_period_end=True)
+        sc.subscriptions.update_async.return_value = _subscription(cancel_at_period_end=True)
         with patch.object(self.client, "_client", sc):
-            result = self.client.cancel_subscription("sub_test123", at_period_end=True)
-        sc.subscriptions.update.assert_called_once_with(
+            result = await self.client.cancel_subscription("sub_test123", at_period_end=True)
+        sc.subscriptions.update_async.assert_called_once_with(
             "sub_test123", {"cancel_at_period_end": True}
         )
         assert result["cancel_at_period_end"] is True
@@ -505,58 +787,60 @@ def setup_method(self):
         self.client = _StripeClient("sk_test_key123")
 
     def _mock_stripe(self):
-        return MagicMock()
+        return AsyncMock()
 
-    def test_create_payment_intent(self):
+    async def test_create_payment_intent(self):
         sc = self._mock_stripe()
-        sc.payment_intents.create.return_value = _payment_intent()
+        sc.payment_intents.create_async.return_value = _payment_intent()
         with patch.object(self.client, "_client", sc):
-            result = self.client.create_payment_intent(
+            result = await self.client.create_payment_intent(
                 amount=2000,
                 currency="usd",
                 customer_id="cus_test123",
                 description="Test",
                 receipt_email="test@example.com",
             )
-        call_params = sc.payment_intents.create.call_args[0][0]
+        call_params = sc.payment_intents.create_async.call_args[0][0]
         assert call_params["amount"] == 2000
         assert call_params["currency"] == "usd"
         assert call_params["customer"] == "cus_test123"
         assert result["id"] == "pi_test123"
         assert result["status"] == "requires_payment_method"
 
-    def test_get_payment_intent(self):
+    async def test_get_payment_intent(self):
         sc = self._mock_stripe()
-        sc.payment_intents.retrieve.return_value = _payment_intent()
+        sc.payment_intents.retrieve_async.return_value = _payment_intent()
         with patch.object(self.client, "_client", sc):
-            result = self.client.get_payment_intent("pi_test123")
-        sc.payment_intents.retrieve.assert_called_once_with("pi_test123")
+            result = await self.client.get_payment_intent("pi_test123")
+        sc.payment_intents.retrieve_async.assert_called_once_with("pi_test123")
         assert result["id"] == "pi_test123"
 
-    def test_confirm_payment_intent(self):
+    async def test_confirm_payment_intent(self):
         sc = self._mock_stripe()
-        sc.payment_intents.confirm.return_value = _payment_intent(status="succeeded")
+        sc.payment_intents.confirm_async.return_value = _payment_intent(status="succeeded")
         with patch.object(self.client, "_client", sc):
-            result = self.client.confirm_payment_intent("pi_test123", payment_method="pm_card_visa")
-        sc.payment_intents.confirm.assert_called_once_with(
+            result = await self.client.confirm_payment_intent(
+                "pi_test123", payment_method="pm_card_visa"
+            )
+        sc.payment_intents.confirm_async.assert_called_once_with(
             "pi_test123", {"payment_method": "pm_card_visa"}
         )
         assert result["status"] == "succeeded"
 
-    def test_cancel_payment_intent(self):
+    async def test_cancel_payment_intent(self):
         sc = self._mock_stripe()
-        sc.payment_intents.cancel.return_value = _payment_intent(status="canceled")
+        sc.payment_intents.cancel_async.return_value = _payment_intent(status="canceled")
         with patch.object(self.client, "_client", sc):
-            result = self.client.cancel_payment_intent("pi_test123")
-        sc.payment_intents.cancel.assert_called_once_with("pi_test123")
+            result = await self.client.cancel_payment_intent("pi_test123")
+        sc.payment_intents.cancel_async.assert_called_once_with("pi_test123")
         assert result["status"] == "canceled"
 
-    def test_list_payment_intents(self):
+    async def test_list_payment_intents(self):
         sc = self._mock_stripe()
-        sc.payment_intents.list.return_value = _make_stripe_list([_payment_intent()])
+        sc.payment_intents.list_async.return_value = _make_stripe_list([_payment_intent()])
         with patch.object(self.client, "_client", sc):
-            result = self.client.list_payment_intents(customer_id="cus_test123", limit=5)
-        call_params = sc.payment_intents.list.call_args[0][0]
+            result = await self.client.list_payment_intents(customer_id="cus_test123", limit=5)
+        call_params = sc.payment_intents.list_async.call_args[0][0]
         assert call_params["customer"] == "cus_test123"
         assert call_params["limit"] == 5
         assert len(result["payment_intents"]) == 1
@@ -567,153 +851,247 @@ def setup_method(self):
         self.client = _StripeClient("sk_test_key123")
 
     def _mock_stripe(self):
-        return MagicMock()
+        return AsyncMock()
 
-    def test_list_charges(self):
+    async def test_list_charges(self):
         sc = self._mock_stripe()
-        sc.charges.list.return_value = _make_stripe_list([_charge(), _charge(id="ch_456")])
+        sc.charges.list_async.return_value = _make_stripe_list([_charge(), _charge(id="ch_456")])
         with patch.object(self.client, "_client", sc):
-            result = self.client.list_charges(customer_id="cus_test123")
-        call_params = sc.charges.list.call_args[0][0]
+            result = await self.client.list_charges(customer_id="cus_test123")
+        call_params = sc.charges.list_async.call_args[0][0]
         assert call_params["customer"] == "cus_test123"
         assert len(result["charges"]) == 2
 
-    def test_get_charge(self):
+    async def test_list_charges_created_after_auto_paginate(self):
+        sc = self._mock_stripe()
+        charges = [_charge(id=f"ch_{i}") for i in range(3)]
+        sc.charges.list_async.return_value = _make_stripe_list(charges)
+        with patch.object(self.client, "_client", sc):
+            result = await self.client.list_charges(
+                limit=250, created_after=1700000000, auto_paginate=True
+            )
+        assert sc.charges.list_async.call_args[0][0] == {
+            "created": {"gt": 1700000000},
+            "limit": 100,
+        }
+        assert [c["id"] for c in result["charges"]] == ["ch_0", "ch_1", "ch_2"]
+        assert result["has_more"] is False
+        assert result["next_cursor"] is None
+
+    async def test_list_charges_next_cursor_round_trip(self):
+        sc = self._mock_stripe()
+        sc.charges.list_async.return_value = _make_stripe_list(
+            [_charge(), _charge(id="ch_456")], has_more=True
+        )
+        with patch.object(self.client, "_client", sc):
+            first = await self.client.list_charges(limit=2)
+            await self.client.list_charges(limit=2, starting_after=first["next_cursor"])
+        assert first["next_cursor"] != "ch_456"
+        assert sc.charges.list_async.call_args[0][0]["starting_after"] == "ch_456"
+
+    async def test_list_charges_accepts_raw_starting_after(self):
         sc = self._mock_stripe()
-        sc.charges.retrieve.return_value = _charge()
+        sc.charges.list_async.return_value = _make_stripe_list([_charge()])
         with patch.object(self.client, "_client", sc):
-            result = self.client.get_charge("ch_test123")
-        sc.charges.retrieve.assert_called_once_with("ch_test123")
+            result = await self.client.list_charges(starting_after="ch_AbcDefGhijkLmn")
+        assert sc.charges.list_async.call_args[0][0]["starting_after"] == "ch_AbcDefGhijkLmn"
+        assert result["next_cursor"] is None
+
+    async def test_list_charges_clamps_limit_and_drops_unset_filters(self):
+        sc = self._mock_stripe()
+        sc.charges.list_async.return_value = _make_stripe_list([])
+        with patch.object(self.client, "_client", sc):
+            await self.client.list_charges(limit=500, customer_id="cus_test123")
+        assert sc.charges.list_async.call_args[0][0] == {"customer": "cus_test123", "limit": 100}
+
+    async def test_get_charge(self):
+        sc = self._mock_stripe()
+        sc.charges.retrieve_async.return_value = _charge()
+        with patch.object(self.client, "_client", sc):
+            result = await self.client.get_charge("ch_test123")
+        sc.charges.retrieve_async.assert_called_once_with("ch_test123")
         assert result["id"] == "ch_test123"
         assert result["paid"] is True
 
-    def test_capture_charge(self):
+    async def test_get_charge_not_cached(self):
+        sc = self._mock_stripe()
+        sc.charges.retrieve_async.return_value = _charge()
+        with patch.object(self.client, "_client", sc):
+            await self.client.get_charge("ch_test123")
+            await self.client.get_charge("ch_test123")
+        assert sc.charges.retrieve_async.call_count == 2
+
+    async def test_capture_charge(self):
         sc = self._mock_stripe()
-        sc.charges.capture.return_value = _charge(amount_captured=2000)
+        sc.charges.capture_async.return_value = _charge(amount_captured=2000)
         with patch.object(self.client, "_client", sc):
-            result = self.client.capture_charge("ch_test123", amount=2000)
-        sc.charges.capture.assert_called_once_with("ch_test123", {"amount": 2000})
+            result = await self.client.capture_charge("ch_test123", amount=2000)
+        sc.charges.capture_async.assert_called_once_with("ch_test123", {"amount": 2000})
         assert result["amount_captured"] == 2000
 
-    def test_capture_charge_full(self):
+    async def test_capture_charge_full(self):
         sc = self._mock_stripe()
-        sc.charges.capture.return_value = _charge()
+        sc.charges.capture_async.return_value = _charge()
         with patch.object(self.client, "_client", sc):
-            self.client.capture_charge("ch_test123")
-        call_params = sc.charges.capture.call_args[0][1]
+            await self.client.capture_charge("ch_test123")
+        call_params = sc.charges.capture_async.call_args[0][1]
         assert call_params == {}  # No amount means full capture
 
+    async def test_capture_charge_idempotency_key(self):
+        sc = self._mock_stripe()
+        sc.charges.capture_async.return_value = _charge()
+        with patch.object(self.client, "_client", sc):
+            await self.client.capture_charge("ch_test123", idempotency_key="key-1")
+        sc.charges.capture_async.assert_called_once_with(
+            "ch_test123", {}, {"idempotency_key": "key-1"}
+        )
+
 
 class TestStripeClientRefunds:
     def setup_method(self):
         self.client = _StripeClient("sk_test_key123")
 
     def _mock_stripe(self):
-        return MagicMock()
+        return AsyncMock()
 
-    def test_create_refund_by_charge(self):
+    async def test_create_refund_by_charge(self):
         sc = self._mock_stripe()
-        sc.refunds.create.return_value = _refund()
+        sc.refunds.create_async.return_value = _refund()
         with patch.object(self.client, "_client", sc):
-            result = self.client.create_refund(charge_id="ch_test123", amount=1000)
-        call_params = sc.refunds.create.call_args[0][0]
+            result = await self.client.create_refund(charge_id="ch_test123", amount=1000)
+        call_params = sc.refunds.create_async.call_args[0][0]
         assert call_params["charge"] == "ch_test123"
         assert call_params["amount"] == 1000
         assert result["id"] == "re_test123"
 
-    def test_create_refund_by_payment_intent(self):
+    async def test_create_refund_skips_empty_strings(self):
+        sc = self._mock_stripe()
+        sc.refunds.create_async.return_value = _refund()
+        with patch.object(self.client, "_client", sc):
+            await self.client.create_refund(
+                charge_id="", payment_intent_id="pi_test123", reason="", amount=0
+            )
+        assert sc.refunds.create_async.call_args[0][0] == {
+            "payment_intent": "pi_test123",
+            "amount": 0,
+        }
+
+    async def test_create_refund_by_payment_intent(self):
         sc = self._mock_stripe()
-        sc.refunds.create.return_value = _refund()
+        sc.refunds.create_async.return_value = _refund()
         with patch.object(self.client, "_client", sc):
-            self.client.create_refund(
+            await self.client.create_refund(
                 payment_intent_id="pi_test123",
                 reason="customer_request",
             )
-        call_params = sc.refunds.create.call_args[0][0]
+        call_params = sc.refunds.create_async.call_args[0][0]
         assert call_params["payment_intent"] == "pi_test123"
         assert call_params["reason"] == "customer_request"
 
-    def test_get_refund(self):
+    async def test_get_refund(self):
         sc = self._mock_stripe()
-        sc.refunds.retrieve.return_value = _refund()
+        sc.refunds.retrieve_async.return_value = _refund()
         with patch.object(self.client, "_client", sc):
-            result = self.client.get_refund("re_test123")
-        sc.refunds.retrieve.assert_called_once_with("re_test123")
+            result = await self.client.get_refund("re_test123")
+        sc.refunds.retrieve_async.assert_called_once_with("re_test123")
         assert result["id"] == "re_test123"
 
-    def test_list_refunds(self):
+    async def test_list_refunds(self):
         sc = self._mock_stripe()
-        sc.refunds.list.return_value = _make_stripe_list([_refund()])
+        sc.refunds.list_async.return_value = _make_stripe_list([_refund()])
         with patch.object(self.client, "_client", sc):
-            result = self.client.list_refunds(charge_id="ch_test123", limit=10)
-        call_params = sc.refunds.list.call_args[0][0]
+            result = await self.client.list_refunds(charge_id="ch_test123", limit=10)
+        call_params = sc.refunds.list_async.call_args[0][0]
         assert call_params["charge"] == "ch_test123"
         assert len(result["refunds"]) == 1
 
+    async def test_list_refunds_skips_call_when_nothing_refunded(self):
+        sc = self._mock_stripe()
+        with patch.object(self.client, "_client", sc):
+            result = await self.client.list_refunds(
+                charge_id="ch_test123", charge_amount_refunded=0
+            )
+        sc.refunds.list_async.assert_not_called()
+        assert result == {"has_more": False, "refunds": [], "next_cursor": None}
+
 
 class TestStripeClientInvoices:
     def setup_method(self):
         self.client = _StripeClient("sk_test_key123")
 
     def _mock_stripe(self):
-        return MagicMock()
+        return AsyncMock()
 
-    def test_list_invoices(self):
+    async def test_list_invoices(self):
         sc = self._mock_stripe()
-        sc.invoices.list.return_value = _make_stripe_list([_invoice(), _invoice(id="in_456")])
+        sc.invoices.list_async.return_value = _make_stripe_list([_invoice(), _invoice(id="in_456")])
         with patch.object(self.client, "_client", sc):
-            result = self.client.list_invoices(customer_id="cus_test123", status="open")
-        call_params = sc.invoices.list.call_args[0][0]
+            result = await self.client.list_invoices(customer_id="cus_test123", status="open")
+        call_params = sc.invoices.list_async.call_args[0][0]
         assert call_params["customer"] == "cus_test123"
         assert call_params["status"] == "open"
         assert len(result["invoices"]) == 2
 
-    def test_get_invoice(self):
+    async def test_get_invoice(self):
         sc = self._mock_stripe()
-        sc.invoices.retrieve.return_value = _invoice()
+        sc.invoices.retrieve_async.return_value = _invoice()
         with patch.object(self.client, "_client", sc):
-            result = self.client.get_invoice("in_test123")
-        sc.invoices.retrieve.assert_called_once_with("in_test123")
+            result = await self.client.get_invoice("in_test123")
+        sc.invoices.retrieve_async.assert_called_once_with("in_test123")
         assert result["id"] == "in_test123"
         assert result["hosted_invoice_url"] == "https://invoice.stripe.com/test"
 
-    def test_create_invoice(self):
+    async def test_create_invoice(self):
         sc = self._mock_stripe()
-        sc.invoices.create.return_value = _invoice(status="draft")
+        sc.invoices.create_async.return_value = _invoice(status="draft")
         with patch.object(self.client, "_client", sc):
-            self.client.create_invoice(
+            await self.client.create_invoice(
                 "cus_test123",
                 description="Test invoice",
                 collection_method="send_invoice",
                 days_until_due=30,
             )
-        call_params = sc.invoices.create.call_args[0][0]
+        call_params = sc.invoices.create_async.call_args[0][0]
         assert call_params["customer"] == "cus_test123"
         assert call_params["collection_method"] == "send_invoice"
         assert call_params["days_until_due"] == 30
 
-    def test_finalize_invoice(self):
+    async def test_finalize_invoice(self):
         sc = self._mock_stripe()
-        sc.invoices.finalize_invoice.return_value = _invoice(status="open")
+        sc.invoices.finalize_invoice_async.return_value = _invoice(status="open")
         with patch.object(self.client, "_client", sc):
-            result = self.client.finalize_invoice("in_test123")
-        sc.invoices.finalize_invoice.assert_called_once_with("in_test123")
+            result = await self.client.finalize_invoice("in_test123")
+        sc.invoices.finalize_invoice_async.assert_called_once_with("in_test123")
         assert result["status"] == "open"
 
-    def test_pay_invoice(self):
+    async def test_pay_invoice(self):
         sc = self._mock_stripe()
-        sc.invoices.pay.return_value = _invoice(status="paid", amount_paid=2000)
+        sc.invoices.pay_async.return_value = _invoice(status="paid", amount_paid=2000)
         with patch.object(self.client, "_client", sc):
-            result = self.client.pay_invoice("in_test123")
-        sc.invoices.pay.assert_called_once_with("in_test123")
+            result = await self.client.pay_invoice("in_test123")
+        sc.invoices.pay_async.assert_called_once_with("in_test123")
         assert result["status"] == "paid"
 
-    def test_void_invoice(self):
+    async def test_pay_invoice_drops_cached_subscription(self):
+        sc = self._mock_stripe()
+        sc.subscriptions.retrieve_async.side_effect = [
+            _subscription(status="past_due"),
+            _subscription(status="active"),
+        ]
+        sc.invoices.pay_async.return_value = _invoice(status="paid")
+        with patch.object(self.client, "_client", sc):
+            await self.client.get_subscription("sub_test123")
+            await self.client.pay_invoice("in_test123")
+            result = await self.client.get_subscription("sub_test123")
+        assert sc.subscriptions.retrieve_async.call_count == 2
+        assert result["status"] == "active"
+
+    async def test_void_invoice(self):
         sc = self._mock_stripe()
-        sc.invoices.void_invoice.return_value = _invoice(status="void")
+        sc.invoices.void_invoice_async.return_value = _invoice(status="void")
         with patch.object(self.client, "_client", sc):
-            result = self.client.void_invoice("in_test123")
-        sc.invoices.void_invoice.assert_called_once_with("in_test123")
+            result = await self.client.void_invoice("in_test123")
+        sc.invoices.void_invoice_async.assert_called_once_with("in_test123")
         assert result["status"] == "void"
 
 
@@ -722,46 +1100,67 @@ def setup_method(self):
         self.client = _StripeClient("sk_test_key123")
 
     def _mock_stripe(self):
-        return MagicMock()
+        return AsyncMock()
 
-    def test_create_invoice_item(self):
+    async def test_create_invoice_item(self):
         sc = self._mock_stripe()
-        sc.invoice_items.create.return_value = _invoice_item()
+        sc.invoice_items.create_async.return_value = _invoice_item()
         with patch.object(self.client, "_client", sc):
-            result = self.client.create_invoice_item(
+            result = await self.client.create_invoice_item(
                 customer_id="cus_test123",
                 amount=1500,
                 currency="usd",
                 description="Setup fee",
                 invoice_id="in_test123",
             )
-        call_params = sc.invoice_items.create.call_args[0][0]
+        call_params = sc.invoice_items.create_async.call_args[0][0]
         assert call_params["customer"] == "cus_test123"
         assert call_params["amount"] == 1500
         assert call_params["invoice"] == "in_test123"
         assert result["id"] == "ii_test123"
 
-    def test_list_invoice_items(self):
+    async def test_invoice_item_writes_drop_cached_invoice(self):
         sc = self._mock_stripe()
-        sc.invoice_items.list.return_value = _make_stripe_list([_invoice_item()])
+        sc.invoices.retrieve_async.side_effect = [
+            _invoice(amount_due=0),
+            _invoice(amount_due=1500),
+            _invoice(amount_due=0),
+        ]
+        sc.invoice_items.create_async.return_value = _invoice_item()
+        sc.invoice_items.delete_async.return_value = MagicMock(id="ii_test123", deleted=True)
+        with patch.object(self.client, "_client", sc):
+            await self.client.get_invoice("in_test123")
+            await self.client.create_invoice_item(
+                "cus_test123", 1500, "usd", invoice_id="in_test123"
+            )
+            added = await self.client.get_invoice("in_test123")
+            await self.client.delete_invoice_item("ii_test123")
+            removed = await self.client.get_invoice("in_test123")
+        assert sc.invoices.retrieve_async.call_count == 3
+        assert added["amount_due"] == 1500
+        assert removed["amount_due"] == 0
+
+    async def test_list_invoice_items(self):
+        sc = self._mock_stripe()
+        sc.invoice_items.list_async.return_value = _make_stripe_list([_invoice_item()])
         with patch.object(self.client, "_client", sc):
-            result = self.client.list_invoice_items(
+            result = await self.client.list_invoice_items(
                 customer_id="cus_test123", invoice_id="in_test123"
             )
-        call_params = sc.invoice_items.list.call_args[0][0]
+        call_params = sc.invoice_items.list_async.call_args[0][0]
         assert call_params["customer"] == "cus_test123"
         assert call_params["invoice"] == "in_test123"
         assert len(result["invoice_items"]) == 1
 
-    def test_delete_invoice_item(self):
+    async def test_delete_invoice_item(self):
         sc = self._mock_stripe()
         deleted = MagicMock()
         deleted.id = "ii_test123"
         deleted.deleted = True
-        sc.invoice_items.delete.return_value = deleted
+        sc.invoice_items.delete_async.return_value = deleted
         with patch.object(self.client, "_client", sc):
-            result = self.client.delete_invoice_item("ii_test123")
-        sc.invoice_items.delete.assert_called_once_with("ii_test123")
+            result = await self.client.delete_invoice_item("ii_test123")
+        sc.invoice_items.delete_async.assert_called_once_with("ii_test123")
         assert result["deleted"] is True
         assert result["id"] == "ii_test123"
 
@@ -771,46 +1170,103 @@ def setup_method(self):
         self.client = _StripeClient("sk_test_key123")
 
     def _mock_stripe(self):
-        return MagicMock()
+        return AsyncMock()
 
-    def test_create_product(self):
+    async def test_create_product(self):
         sc = self._mock_stripe()
-        sc.products.create.return_value = _product()
+        sc.products.create_async.return_value = _product()
         with patch.object(self.client, "_client", sc):
-            result = self.client.create_product(
+            result = await self.client.create_product(
                 name="Premium Plan",
                 description="Full access",
                 active=True,
                 metadata={"tier": "premium"},
             )
-        call_params = sc.products.create.call_args[0][0]
+        call_params = sc.products.create_async.call_args[0][0]
         assert call_params["name"] == "Premium Plan"
         assert call_params["active"] is True
         assert result["id"] == "prod_test123"
 
-    def test_get_product(self):
+    async def test_get_product(self):
         sc = self._mock_stripe()
-        sc.products.retrieve.return_value = _product()
+        sc.products.retrieve_async.return_value = _product()
         with patch.object(self.client, "_client", sc):
-            result = self.client.get_product("prod_test123")
-        sc.products.retrieve.assert_called_once_with("prod_test123")
+            result = await self.client.get_product("prod_test123")
+        sc.products.retrieve_async.assert_called_once_with("prod_test123")
         assert result["name"] == "Premium Plan"
 
-    def test_list_products(self):
+    async def test_get_product_cached(self):
         sc = self._mock_stripe()
-        sc.products.list.return_value = _make_stripe_list([_product(), _product(id="prod_456")])
+        sc.products.retrieve_async.return_value = _product()
         with patch.object(self.client, "_client", sc):
-            result = self.client.list_products(active=True)
-        call_params = sc.products.list.call_args[0][0]
+            await self.client.get_product("prod_test123")
+            result = await self.client.get_product("prod_test123")
+        sc.products.retrieve_async.assert_called_once_with("prod_test123")
+        assert result["id"] == "prod_test123"
+
+    async def test_get_product_cache_scoped_to_api_key(self):
+        sc = self._mock_stripe()
+        sc.products.retrieve_async.return_value = _product()
+        other = _StripeClient("sk_test_other")
+        with patch.object(self.client, "_client", sc), patch.object(other, "_client", sc):
+            await self.client.get_product("prod_test123")
+            await other.get_product("prod_test123")
+        assert sc.products.retrieve_async.call_count == 2
+
+    async def test_get_products_lists_only_uncached_ids(self):
+        sc = self._mock_stripe()
+        sc.products.retrieve_async.return_value = _product()
+        sc.products.list_async.return_value = _make_stripe_list([_product(id="prod_456")])
+        with patch.object(self.client, "_client", sc):
+            await self.client.get_product("prod_test123")
+            result = await self.client.get_products(["prod_test123", "prod_456", "prod_gone"])
+        sc.products.list_async.assert_called_once_with(
+            {"ids": ["prod_456", "prod_gone"], "limit": 100}
+        )
+        assert [p["id"] for p in result["products"]] == ["prod_test123", "prod_456"]
+        assert result["not_found"] == ["prod_gone"]
+
+    async def test_update_product_refreshes_cache(self):
+        sc = self._mock_stripe()
+        sc.products.retrieve_async.return_value = _product()
+        sc.products.update_async.return_value = _product(name="Renamed")
+        with patch.object(self.client, "_client", sc):
+            await self.client.get_product("prod_test123")
+            await self.client.update_product("prod_test123", name="Renamed")
+            result = await self.client.get_product("prod_test123")
+        sc.products.retrieve_async.assert_called_once()
+        assert result["name"] == "Renamed"
+
+    async def test_list_products(self):
+        sc = self._mock_stripe()
+        sc.products.list_async.return_value = _make_stripe_list(
+            [_product(), _product(id="prod_456")]
+        )
+        with patch.object(self.client, "_client", sc):
+            result = await self.client.list_products(active=True)
+        call_params = sc.products.list_async.call_args[0][0]
         assert call_params["active"] is True
         assert len(result["products"]) == 2
 
-    def test_update_product(self):
+    async def test_list_products_auto_paginate_fills_product_cache(self):
+        sc = self._mock_stripe()
+        sc.products.list_async.side_effect = [
+            _make_stripe_list([_product()], has_more=True),
+            _make_stripe_list([_product(id="prod_456")]),
+        ]
+        with patch.object(self.client, "_client", sc):
+            result = await self.client.list_products(limit=500, auto_paginate=True)
+            await self.client.get_product("prod_456")
+        assert [p["id"] for p in result["products"]] == ["prod_test123", "prod_456"]
+        assert sc.products.list_async.call_args[0][0]["starting_after"] == "prod_test123"
+        sc.products.retrieve_async.assert_not_called()
+
+    async def test_update_product(self):
         sc = self._mock_stripe()
-        sc.products.update.return_value = _product(name="Updated Plan", active=False)
+        sc.products.update_async.return_value = _product(name="Updated Plan", active=False)
         with patch.object(self.client, "_client", sc):
-            self.client.update_product("prod_test123", name="Updated Plan", active=False)
-        call_params = sc.products.update.call_args[0][1]
+            await self.client.update_product("prod_test123", name="Updated Plan", active=False)
+        call_params = sc.products.update_async.call_args[0][1]
         assert call_params["name"] == "Updated Plan"
         assert call_params["active"] is False
 
@@ -820,59 +1276,189 @@ def setup_method(self):
         self.client = _StripeClient("sk_test_key123")
 
     def _mock_stripe(self):
-        return MagicMock()
+        return AsyncMock()
 
-    def test_create_price_recurring(self):
+    async def test_create_price_recurring(self):
         sc = self._mock_stripe()
-        sc.prices.create.return_value = _price()
+        sc.prices.create_async.return_value = _price()
         with patch.object(self.client, "_client", sc):
-            result = self.client.create_price(
+            result = await self.client.create_price(
                 unit_amount=999,
                 currency="usd",
                 product_id="prod_test123",
                 recurring_interval="month",
             )
-        call_params = sc.prices.create.call_args[0][0]
+        call_params = sc.prices.create_async.call_args[0][0]
         assert call_params["recurring"]["interval"] == "month"
         assert result["id"] == "price_test123"
 
-    def test_create_price_one_time(self):
+    async def test_create_price_one_time(self):
         sc = self._mock_stripe()
-        sc.prices.create.return_value = _price(recurring=None, type="one_time")
+        sc.prices.create_async.return_value = _price(recurring=None, type="one_time")
         with patch.object(self.client, "_client", sc):
-            self.client.create_price(
+            await self.client.create_price(
                 unit_amount=4999,
                 currency="usd",
                 product_id="prod_test123",
             )
-        call_params = sc.prices.create.call_args[0][0]
+        call_params = sc.prices.create_async.call_args[0][0]
         assert "recurring" not in call_params
 
-    def test_get_price(self):
+    async def test_get_price(self):
         sc = self._mock_stripe()
-        sc.prices.retrieve.return_value = _price()
+        sc.prices.retrieve_async.return_value = _price()
         with patch.object(self.client, "_client", sc):
-            result = self.client.get_price("price_test123")
-        sc.prices.retrieve.assert_called_once_with("price_test123")
+            result = await self.client.get_price("price_test123")
+        sc.prices.retrieve_async.assert_called_once_with("price_test123")
         assert result["unit_amount"] == 999
         assert result["recurring"]["interval"] == "month"
 
-    def test_list_prices(self):
+    async def test_get_price_cached(self):
+        sc = self._mock_stripe()
+        sc.prices.retrieve_async.return_value = _price()
+        with patch.object(self.client, "_client", sc):
+            await self.client.get_price("price_test123")
+            await self.client.get_price("price_test123")
+        sc.prices.retrieve_async.assert_called_once_with("price_test123")
+
+    async def test_create_product_with_price(self):
         sc = self._mock_stripe()
-        sc.prices.list.return_value = _make_stripe_list([_price()])
+        sc.products.create_async.return_value = _product(default_price=_price())
         with patch.object(self.client, "_client", sc):
-            result = self.client.list_prices(product_id="prod_test123", active=True)
-        call_params = sc.prices.list.call_args[0][0]
+            result = await self.client.create_product_with_price(
+                "Premium Plan", 999, "usd", recurring_interval="month"
+            )
+        sc.products.create_async.assert_called_once_with(
+            {
+                "name": "Premium Plan",
+                "default_price_data": {
+                    "unit_amount": 999,
+                    "currency": "usd",
+                    "recurring": {"interval": "month"},
+                },
+                "expand": ["default_price"],
+            }
+        )
+        sc.prices.create_async.assert_not_called()
+        assert result["product"]["id"] == "prod_test123"
+        assert result["price"]["id"] == "price_test123"
+        assert result["price"]["recurring"]["interval"] == "month"
+
+    async def test_get_prices_reports_missing_ids(self):
+        async def retrieve(price_id):
+            if price_id == "price_gone":
+                raise stripe.InvalidRequestError("No such price", "id", code="resource_missing")
+            return _price(id=price_id)
+
+        sc = self._mock_stripe()
+        sc.prices.retrieve_async.side_effect = retrieve
+        with patch.object(self.client, "_client", sc):
+            result = await self.client.get_prices(["price_test123", "price_gone", "price_test123"])
+        assert sc.prices.retrieve_async.call_count == 2
+        assert [p["id"] for p in result["prices"]] == ["price_test123"]
+        assert result["not_found"] == ["price_gone"]
+
+    async def test_invalidate_price(self):
+        sc = self._mock_stripe()
+        sc.prices.retrieve_async.return_value = _price()
+        with patch.object(self.client, "_client", sc):
+            await self.client.get_price("price_test123")
+            _StripeClient.invalidate_price("price_test123")
+            await self.client.get_price("price_test123")
+        assert sc.prices.retrieve_async.call_count == 2
+
+    async def test_invalidate_from_webhook_event(self):
+        sc = self._mock_stripe()
+        sc.prices.retrieve_async.return_value = _price()
+        event = stripe.Event.construct_from(
+            {"id": "evt_1", "type": "price.updated", "data": {"object": {"id": "price_test123"}}},
+            "sk_test_key123",
+        )
+        with patch.object(self.client, "_client", sc):
+            await self.client.get_price("price_test123")
+            assert _StripeClient.invalidate(event) is True
+            await self.client.get_price("price_test123")
+        assert sc.prices.retrieve_async.call_count == 2
+
+    async def test_invalidate_subscription_event_drops_read_cache(self):
+        sc = self._mock_stripe()
+        sc.subscriptions.retrieve_async.side_effect = [
+            _subscription(),
+            _subscription(status="past_due"),
+        ]
+        event = stripe.Event.construct_from(
+            {
+                "id": "evt_1",
+                "type": "customer.subscription.updated",
+                "data": {"object": {"id": "sub_test123", "object": "subscription"}},
+            },
+            "sk_test_key123",
+        )
+        with patch.object(self.client, "_client", sc):
+            await self.client.get_subscription("sub_test123")
+            assert _StripeClient.invalidate(event) is True
+            result = await self.client.get_subscription("sub_test123")
+        assert sc.subscriptions.retrieve_async.call_count == 2
+        assert result["status"] == "past_due"
+
+    def test_invalidate_ignores_uncached_event_types(self):
+        event = stripe.Event.construct_from(
+            {"id": "evt_1", "type": "charge.succeeded", "data": {"object": {"id": "ch_1"}}},
+            "sk_test_key123",
+        )
+        assert _StripeClient.invalidate(event) is False
+
+    async def test_list_prices_populates_cache(self):
+        sc = self._mock_stripe()
+        sc.prices.list_async.return_value = _make_stripe_list([_price()])
+        with patch.object(self.client, "_client", sc):
+            await self.client.list_prices()
+            result = await self.client.get_price("price_test123")
+        sc.prices.retrieve_async.assert_not_called()
+        assert result["id"] == "price_test123"
+
+    async def test_list_prices(self):
+        sc = self._mock_stripe()
+        sc.prices.list_async.return_value = _make_stripe_list([_price()])
+        with patch.object(self.client, "_client", sc):
+            result = await self.client.list_prices(product_id="prod_test123", active=True)
+        call_params = sc.prices.list_async.call_args[0][0]
         assert call_params["product"] == "prod_test123"
         assert call_params["active"] is True
         assert len(result["prices"]) == 1
 
-    def test_update_price(self):
+    async def test_prefetch_prices_warms_cache_once_per_key(self):
+        sc = self._mock_stripe()
+        sc.prices.list_async.return_value = _make_stripe_list([_price(), _price(id="price_other")])
+        with patch.dict("os.environ", {"STRIPE_PREFETCH_PRICES": "1"}):
+            client = _StripeClient("sk_test_key123")
+            second = _StripeClient("sk_test_key123")
+        assert second._prefetch is None
+        with patch.object(client, "_client", sc):
+            await client._prefetch
+            result = await client.get_price("price_other")
+        sc.prices.list_async.assert_called_once_with({"active": True, "limit": 100})
+        sc.prices.retrieve_async.assert_not_called()
+        assert result["id"] == "price_other"
+
+    async def test_prefetch_prices_failure_allows_retry(self):
+        sc = self._mock_stripe()
+        sc.prices.list_async.side_effect = stripe.AuthenticationError("Invalid API key")
+        with patch.dict("os.environ", {"STRIPE_PREFETCH_PRICES": "1"}):
+            client = _StripeClient("sk_test_key123")
+        with patch.object(client, "_client", sc):
+            await client._prefetch
+        assert "sk_test_key123" not in _StripeClient._prefetched_keys
+
+    def test_prefetch_disabled_by_default(self):
+        assert self.client._prefetch is None
+
+    async def test_update_price(self):
         sc = self._mock_stripe()
-        sc.prices.update.return_value = _price(active=False, nickname="Legacy")
+        sc.prices.update_async.return_value = _price(active=False, nickname="Legacy")
         with patch.object(self.client, "_client", sc):
-            self.client.update_price("price_test123", active=False, nickname="Legacy")
-        call_params = sc.prices.update.call_args[0][1]
+            await self.client.update_price("price_test123", active=False, nickname="Legacy")
+        call_params = sc.prices.update_async.call_args[0][1]
         assert call_params["active"] is False
         assert call_params["nickname"] == "Legacy"
 
@@ -882,34 +1468,38 @@ def setup_method(self):
         self.client = _StripeClient("sk_test_key123")
 
     def _mock_stripe(self):
-        return MagicMock()
+        return AsyncMock()
 
-    def test_create_payment_link(self):
+    async def test_create_payment_link(self):
         sc = self._mock_stripe()
-        sc.payment_links.create.return_value = _payment_link()
+        sc.payment_links.create_async.return_value = _payment_link()
         with patch.object(self.client, "_client", sc):
-            result = self.client.create_payment_link("price_test123", quantity=2)
-        call_params = sc.payment_links.create.call_args[0][0]
+            result = await self.client.create_payment_link("price_test123", quantity=2)
+        call_params = sc.payment_links.create_async.call_args[0][0]
         assert call_params["line_items"][0]["price"] == "price_test123"
         assert call_params["line_items"][0]["quantity"] == 2
+        assert call_params["expand"] == ["line_items"]
         assert result["id"] == "plink_test123"
         assert result["url"] == "https://buy.stripe.com/test"
 
-    def test_get_payment_link(self):
+    async def test_get_payment_link(self):
         sc = self._mock_stripe()
-        sc.payment_links.retrieve.return_value = _payment_link()
+        sc.payment_links.retrieve_async.return_value = _payment_link()
         with patch.object(self.client, "_client", sc):
-            result = self.client.get_payment_link("plink_test123")
-        sc.payment_links.retrieve.assert_called_once_with("plink_test123")
+            result = await self.client.get_payment_link("plink_test123")
+        sc.payment_links.retrieve_async.assert_called_once_with(
+            "plink_test123", {"expand": ["line_items"]}
+        )
         assert result["active"] is True
 
-    def test_list_payment_links(self):
+    async def test_list_payment_links(self):
         sc = self._mock_stripe()
-        sc.payment_links.list.return_value = _make_stripe_list([_payment_link()])
+        sc.payment_links.list_async.return_value = _make_stripe_list([_payment_link()])
         with patch.object(self.client, "_client", sc):
-            result = self.client.list_payment_links(active=True)
-        call_params = sc.payment_links.list.call_args[0][0]
+            result = await self.client.list_payment_links(active=True)
+        call_params = sc.payment_links.list_async.call_args[0][0]
         assert call_params["active"] is True
+        assert call_params["expand"] == ["data.line_items"]
         assert len(result["payment_links"]) == 1
 
 
@@ -918,63 +1508,77 @@ def setup_method(self):
         self.client = _StripeClient("sk_test_key123")
 
     def _mock_stripe(self):
-        return MagicMock()
+        return AsyncMock()
 
-    def test_create_coupon_percent_off(self):
+    async def test_create_coupon_percent_off(self):
         sc = self._mock_stripe()
-        sc.coupons.create.return_value = _coupon()
+        sc.coupons.create_async.return_value = _coupon()
         with patch.object(self.client, "_client", sc):
-            result = self.client.create_coupon(
+            result = await self.client.create_coupon(
                 percent_off=20.0,
                 duration="once",
                 name="WELCOME20",
             )
-        call_params = sc.coupons.create.call_args[0][0]
+        call_params = sc.coupons.create_async.call_args[0][0]
         assert call_params["percent_off"] == 20.0
         assert call_params["duration"] == "once"
         assert result["id"] == "WELCOME20"
 
-    def test_create_coupon_amount_off(self):
+    async def test_create_coupon_amount_off(self):
         sc = self._mock_stripe()
-        sc.coupons.create.return_value = _coupon(percent_off=None, amount_off=500, currency="usd")
+        sc.coupons.create_async.return_value = _coupon(
+            percent_off=None, amount_off=500, currency="usd"
+        )
         with patch.object(self.client, "_client", sc):
-            self.client.create_coupon(
+            await self.client.create_coupon(
                 amount_off=500,
                 currency="usd",
                 duration="forever",
             )
-        call_params = sc.coupons.create.call_args[0][0]
+        call_params = sc.coupons.create_async.call_args[0][0]
         assert call_params["amount_off"] == 500
         assert call_params["currency"] == "usd"
 
-    def test_create_coupon_repeating(self):
+    async def test_create_coupon_repeating(self):
         sc = self._mock_stripe()
-        sc.coupons.create.return_value = _coupon(duration="repeating", duration_in_months=3)
+        sc.coupons.create_async.return_value = _coupon(duration="repeating", duration_in_months=3)
         with patch.object(self.client, "_client", sc):
-            self.client.create_coupon(
+            await self.client.create_coupon(
                 percent_off=10.0,
                 duration="repeating",
                 duration_in_months=3,
             )
-        call_params = sc.coupons.create.call_args[0][0]
+        call_params = sc.coupons.create_async.call_args[0][0]
         assert call_params["duration_in_months"] == 3
 
-    def test_list_coupons(self):
+    async def test_list_coupons(self):
         sc = self._mock_stripe()
-        sc.coupons.list.return_value = _make_stripe_list([_coupon()])
+        sc.coupons.list_async.return_value = _make_stripe_list([_coupon()])
         with patch.object(self.client, "_client", sc):
-            result = self.client.list_coupons(limit=5)
+            result = await self.client.list_coupons(limit=5)
         assert len(result["coupons"]) == 1
 
-    def test_delete_coupon(self):
+    async def test_list_coupons_cached_until_catalog_write(self):
+        sc = self._mock_stripe()
+        sc.coupons.list_async.return_value = _make_stripe_list([_coupon()])
+        sc.coupons.delete_async.return_value = MagicMock(id="WELCOME20", deleted=True)
+        with patch.object(self.client, "_client", sc):
+            await self.client.list_coupons(limit=5)
+            await self.client.list_coupons(limit=5)
+            assert sc.coupons.list_async.call_count == 1
+            await self.client.delete_coupon("WELCOME20")
+            await self.client.list_coupons(limit=5)
+        assert sc.coupons.list_async.call_count == 2
+
+    async def test_delete_coupon(self):
         sc = self._mock_stripe()
         deleted = MagicMock()
         deleted.id = "WELCOME20"
         deleted.deleted = True
-        sc.coupons.delete.return_value = deleted
+        sc.coupons.delete_async.return_value = deleted
         with patch.object(self.client, "_client", sc):
-            result = self.client.delete_coupon("WELCOME20")
-        sc.coupons.delete.assert_called_once_with("WELCOME20")
+            result = await self.client.delete_coupon("WELCOME20")
+        sc.coupons.delete_async.assert_called_once_with("WELCOME20")
         assert result["deleted"] is True
 
 
@@ -983,9 +1587,9 @@ def setup_method(self):
         self.client = _StripeClient("sk_test_key123")
 
     def _mock_stripe(self):
-        return MagicMock()
+        return AsyncMock()
 
-    def test_get_balance(self):
+    async def test_get_balance(self):
         sc = self._mock_stripe()
         avail = MagicMock()
         avail.amount = 10000
@@ -993,13 +1597,34 @@ def test_get_balance(self):
         pend = MagicMock()
         pend.amount = 5000
         pend.currency = "usd"
-        sc.balance.retrieve.return_value = MagicMock(available=[avail], pending=[pend])
+        sc.balance.retrieve_async.return_value = MagicMock(available=[avail], pending=[pend])
         with patch.object(self.client, "_client", sc):
-            result = self.client.get_balance()
+            result = await self.client.get_balance()
         assert result["available"][0]["amount"] == 10000
         assert result["pending"][0]["currency"] == "usd"
 
-    def test_list_balance_transactions(self):
+    async def test_get_balance_cached(self):
+        sc = self._mock_stripe()
+        sc.balance.retrieve_async.return_value = MagicMock(available=[], pending=[])
+        with patch.object(self.client, "_client", sc):
+            await self.client.get_balance()
+            await self.client.get_balance()
+        sc.balance.retrieve_async.assert_called_once_with()
+
+    async def test_balance_event_drops_cached_balance(self):
+        sc = self._mock_stripe()
+        sc.balance.retrieve_async.return_value = MagicMock(available=[], pending=[])
+        event = stripe.Event.construct_from(
+            {"id": "evt_1", "type": "balance.available", "data": {"object": {"object": "balance"}}},
+            "sk_test_key123",
+        )
+        with patch.object(self.client, "_client", sc):
+            await self.client.get_balance()
+            assert _StripeClient.invalidate(event) is True
+            await self.client.get_balance()
+        assert sc.balance.retrieve_async.call_count == 2
+
+    async def test_list_balance_transactions(self):
         txn = MagicMock()
         txn.id = "txn_test123"
         txn.amount = 2000
@@ -1011,10 +1636,10 @@ def test_list_balance_transactions(self):
         txn.description = "Test"
         txn.created = 1700000000
         sc = self._mock_stripe()
-        sc.balance_transactions.list.return_value = _make_stripe_list([txn])
+        sc.balance_transactions.list_async.return_value = _make_stripe_list([txn])
         with patch.object(self.client, "_client", sc):
-            result = self.client.list_balance_transactions(type_filter="charge")
-        call_params = sc.balance_transactions.list.call_args[0][0]
+            result = await self.client.list_balance_transactions(type_filter="charge")
+        call_params = sc.balance_transactions.list_async.call_args[0][0]
         assert call_params["type"] == "charge"
         assert len(result["transactions"]) == 1
         assert result["transactions"][0]["net"] == 1942
@@ -1025,9 +1650,9 @@ def setup_method(self):
         self.client = _StripeClient("sk_test_key123")
 
     def _mock_stripe(self):
-        return MagicMock()
+        return AsyncMock()
 
-    def test_list_webhook_endpoints(self):
+    async def test_list_webhook_endpoints(self):
         we = MagicMock()
         we.id = "we_test123"
         we.url = "https://example.com/webhook"
@@ -1035,9 +1660,9 @@ def test_list_webhook_endpoints(self):
         we.enabled_events = ["payment_intent.succeeded"]
         we.created = 1700000000
         sc = self._mock_stripe()
-        sc.webhook_endpoints.list.return_value = _make_stripe_list([we])
+        sc.webhook_endpoints.list_async.return_value = _make_stripe_list([we])
         with patch.object(self.client, "_client", sc):
-            result = self.client.list_webhook_endpoints(limit=10)
+            result = await self.client.list_webhook_endpoints(limit=10)
         assert len(result["webhook_endpoints"]) == 1
         assert result["webhook_endpoints"][0]["url"] == "https://example.com/webhook"
         assert result["webhook_endpoints"][0]["status"] == "enabled"
@@ -1048,37 +1673,228 @@ def setup_method(self):
         self.client = _StripeClient("sk_test_key123")
 
     def _mock_stripe(self):
-        return MagicMock()
+        return AsyncMock()
 
-    def test_list_payment_methods(self):
+    async def test_list_payment_methods(self):
         sc = self._mock_stripe()
-        sc.payment_methods.list.return_value = _make_stripe_list([_payment_method()])
+        sc.payment_methods.list_async.return_value = _make_stripe_list([_payment_method()])
         with patch.object(self.client, "_client", sc):
-            result = self.client.list_payment_methods("cus_test123", type_filter="card")
-        call_params = sc.payment_methods.list.call_args[0][0]
+            result = await self.client.list_payment_methods("cus_test123", type_filter="card")
+        call_params = sc.payment_methods.list_async.call_args[0][0]
         assert call_params["customer"] == "cus_test123"
         assert call_params["type"] == "card"
         assert len(result["payment_methods"]) == 1
         assert result["payment_methods"][0]["card"]["last4"] == "4242"
 
-    def test_get_payment_method(self):
+    async def test_list_payment_methods_auto_paginate(self):
+        sc = self._mock_stripe()
+        sc.payment_methods.list_async.return_value = _make_stripe_list([_payment_method()])
+        with patch.object(self.client, "_client", sc):
+            result = await self.client.list_payment_methods(
+                "cus_test123", limit=300, auto_paginate=True
+            )
+        assert sc.payment_methods.list_async.call_args[0][0] == {
+            "customer": "cus_test123",
+            "type": "card",
+            "limit": 100,
+        }
+        assert result["has_more"] is False
+
+    async def test_get_payment_method(self):
         sc = self._mock_stripe()
-        sc.payment_methods.retrieve.return_value = _payment_method()
+        sc.payment_methods.retrieve_async.return_value = _payment_method()
         with patch.object(self.client, "_client", sc):
-            result = self.client.get_payment_method("pm_test123")
-        sc.payment_methods.retrieve.assert_called_once_with("pm_test123")
+            result = await self.client.get_payment_method("pm_test123")
+        sc.payment_methods.retrieve_async.assert_called_once_with("pm_test123")
         assert result["type"] == "card"
 
-    def test_detach_payment_method(self):
+    async def test_detach_payment_method(self):
         sc = self._mock_stripe()
         detached = _payment_method(customer=None)
-        sc.payment_methods.detach.return_value = detached
+        sc.payment_methods.detach_async.return_value = detached
         with patch.object(self.client, "_client", sc):
-            result = self.client.detach_payment_method("pm_test123")
-        sc.payment_methods.detach.assert_called_once_with("pm_test123")
+            result = await self.client.detach_payment_method("pm_test123")
+        sc.payment_methods.detach_async.assert_called_once_with("pm_test123")
         assert result["customer"] is None
 
 
+class TestStripeClientHttpClient:
+    def test_http_client_shared_across_instances(self):
+        with patch("aden_tools.tools.stripe_tool.stripe_tool.stripe.StripeClient") as MockSC:
+            _StripeClient("sk_test_a")
+            _StripeClient("sk_test_b")
+        first, second = (c.kwargs["http_client"] for c in MockSC.call_args_list)
+        assert first is second
+        assert MockSC.call_args.kwargs["max_network_retries"] == 2
+
+    def test_http2_opt_in(self):
+        module = "aden_tools.tools.stripe_tool.stripe_tool"
+        with (
+            patch(f"{module}._http_client", None),
+            patch.dict("os.environ", {"STRIPE_HTTP2": "1"}),
+            patch(f"{module}.httpx.AsyncClient") as MockAsyncClient,
+        ):
+            client = _get_http_client()
+        MockAsyncClient.assert_called_once()
+        assert MockAsyncClient.call_args.kwargs["http2"] is True
+        assert "verify" in MockAsyncClient.call_args.kwargs
+        assert client._client_async is MockAsyncClient.return_value
+
+    @pytest.mark.parametrize("flag", [None, "", "0", "false", "no"])
+    def test_http1_unless_opted_in(self, flag):
+        module = "aden_tools.tools.stripe_tool.stripe_tool"
+        env = {} if flag is None else {"STRIPE_HTTP2": flag}
+        with (
+            patch(f"{module}._http_client", None),
+            patch.dict("os.environ", env, clear=True),
+            patch(f"{module}.httpx.AsyncClient") as MockAsyncClient,
+        ):
+            _get_http_client()
+        MockAsyncClient.assert_called_once()
+        assert "http2" not in MockAsyncClient.call_args.kwargs
+
+    def test_http2_falls_back_without_h2(self, caplog):
+        module = "aden_tools.tools.stripe_tool.stripe_tool"
+        with (
+            patch(f"{module}._http_client", None),
+            patch.dict("os.environ", {"STRIPE_HTTP2": "true"}),
+            patch(f"{module}.importlib.util.find_spec", return_value=None),
+            patch(f"{module}.httpx.AsyncClient") as MockAsyncClient,
+        ):
+            _get_http_client()
+        assert "http2" not in MockAsyncClient.call_args.kwargs
+        assert "h2 package is not installed" in caplog.text
+
+
+class TestStripeClientRateLimit:
+    def setup_method(self):
+        self.client = _StripeClient("sk_test_key123")
+
+    async def test_token_bucket_paces_after_burst(self):
+        bucket = _TokenBucket(rate=2)
+        with patch(
+            "aden_tools.tools.stripe_tool.stripe_tool.asyncio.sleep", new_callable=AsyncMock
+        ) as mock_sleep:
+            mock_sleep.side_effect = lambda delay: setattr(
+                bucket, "_tokens", bucket._tokens + delay * 2
+            )
+            await bucket.acquire()
+            await bucket.acquire()
+            mock_sleep.assert_not_called()
+            await bucket.acquire()
+        mock_sleep.assert_called()
+
+    def test_limiter_per_key_and_mode(self):
+        live = _StripeClient("sk_live_key123")
+        assert self.client._limiter() is _StripeClient("sk_test_key123")._limiter()
+        assert self.client._limiter() is not live._limiter()
+        assert self.client._limiter()._rate == _StripeClient._RATE_LIMIT_TEST
+        assert live._limiter()._rate == _StripeClient._RATE_LIMIT_LIVE
+
+    async def test_concurrency_limit_from_env(self):
+        with patch.dict("os.environ", {"STRIPE_MAX_CONCURRENT": "4"}):
+            sem = self.client._concurrency()
+        assert sem._value == 4
+        assert _StripeClient("sk_test_key123")._concurrency() is sem
+
+    def test_concurrency_limit_per_event_loop(self):
+        async def contended_retrieves():
+            sc = AsyncMock()
+
+            async def slow_retrieve(customer_id):
+                await asyncio.sleep(0.01)
+                return _customer(id=customer_id)
+
+            sc.customers.retrieve_async.side_effect = slow_retrieve
+            with patch.object(self.client, "_client", sc):
+                await asyncio.gather(
+                    self.client.get_customer("cus_1"), self.client.get_customer("cus_2")
+                )
+            return self.client._concurrency()
+
+        with patch.dict("os.environ", {"STRIPE_MAX_CONCURRENT": "1"}):
+            first = asyncio.run(contended_retrieves())
+            second = asyncio.run(contended_retrieves())
+        assert first is not second
+
+    async def test_concurrency_limit_default(self):
+        with patch.dict("os.environ", {"STRIPE_MAX_CONCURRENT": "lots"}):
+            sem = self.client._concurrency()
+        assert sem._value == _StripeClient._DEFAULT_MAX_CONCURRENT
+
+    async def test_concurrency_limit_bounds_in_flight_calls(self):
+        in_flight = 0
+        peak = 0
+
+        async def slow_retrieve(customer_id):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return _customer(id=customer_id)
+
+        sc = AsyncMock()
+        sc.customers.retrieve_async.side_effect = slow_retrieve
+        with (
+            patch.dict("os.environ", {"STRIPE_MAX_CONCURRENT": "2"}),
+            patch.object(self.client, "_client", sc),
+        ):
+            await asyncio.gather(*(self.client.get_customer(f"cus_{i}") for i in range(6)))
+        assert peak == 2
+
+    async def test_rate_limit_error_retried_after_retry_after(self):
+        sc = AsyncMock()
+        sc.customers.retrieve_async.side_effect = [
+            stripe.RateLimitError("Too many requests", headers={"retry-after": "2"}),
+            _customer(),
+        ]
+        with (
+            patch.object(self.client, "_client", sc),
+            patch(
+                "aden_tools.tools.stripe_tool.stripe_tool.asyncio.sleep", new_callable=AsyncMock
+            ) as mock_sleep,
+        ):
+            result = await self.client.get_customer("cus_test123")
+        mock_sleep.assert_called_once_with(2.0)
+        assert sc.customers.retrieve_async.call_count == 2
+        assert result["id"] == "cus_test123"
+
+    async def test_rate_limit_mid_scan_retried_keeps_rows(self):
+        sc = AsyncMock()
+        sc.customers.list_async.side_effect = [
+            _make_stripe_list([_customer(id="cus_0")], has_more=True),
+            stripe.RateLimitError("Too many requests", headers={"retry-after": "1"}),
+            _make_stripe_list([_customer(id="cus_1")]),
+        ]
+        with (
+            patch.object(self.client, "_client", sc),
+            patch("aden_tools.tools.stripe_tool.stripe_tool.asyncio.sleep", new_callable=AsyncMock),
+        ):
+            result = await self.client.list_customers(limit=10, auto_paginate=True)
+        assert [c["id"] for c in result["customers"]] == ["cus_0", "cus_1"]
+
+    async def test_rate_limit_error_raised_when_not_retryable(self):
+        sc = AsyncMock()
+        sc.customers.retrieve_async.side_effect = stripe.RateLimitError(
+            "Too many requests", headers={"stripe-should-retry": "false"}
+        )
+        with patch.object(self.client, "_client", sc), pytest.raises(stripe.RateLimitError):
+            await self.client.get_customer("cus_test123")
+        assert sc.customers.retrieve_async.call_count == 1
+
+    async def test_rate_limit_error_raised_after_retries(self):
+        sc = AsyncMock()
+        sc.customers.retrieve_async.side_effect = stripe.RateLimitError("Too many requests")
+        with (
+            patch.object(self.client, "_client", sc),
+            patch("aden_tools.tools.stripe_tool.stripe_tool.asyncio.sleep", new_callable=AsyncMock),
+            pytest.raises(stripe.RateLimitError),
+        ):
+            await self.client.get_customer("cus_test123")
+        assert sc.customers.retrieve_async.call_count == _StripeClient._RATE_LIMIT_RETRIES + 1
+
+
 # ---------------------------------------------------------------------------
 # MCP tool registration and credential tests
 # ---------------------------------------------------------------------------
@@ -1089,9 +1905,17 @@ def test_register_tools_registers_all_tools(self):
         mcp = MagicMock()
         mcp.tool.return_value = lambda fn: fn
         register_tools(mcp)
-        assert mcp.tool.call_count == 51
+        assert mcp.tool.call_count == 57
 
-    def test_no_credentials_returns_error(self):
+    async def test_tool_schemas_omit_injected_client(self):
+        mcp = FastMCP("test")
+        register_tools(mcp)
+        tools = await mcp.get_tools()
+        assert all("client" not in t.parameters["properties"] for t in tools.values())
+        assert set(tools["stripe_get_customer"].parameters["properties"]) == {"customer_id"}
+        assert "charge_amount_refunded" not in tools["stripe_list_refunds"].parameters["properties"]
+
+    async def test_no_credentials_returns_error(self):
         mcp = MagicMock()
         registered_fns = []
         mcp.tool.return_value = lambda fn: registered_fns.append(fn) or fn
@@ -1099,12 +1923,12 @@ def test_no_credentials_returns_error(self):
         with patch.dict("os.environ", {}, clear=True):
             register_tools(mcp, credentials=None)
             list_fn = next(f for f in registered_fns if f.__name__ == "stripe_list_customers")
-            result = list_fn()
+            result = await list_fn()
 
         assert "error" in result
         assert "not configured" in result["error"]
 
-    def test_credentials_from_credential_manager(self):
+    async def test_credentials_from_credential_manager(self):
         mcp = MagicMock()
         registered_fns = []
         mcp.tool.return_value = lambda fn: registered_fns.append(fn) or fn
@@ -1116,15 +1940,39 @@ def test_credentials_from_credential_manager(self):
 
         fn = next(f for f in registered_fns if f.__name__ == "stripe_get_balance")
 
-        with patch("aden_tools.tools.stripe_tool.stripe_tool._StripeClient") as MockClient:
+        with patch(
+            "aden_tools.tools.stripe_tool.stripe_tool._StripeClient", autospec=True
+        ) as MockClient:
             instance = MockClient.return_value
             instance.get_balance.return_value = {"available": [], "pending": []}
-            fn()
+            await fn()
 
         MockClient.assert_called_once_with("sk_test_fromcredstore")
         cred_manager.get.assert_called_with("stripe")
 
-    def test_credentials_from_env_vars(self):
+    async def test_client_reused_across_calls_for_same_key(self):
+        mcp = MagicMock()
+        registered_fns = []
+        mcp.tool.return_value = lambda fn: registered_fns.append(fn) or fn
+
+        cred_manager = MagicMock()
+        cred_manager.get.side_effect = ["sk_test_a", "sk_test_a", "sk_test_b"]
+
+        register_tools(mcp, credentials=cred_manager)
+
+        fn = next(f for f in registered_fns if f.__name__ == "stripe_get_balance")
+
+        with patch(
+            "aden_tools.tools.stripe_tool.stripe_tool._StripeClient", autospec=True
+        ) as MockClient:
+            MockClient.return_value.get_balance.return_value = {"available": [], "pending": []}
+            await fn()
+            await fn()
+            await fn()
+
+        assert [c.args for c in MockClient.call_args_list] == [("sk_test_a",), ("sk_test_b",)]
+
+    async def test_credentials_from_env_vars(self):
         mcp = MagicMock()
         registered_fns = []
         mcp.tool.return_value = lambda fn: registered_fns.append(fn) or fn
@@ -1135,15 +1983,17 @@ def test_credentials_from_env_vars(self):
 
         with (
             patch.dict("os.environ", {"STRIPE_API_KEY": "sk_test_fromenv"}),
-            patch("aden_tools.tools.stripe_tool.stripe_tool._StripeClient") as MockClient,
+            patch(
+                "aden_tools.tools.stripe_tool.stripe_tool._StripeClient", autospec=True
+            ) as MockClient,
         ):
             instance = MockClient.return_value
             instance.get_balance.return_value = {"available": [], "pending": []}
-            fn()
+            await fn()
 
         MockClient.assert_called_once_with("sk_test_fromenv")
 
-    def test_stripe_error_is_caught(self):
+    async def test_stripe_error_is_caught(self):
         mcp = MagicMock()
         registered_fns = []
         mcp.tool.return_value = lambda fn: registered_fns.append(fn) or fn
@@ -1155,13 +2005,34 @@ def test_stripe_error_is_caught(self):
 
         fn = next(f for f in registered_fns if f.__name__ == "stripe_get_balance")
 
-        with patch("aden_tools.tools.stripe_tool.stripe_tool._StripeClient") as MockClient:
+        with patch(
+            "aden_tools.tools.stripe_tool.stripe_tool._StripeClient", autospec=True
+        ) as MockClient:
             instance = MockClient.return_value
             instance.get_balance.side_effect = stripe.AuthenticationError("Invalid API key")
-            result = fn()
+            result = await fn()
 
         assert "error" in result
 
+    async def test_stripe_error_includes_code_and_status(self):
+        fns = _setup_tools()
+        with patch(
+            "aden_tools.tools.stripe_tool.stripe_tool._StripeClient", autospec=True
+        ) as MockClient:
+            MockClient.return_value.get_customer.side_effect = stripe.InvalidRequestError(
+                "No such customer: 'cus_test123'",
+                "id",
+                code="resource_missing",
+                http_status=404,
+            )
+            result = await fns["stripe_get_customer"](customer_id="cus_test123")
+
+        assert result == {
+            "error": "No such customer: 'cus_test123'",
+            "code": "resource_missing",
+            "http_status": 404,
+        }
+
 
 # ---------------------------------------------------------------------------
 # Individual MCP tool validation tests
@@ -1184,114 +2055,168 @@ class TestCustomerToolValidation:
     def setup_method(self):
         self.fns = _setup_tools()
 
-    def test_get_customer_invalid_id(self):
-        result = self.fns["stripe_get_customer"](customer_id="not_a_customer")
+    async def test_get_customer_invalid_id(self):
+        result = await self.fns["stripe_get_customer"](customer_id="not_a_customer")
         assert "error" in result
         assert "cus_" in result["error"]
 
-    def test_update_customer_invalid_id(self):
-        result = self.fns["stripe_update_customer"](customer_id="bad_id")
+    async def test_update_customer_invalid_id(self):
+        result = await self.fns["stripe_update_customer"](customer_id="bad_id")
         assert "error" in result
         assert "cus_" in result["error"]
 
-    def test_get_customer_by_email_invalid(self):
-        result = self.fns["stripe_get_customer_by_email"](email="notanemail")
+    async def test_get_customer_overview_invalid_id(self):
+        result = await self.fns["stripe_get_customer_overview"](customer_id="bad_id")
+        assert "error" in result
+        assert "cus_" in result["error"]
+
+    async def test_get_customer_by_email_invalid(self):
+        result = await self.fns["stripe_get_customer_by_email"](email="notanemail")
         assert "error" in result
 
-    def test_list_customers_success(self):
-        with patch("aden_tools.tools.stripe_tool.stripe_tool._StripeClient") as MockClient:
+    async def test_list_customers_success(self):
+        with patch(
+            "aden_tools.tools.stripe_tool.stripe_tool._StripeClient", autospec=True
+        ) as MockClient:
             MockClient.return_value.list_customers.return_value = {
                 "has_more": False,
                 "customers": [],
             }
-            result = self.fns["stripe_list_customers"](limit=5)
+            result = await self.fns["stripe_list_customers"](limit=5)
         assert "customers" in result
 
-    def test_create_customer_success(self):
-        with patch("aden_tools.tools.stripe_tool.stripe_tool._StripeClient") as MockClient:
+    async def test_create_customer_success(self):
+        with patch(
+            "aden_tools.tools.stripe_tool.stripe_tool._StripeClient", autospec=True
+        ) as MockClient:
             MockClient.return_value.create_customer.return_value = {
                 "id": "cus_new",
                 "email": "new@example.com",
             }
-            result = self.fns["stripe_create_customer"](email="new@example.com")
+            result = await self.fns["stripe_create_customer"](email="new@example.com")
         assert result["id"] == "cus_new"
 
+    async def test_create_customer_forwards_idempotency_key(self):
+        with patch(
+            "aden_tools.tools.stripe_tool.stripe_tool._StripeClient", autospec=True
+        ) as MockClient:
+            MockClient.return_value.create_customer.return_value = {"id": "cus_new"}
+            await self.fns["stripe_create_customer"](
+                email="new@example.com", idempotency_key="retry-1"
+            )
+        assert (
+            MockClient.return_value.create_customer.call_args.kwargs["idempotency_key"] == "retry-1"
+        )
+
 
 class TestSubscriptionToolValidation:
     def setup_method(self):
         self.fns = _setup_tools()
 
-    def test_get_subscription_invalid_id(self):
-        result = self.fns["stripe_get_subscription"](subscription_id="not_a_sub")
+    async def test_get_subscription_invalid_id(self):
+        result = await self.fns["stripe_get_subscription"](subscription_id="not_a_sub")
         assert "error" in result
         assert "sub_" in result["error"]
 
-    def test_get_subscription_status_invalid_customer(self):
-        result = self.fns["stripe_get_subscription_status"](customer_id="bad_id")
+    async def test_get_subscription_status_invalid_customer(self):
+        result = await self.fns["stripe_get_subscription_status"](customer_id="bad_id")
         assert "error" in result
         assert "cus_" in result["error"]
 
-    def test_create_subscription_invalid_customer(self):
-        result = self.fns["stripe_create_subscription"](customer_id="bad", price_id="price_test123")
+    async def test_create_subscription_invalid_customer(self):
+        result = await self.fns["stripe_create_subscription"](
+            customer_id="bad", price_id="price_test123"
+        )
         assert "error" in result
         assert "cus_" in result["error"]
 
-    def test_create_subscription_invalid_price(self):
-        result = self.fns["stripe_create_subscription"](
+    async def test_create_subscription_invalid_price(self):
+        result = await self.fns["stripe_create_subscription"](
             customer_id="cus_test123", price_id="bad_price"
         )
         assert "error" in result
         assert "price_" in result["error"]
 
-    def test_create_subscription_invalid_quantity(self):
-        result = self.fns["stripe_create_subscription"](
+    async def test_create_subscription_invalid_quantity(self):
+        result = await self.fns["stripe_create_subscription"](
             customer_id="cus_test123", price_id="price_test123", quantity=0
         )
         assert "error" in result
         assert "Quantity" in result["error"]
 
-    def test_update_subscription_invalid_id(self):
-        result = self.fns["stripe_update_subscription"](subscription_id="bad_id")
+    async def test_update_subscription_invalid_id(self):
+        result = await self.fns["stripe_update_subscription"](subscription_id="bad_id")
         assert "error" in result
         assert "sub_" in result["error"]
 
-    def test_cancel_subscription_invalid_id(self):
-        result = self.fns["stripe_cancel_subscription"](subscription_id="bad_id")
+    async def test_update_subscription_invalid_item_id(self):
+        result = await self.fns["stripe_update_subscription"](
+            subscription_id="sub_test123", quantity=2, subscription_item_id="bad_id"
+        )
+        assert "error" in result
+        assert "si_" in result["error"]
+
+    async def test_cancel_subscription_invalid_id(self):
+        result = await self.fns["stripe_cancel_subscription"](subscription_id="bad_id")
         assert "error" in result
         assert "sub_" in result["error"]
 
+    async def test_list_all_subscriptions_invalid_max_results(self):
+        result = await self.fns["stripe_list_all_subscriptions"](max_results=0)
+        assert "error" in result
+        assert "max_results" in result["error"]
+
+    async def test_list_all_subscriptions_max_results_capped(self):
+        result = await self.fns["stripe_list_all_subscriptions"](max_results=1001)
+        assert "max_results" in result["error"]
+
+    async def test_list_subscriptions_auto_paginate_limit_capped(self):
+        result = await self.fns["stripe_list_subscriptions"](limit=10**6, auto_paginate=True)
+        assert "auto_paginate" in result["error"]
+
 
 class TestPaymentIntentToolValidation:
     def setup_method(self):
         self.fns = _setup_tools()
 
-    def test_create_payment_intent_zero_amount(self):
-        result = self.fns["stripe_create_payment_intent"](amount=0, currency="usd")
+    async def test_create_payment_intent_zero_amount(self):
+        result = await self.fns["stripe_create_payment_intent"](amount=0, currency="usd")
         assert "error" in result
         assert "positive" in result["error"]
 
-    def test_create_payment_intent_negative_amount(self):
-        result = self.fns["stripe_create_payment_intent"](amount=-100, currency="usd")
+    async def test_create_payment_intent_negative_amount(self):
+        result = await self.fns["stripe_create_payment_intent"](amount=-100, currency="usd")
         assert "error" in result
         assert "positive" in result["error"]
 
-    def test_create_payment_intent_invalid_currency(self):
-        result = self.fns["stripe_create_payment_intent"](amount=2000, currency="INVALID")
+    async def test_create_payment_intent_invalid_currency(self):
+        result = await self.fns["stripe_create_payment_intent"](amount=2000, currency="INVALID")
         assert "error" in result
         assert "3-letter" in result["error"]
 
-    def test_get_payment_intent_invalid_id(self):
-        result = self.fns["stripe_get_payment_intent"](payment_intent_id="bad_id")
+    async def test_create_payment_intent_unknown_currency(self):
+        result = await self.fns["stripe_create_payment_intent"](amount=2000, currency="zzz")
+        assert "ISO 4217" in result["error"]
+
+    async def test_create_payment_intent_currency_lowercased(self):
+        with patch.object(
+            _StripeClient, "create_payment_intent", AsyncMock(return_value={})
+        ) as create:
+            await self.fns["stripe_create_payment_intent"](amount=2000, currency="USD")
+        assert create.call_args[0][1] == "usd"
+
+    async def test_get_payment_intent_invalid_id(self):
+        result = await self.fns["stripe_get_payment_intent"](payment_intent_id="bad_id")
         assert "error" in result
         assert "pi_" in result["error"]
 
-    def test_confirm_payment_intent_invalid_id(self):
-        result = self.fns["stripe_confirm_payment_intent"](payment_intent_id="bad_id")
+    async def test_confirm_payment_intent_invalid_id(self):
+        result = await self.fns["stripe_confirm_payment_intent"](payment_intent_id="bad_id")
         assert "error" in result
         assert "pi_" in result["error"]
 
-    def test_cancel_payment_intent_invalid_id(self):
-        result = self.fns["stripe_cancel_payment_intent"](payment_intent_id="bad_id")
+    async def test_cancel_payment_intent_invalid_id(self):
+        result = await self.fns["stripe_cancel_payment_intent"](payment_intent_id="bad_id")
         assert "error" in result
         assert "pi_" in result["error"]
 
@@ -1300,18 +2225,18 @@ class TestChargeToolValidation:
     def setup_method(self):
         self.fns = _setup_tools()
 
-    def test_get_charge_invalid_id(self):
-        result = self.fns["stripe_get_charge"](charge_id="bad_id")
+    async def test_get_charge_invalid_id(self):
+        result = await self.fns["stripe_get_charge"](charge_id="bad_id")
         assert "error" in result
         assert "ch_" in result["error"]
 
-    def test_capture_charge_invalid_id(self):
-        result = self.fns["stripe_capture_charge"](charge_id="bad_id")
+    async def test_capture_charge_invalid_id(self):
+        result = await self.fns["stripe_capture_charge"](charge_id="bad_id")
         assert "error" in result
         assert "ch_" in result["error"]
 
-    def test_capture_charge_negative_amount(self):
-        result = self.fns["stripe_capture_charge"](charge_id="ch_test123", amount=-100)
+    async def test_capture_charge_negative_amount(self):
+        result = await self.fns["stripe_capture_charge"](charge_id="ch_test123", amount=-100)
         assert "error" in result
         assert "positive" in result["error"]
 
@@ -1320,18 +2245,18 @@ class TestRefundToolValidation:
     def setup_method(self):
         self.fns = _setup_tools()
 
-    def test_create_refund_no_identifiers(self):
-        result = self.fns["stripe_create_refund"]()
+    async def test_create_refund_no_identifiers(self):
+        result = await self.fns["stripe_create_refund"]()
         assert "error" in result
         assert "charge_id" in result["error"]
 
-    def test_create_refund_negative_amount(self):
-        result = self.fns["stripe_create_refund"](charge_id="ch_test123", amount=-100)
+    async def test_create_refund_negative_amount(self):
+        result = await self.fns["stripe_create_refund"](charge_id="ch_test123", amount=-100)
         assert "error" in result
         assert "positive" in result["error"]
 
-    def test_get_refund_invalid_id(self):
-        result = self.fns["stripe_get_refund"](refund_id="bad_id")
+    async def test_get_refund_invalid_id(self):
+        result = await self.fns["stripe_get_refund"](refund_id="bad_id")
         assert "error" in result
         assert "re_" in result["error"]
 
@@ -1340,28 +2265,28 @@ class TestInvoiceToolValidation:
     def setup_method(self):
         self.fns = _setup_tools()
 
-    def test_get_invoice_invalid_id(self):
-        result = self.fns["stripe_get_invoice"](invoice_id="bad_id")
+    async def test_get_invoice_invalid_id(self):
+        result = await self.fns["stripe_get_invoice"](invoice_id="bad_id")
         assert "error" in result
         assert "in_" in result["error"]
 
-    def test_create_invoice_invalid_customer(self):
-        result = self.fns["stripe_create_invoice"](customer_id="bad_id")
+    async def test_create_invoice_invalid_customer(self):
+        result = await self.fns["stripe_create_invoice"](customer_id="bad_id")
         assert "error" in result
         assert "cus_" in result["error"]
 
-    def test_finalize_invoice_invalid_id(self):
-        result = self.fns["stripe_finalize_invoice"](invoice_id="bad_id")
+    async def test_finalize_invoice_invalid_id(self):
+        result = await self.fns["stripe_finalize_invoice"](invoice_id="bad_id")
         assert "error" in result
         assert "in_" in result["error"]
 
-    def test_pay_invoice_invalid_id(self):
-        result = self.fns["stripe_pay_invoice"](invoice_id="bad_id")
+    async def test_pay_invoice_invalid_id(self):
+        result = await self.fns["stripe_pay_invoice"](invoice_id="bad_id")
         assert "error" in result
         assert "in_" in result["error"]
 
-    def test_void_invoice_invalid_id(self):
-        result = self.fns["stripe_void_invoice"](invoice_id="bad_id")
+    async def test_void_invoice_invalid_id(self):
+        result = await self.fns["stripe_void_invoice"](invoice_id="bad_id")
         assert "error" in result
         assert "in_" in result["error"]
 
@@ -1370,28 +2295,30 @@ class TestInvoiceItemToolValidation:
     def setup_method(self):
         self.fns = _setup_tools()
 
-    def test_create_invoice_item_invalid_customer(self):
-        result = self.fns["stripe_create_invoice_item"](
+    async def test_create_invoice_item_invalid_customer(self):
+        result = await self.fns["stripe_create_invoice_item"](
             customer_id="bad", amount=1000, currency="usd"
         )
         assert "error" in result
         assert "cus_" in result["error"]
 
-    def test_create_invoice_item_zero_amount(self):
-        result = self.fns["stripe_create_invoice_item"](
+    async def test_create_invoice_item_zero_amount(self):
+        result = await self.fns["stripe_create_invoice_item"](
             customer_id="cus_test123", amount=0, currency="usd"
         )
         assert "error" in result
         assert "non-zero" in result["error"]
 
-    def test_create_invoice_item_negative_amount_allowed(self):
-        with patch("aden_tools.tools.stripe_tool.stripe_tool._StripeClient") as MockClient:
+    async def test_create_invoice_item_negative_amount_allowed(self):
+        with patch(
+            "aden_tools.tools.stripe_tool.stripe_tool._StripeClient", autospec=True
+        ) as MockClient:
             MockClient.return_value.create_invoice_item.return_value = {
                 "id": "ii_credit",
                 "amount": -500,
                 "currency": "usd",
             }
-            result = self.fns["stripe_create_invoice_item"](
+            result = await self.fns["stripe_create_invoice_item"](
                 customer_id="cus_test123",
                 amount=-500,
                 currency="usd",
@@ -1399,15 +2326,15 @@ def test_create_invoice_item_negative_amount_allowed(self):
             )
         assert result["id"] == "ii_credit"
 
-    def test_create_invoice_item_invalid_currency(self):
-        result = self.fns["stripe_create_invoice_item"](
+    async def test_create_invoice_item_invalid_currency(self):
+        result = await self.fns["stripe_create_invoice_item"](
             customer_id="cus_test123", amount=1000, currency="INVALID"
         )
         assert "error" in result
         assert "3-letter" in result["error"]
 
-    def test_delete_invoice_item_invalid_id(self):
-        result = self.fns["stripe_delete_invoice_item"](invoice_item_id="bad_id")
+    async def test_delete_invoice_item_invalid_id(self):
+        result = await self.fns["stripe_delete_invoice_item"](invoice_item_id="bad_id")
         assert "error" in result
         assert "ii_" in result["error"]
 
@@ -1416,18 +2343,28 @@ class TestProductToolValidation:
     def setup_method(self):
         self.fns = _setup_tools()
 
-    def test_get_product_invalid_id(self):
-        result = self.fns["stripe_get_product"](product_id="bad_id")
+    async def test_get_product_invalid_id(self):
+        result = await self.fns["stripe_get_product"](product_id="bad_id")
         assert "error" in result
         assert "prod_" in result["error"]
 
-    def test_update_product_invalid_id(self):
-        result = self.fns["stripe_update_product"](product_id="bad_id")
+    async def test_get_products_bulk_invalid_id(self):
+        result = await self.fns["stripe_get_products_bulk"](product_ids=["prod_ok", "bad_id"])
+        assert "prod_" in result["error"]
+
+    async def test_get_products_bulk_too_many_ids(self):
+        result = await self.fns["stripe_get_products_bulk"](
+            product_ids=[f"prod_{i}" for i in range(101)]
+        )
+        assert "between 1 and 100" in result["error"]
+
+    async def test_update_product_invalid_id(self):
+        result = await self.fns["stripe_update_product"](product_id="bad_id")
         assert "error" in result
         assert "prod_" in result["error"]
 
-    def test_create_product_missing_name(self):
-        result = self.fns["stripe_create_product"](name="")
+    async def test_create_product_missing_name(self):
+        result = await self.fns["stripe_create_product"](name="")
         assert "error" in result
         assert "name" in result["error"]
 
@@ -1436,32 +2373,32 @@ class TestPriceToolValidation:
     def setup_method(self):
         self.fns = _setup_tools()
 
-    def test_get_price_invalid_id(self):
-        result = self.fns["stripe_get_price"](price_id="bad_id")
+    async def test_get_price_invalid_id(self):
+        result = await self.fns["stripe_get_price"](price_id="bad_id")
         assert "error" in result
         assert "price_" in result["error"]
 
-    def test_update_price_invalid_id(self):
-        result = self.fns["stripe_update_price"](price_id="bad_id")
+    async def test_update_price_invalid_id(self):
+        result = await self.fns["stripe_update_price"](price_id="bad_id")
         assert "error" in result
         assert "price_" in result["error"]
 
-    def test_create_price_zero_amount(self):
-        result = self.fns["stripe_create_price"](
+    async def test_create_price_zero_amount(self):
+        result = await self.fns["stripe_create_price"](
             unit_amount=0, currency="usd", product_id="prod_test123"
         )
         assert "error" in result
         assert "positive" in result["error"]
 
-    def test_create_price_invalid_currency(self):
-        result = self.fns["stripe_create_price"](
+    async def test_create_price_invalid_currency(self):
+        result = await self.fns["stripe_create_price"](
             unit_amount=999, currency="INVALID", product_id="prod_test123"
         )
         assert "error" in result
         assert "3-letter" in result["error"]
 
-    def test_create_price_invalid_product(self):
-        result = self.fns["stripe_create_price"](
+    async def test_create_price_invalid_product(self):
+        result = await self.fns["stripe_create_price"](
             unit_amount=999, currency="usd", product_id="bad_id"
         )
         assert "error" in result
@@ -1472,18 +2409,18 @@ class TestPaymentLinkToolValidation:
     def setup_method(self):
         self.fns = _setup_tools()
 
-    def test_create_payment_link_invalid_price(self):
-        result = self.fns["stripe_create_payment_link"](price_id="bad_id")
+    async def test_create_payment_link_invalid_price(self):
+        result = await self.fns["stripe_create_payment_link"](price_id="bad_id")
         assert "error" in result
         assert "price_" in result["error"]
 
-    def test_create_payment_link_zero_quantity(self):
-        result = self.fns["stripe_create_payment_link"](price_id="price_test123", quantity=0)
+    async def test_create_payment_link_zero_quantity(self):
+        result = await self.fns["stripe_create_payment_link"](price_id="price_test123", quantity=0)
         assert "error" in result
         assert "Quantity" in result["error"]
 
-    def test_get_payment_link_invalid_id(self):
-        result = self.fns["stripe_get_payment_link"](payment_link_id="bad_id")
+    async def test_get_payment_link_invalid_id(self):
+        result = await self.fns["stripe_get_payment_link"](payment_link_id="bad_id")
         assert "error" in result
         assert "plink_" in result["error"]
 
@@ -1492,33 +2429,35 @@ class TestCouponToolValidation:
     def setup_method(self):
         self.fns = _setup_tools()
 
-    def test_create_coupon_no_discount(self):
-        result = self.fns["stripe_create_coupon"](duration="once")
+    async def test_create_coupon_no_discount(self):
+        result = await self.fns["stripe_create_coupon"](duration="once")
         assert "error" in result
         assert "percent_off" in result["error"]
 
-    def test_create_coupon_both_discount_types(self):
-        result = self.fns["stripe_create_coupon"](percent_off=20.0, amount_off=500, duration="once")
+    async def test_create_coupon_both_discount_types(self):
+        result = await self.fns["stripe_create_coupon"](
+            percent_off=20.0, amount_off=500, duration="once"
+        )
         assert "error" in result
         assert "one of" in result["error"]
 
-    def test_create_coupon_amount_off_missing_currency(self):
-        result = self.fns["stripe_create_coupon"](amount_off=500, duration="once")
+    async def test_create_coupon_amount_off_missing_currency(self):
+        result = await self.fns["stripe_create_coupon"](amount_off=500, duration="once")
         assert "error" in result
         assert "currency" in result["error"]
 
-    def test_create_coupon_invalid_duration(self):
-        result = self.fns["stripe_create_coupon"](percent_off=20.0, duration="invalid")
+    async def test_create_coupon_invalid_duration(self):
+        result = await self.fns["stripe_create_coupon"](percent_off=20.0, duration="invalid")
         assert "error" in result
         assert "duration" in result["error"]
 
-    def test_create_coupon_repeating_missing_months(self):
-        result = self.fns["stripe_create_coupon"](percent_off=20.0, duration="repeating")
+    async def test_create_coupon_repeating_missing_months(self):
+        result = await self.fns["stripe_create_coupon"](percent_off=20.0, duration="repeating")
         assert "error" in result
         assert "duration_in_months" in result["error"]
 
-    def test_delete_coupon_missing_id(self):
-        result = self.fns["stripe_delete_coupon"](coupon_id="")
+    async def test_delete_coupon_missing_id(self):
+        result = await self.fns["stripe_delete_coupon"](coupon_id="")
         assert "error" in result
         assert "coupon_id" in result["error"]
 
@@ -1527,22 +2466,61 @@ class TestPaymentMethodToolValidation:
     def setup_method(self):
         self.fns = _setup_tools()
 
-    def test_list_payment_methods_invalid_customer(self):
-        result = self.fns["stripe_list_payment_methods"](customer_id="bad_id")
+    async def test_list_payment_methods_invalid_customer(self):
+        result = await self.fns["stripe_list_payment_methods"](customer_id="bad_id")
         assert "error" in result
         assert "cus_" in result["error"]
 
-    def test_get_payment_method_invalid_id(self):
-        result = self.fns["stripe_get_payment_method"](payment_method_id="bad_id")
+    async def test_get_payment_method_invalid_id(self):
+        result = await self.fns["stripe_get_payment_method"](payment_method_id="bad_id")
         assert "error" in result
         assert "pm_" in result["error"]
 
-    def test_detach_payment_method_invalid_id(self):
-        result = self.fns["stripe_detach_payment_method"](payment_method_id="bad_id")
+    async def test_detach_payment_method_invalid_id(self):
+        result = await self.fns["stripe_detach_payment_method"](payment_method_id="bad_id")
         assert "error" in result
         assert "pm_" in result["error"]
 
 
+class TestWebhookIngestTool:
+    def setup_method(self):
+        self.fns = _setup_tools()
+
+    def _signed(self, payload: str, secret: str = "whsec_test") -> str:
+        timestamp = int(time.time())
+        digest = hmac.new(
+            secret.encode(), f"{timestamp}.{payload}".encode(), hashlib.sha256
+        ).hexdigest()
+        return f"t={timestamp},v1={digest}"
+
+    async def test_verified_event_invalidates_cache(self):
+        payload = json.dumps(
+            {
+                "id": "evt_1",
+                "object": "event",
+                "type": "product.updated",
+                "data": {"object": {"id": "prod_test123", "object": "product"}},
+            }
+        )
+        with (
+            patch.dict("os.environ", {"STRIPE_WEBHOOK_SECRET": "whsec_test"}),
+            patch.object(_StripeClient, "_product_cache") as cache,
+        ):
+            result = await self.fns["stripe_webhook_ingest"](payload, self._signed(payload))
+        cache.pop.assert_called_once_with("prod_test123")
+        assert result == {"id": "evt_1", "type": "product.updated", "invalidated": True}
+
+    async def test_bad_signature(self):
+        with patch.dict("os.environ", {"STRIPE_WEBHOOK_SECRET": "whsec_test"}):
+            result = await self.fns["stripe_webhook_ingest"]("{}", "t=1,v1=bad")
+        assert "error" in result
+
+    async def test_missing_secret(self):
+        with patch.dict("os.environ", {}, clear=True):
+            result = await self.fns["stripe_webhook_ingest"]("{}", "t=1,v1=bad")
+        assert "not configured" in result["error"]
+
+
 # ---------------------------------------------------------------------------
 # Stripe error propagation across tool categories
 # ---------------------------------------------------------------------------
@@ -1564,14 +2542,16 @@ def test_detach_payment_method_invalid_id(self):
         ("stripe_get_balance", {}),
     ],
 )
-def test_stripe_error_propagation(tool_name, kwargs):
+async def test_stripe_error_propagation(tool_name, kwargs):
     fns = _setup_tools()
-    with patch("aden_tools.tools.stripe_tool.stripe_tool._StripeClient") as MockClient:
+    with patch(
+        "aden_tools.tools.stripe_tool.stripe_tool._StripeClient", autospec=True
+    ) as MockClient:
         method_name = tool_name.replace("stripe_", "")
         getattr(MockClient.return_value, method_name).side_effect = stripe.APIConnectionError(
             "Network error"
         )
-        result = fns[tool_name](**kwargs)
+        result = await fns[tool_name](**kwargs)
     assert "error" in result
 
 
@@ -1596,7 +2576,7 @@ def test_stripe_spec_tool_count(self):
         from aden_tools.credentials import CREDENTIAL_SPECS
 
         spec = CREDENTIAL_SPECS["stripe"]
-        assert len(spec.tools) == 51
+        assert len(spec.tools) == 57
 
     def test_stripe_spec_tools_include_core_methods(self):
         from aden_tools.credentials import CREDENTIAL_SPECS
@@ -1611,6 +2591,7 @@ def test_stripe_spec_tools_include_core_methods(self):
             "stripe_get_subscription",
             "stripe_get_subscription_status",
             "stripe_list_subscriptions",
+            "stripe_list_all_subscriptions",
             "stripe_create_subscription",
             "stripe_update_subscription",
             "stripe_cancel_subscription",